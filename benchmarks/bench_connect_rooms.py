@@ -0,0 +1,101 @@
+"""
+Benchmark für Dungeon._connect_rooms: Skalierung von 20 bis 10.000 Räumen.
+
+Vergleicht den dünnen Kandidatengraphen (k nächste Nachbarn) mit dem früheren
+Ansatz über alle Raumpaare. Läuft ohne Pygame:
+
+    python -m benchmarks.bench_connect_rooms
+"""
+import argparse
+import heapq
+import logging
+import math
+import random
+import time
+
+from dungeon.dungeon import Dungeon
+from dungeon.room import Room
+from dungeon.room_graph import nearest_neighbour_edges
+
+ROOM_COUNTS = [20, 100, 1000, 5000, 10000]
+ALL_PAIRS_LIMIT = 2000  # Darüber wird der quadratische Referenzlauf übersprungen
+SPACING = 6
+
+
+def build_dungeon(room_count, seed=0):
+    """Erzeugt ein Dungeon mit `room_count` leicht verschobenen 3x3-Räumen auf einem Gitter."""
+    rng = random.Random(seed)
+    per_row = math.ceil(math.sqrt(room_count))
+    size = per_row * SPACING + 2
+    dungeon = Dungeon(size, size, room_count, room_count, (3, 3))
+    for index in range(room_count):
+        gx, gy = index % per_row, index // per_row
+        dungeon.rooms.append(Room(1 + gx * SPACING + rng.randint(0, 2), 1 + gy * SPACING + rng.randint(0, 2), 3, 3))
+    return dungeon
+
+
+def all_pairs_mst(centers):
+    """Referenz: MST über alle n²/2 Raumpaare (bisheriges Verfahren)."""
+    edges = []
+    for i in range(len(centers)):
+        for j in range(i + 1, len(centers)):
+            dist = abs(centers[i][0] - centers[j][0]) + abs(centers[i][1] - centers[j][1])
+            heapq.heappush(edges, (dist, i, j))
+
+    parent = list(range(len(centers)))
+
+    def find(v):
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    mst = []
+    while edges and len(mst) < len(centers) - 1:
+        _, i, j = heapq.heappop(edges)
+        if find(i) != find(j):
+            parent[find(j)] = find(i)
+            mst.append((i, j))
+    return mst
+
+
+def run(room_counts, repeat):
+    print(f"{'rooms':>7} {'candidates':>11} {'knn edges':>10} {'connect':>10} {'all pairs':>10}")
+    for room_count in room_counts:
+        dungeon = build_dungeon(room_count)
+        centers = [room.center() for room in dungeon.rooms]
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            edges = nearest_neighbour_edges(centers)
+        knn_time = (time.perf_counter() - start) / repeat
+
+        connect_time = math.inf
+        for _ in range(repeat):
+            dungeon = build_dungeon(room_count)
+            start = time.perf_counter()
+            dungeon._connect_rooms()
+            connect_time = min(connect_time, time.perf_counter() - start)
+
+        if room_count <= ALL_PAIRS_LIMIT:
+            start = time.perf_counter()
+            all_pairs_mst(centers)
+            all_pairs = f"{(time.perf_counter() - start) * 1000:9.1f}ms"
+        else:
+            all_pairs = f"{'-':>11}"
+
+        print(f"{room_count:>7} {len(edges):>11} {knn_time * 1000:8.1f}ms {connect_time * 1000:8.1f}ms {all_pairs}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rooms", type=int, nargs="+", default=ROOM_COUNTS, help="Zu messende Raumanzahlen")
+    parser.add_argument("--repeat", type=int, default=3, help="Wiederholungen pro Messpunkt")
+    args = parser.parse_args()
+
+    logging.getLogger("DungeonGame").setLevel(logging.WARNING)
+    run(args.rooms, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
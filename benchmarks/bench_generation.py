@@ -0,0 +1,180 @@
+"""
+Benchmark-Suite für die Dungeon-Generierung (läuft ohne Pygame).
+
+Misst für eine Matrix aus Kartengröße, Raumanzahl und Raumgröße:
+    generate          Dungeon.generate(start_level=True)
+    generate_next     Dungeon.generate_next_level(...)
+    connect_rooms     Dungeon._connect_rooms()
+    overlap_check     Dungeon._rooms_overlap_or_touch() (pro Aufruf)
+    corridor_create   Corridor.create() (pro Aufruf)
+
+Ausgabe: Median/p95 in Millisekunden und Spitzen-Speicher (tracemalloc) als JSON.
+Mit --baseline wird gegen eine gespeicherte Datei verglichen; Regressionen über
+--threshold führen zum Exit-Code 1.
+
+    python -m benchmarks.bench_generation --output results.json
+    python -m benchmarks.bench_generation --baseline results.json
+"""
+import argparse
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from dungeon.corridor import Corridor
+from dungeon.dungeon import Dungeon
+
+# Matrix: Name -> Dungeon-Parameter und Anzahl der Wiederholungen
+CASES = {
+    "75x75_r20": {"width": 75, "height": 75, "min_rooms": 15, "max_rooms": 20, "room_size_range": (8, 14), "repeat": 20},
+    "250x250_r120": {"width": 250, "height": 250, "min_rooms": 100, "max_rooms": 120, "room_size_range": (6, 12), "repeat": 10},
+    "500x500_r150_large": {"width": 500, "height": 500, "min_rooms": 120, "max_rooms": 150, "room_size_range": (15, 40), "repeat": 5},
+    "1000x1000_r1000": {"width": 1000, "height": 1000, "min_rooms": 800, "max_rooms": 1000, "room_size_range": (6, 16), "repeat": 3},
+    "2000x2000_r3000": {"width": 2000, "height": 2000, "min_rooms": 2500, "max_rooms": 3000, "room_size_range": (8, 24), "repeat": 2},
+}
+
+MICRO_CALLS = 1000  # Aufrufe pro Probe für overlap_check und corridor_create
+
+
+def percentile(samples, fraction):
+    """Einfaches Perzentil (nächster Rang) einer Messreihe."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples):
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "p95_ms": percentile(samples, 0.95) * 1000,
+        "samples": len(samples),
+    }
+
+
+def make_dungeon(case, seed, level_index=0):
+    params = {key: value for key, value in case.items() if key != "repeat"}
+    return Dungeon(**params, seed=seed, level_index=level_index)
+
+
+def bench_case(case):
+    """Führt alle Messungen für einen Matrix-Eintrag aus."""
+    timings = {name: [] for name in ("generate", "generate_next", "connect_rooms", "overlap_check", "corridor_create")}
+
+    for rep in range(case["repeat"]):
+        # Vollständige Generierung der Start-Ebene
+        dungeon = make_dungeon(case, seed=rep)
+        start = time.perf_counter()
+        dungeon.generate(start_level=True)
+        timings["generate"].append(time.perf_counter() - start)
+
+        # Folgeebene ab der Treppe der Start-Ebene
+        next_dungeon = make_dungeon(case, seed=rep, level_index=1)
+        start = time.perf_counter()
+        next_dungeon.generate_next_level(dungeon.get_staircase_up())
+        timings["generate_next"].append(time.perf_counter() - start)
+
+        # Nur das Verbinden der Räume (Räume platziert, aber noch nicht verbunden)
+        connect_dungeon = make_dungeon(case, seed=rep)
+        connect_dungeon._place_random_rooms(connect_dungeon.rng.randint(case["min_rooms"], case["max_rooms"]))
+        start = time.perf_counter()
+        connect_dungeon._connect_rooms()
+        timings["connect_rooms"].append(time.perf_counter() - start)
+
+        # Überlappungstest mit zufälligen Kandidaten gegen das fertige Raster
+        candidates = [dungeon._create_random_room() for _ in range(MICRO_CALLS)]
+        start = time.perf_counter()
+        for room in candidates:
+            dungeon._rooms_overlap_or_touch(room, dungeon.rooms)
+        timings["overlap_check"].append((time.perf_counter() - start) / MICRO_CALLS)
+
+        # Korridore zwischen zufälligen Raumzentren auf einer Kopie der Karte
+        rng = dungeon.rng
+        centers = [room.center() for room in dungeon.rooms]
+        pairs = [(rng.choice(centers), rng.choice(centers)) for _ in range(MICRO_CALLS)]
+        tiles = dungeon.get_dungeon().copy()
+        existing = set()
+        start = time.perf_counter()
+        for a, b in pairs:
+            Corridor.create(tiles, a, b, existing)
+        timings["corridor_create"].append((time.perf_counter() - start) / MICRO_CALLS)
+
+    result = {name: summarize(samples) for name, samples in timings.items()}
+
+    # Spitzen-Speicher einer vollständigen Generierung (separat, da tracemalloc bremst)
+    tracemalloc.start()
+    make_dungeon(case, seed=0).generate(start_level=True)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result["peak_memory_kb"] = peak / 1024
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Vergleicht Mediane mit der Baseline; gibt die Liste der Regressionen zurück."""
+    regressions = []
+    for case_name, case_result in results["cases"].items():
+        base_case = baseline.get("cases", {}).get(case_name)
+        if not base_case:
+            continue
+        for name, value in case_result.items():
+            base_value = base_case.get(name)
+            if base_value is None:
+                continue
+            current = value["median_ms"] if isinstance(value, dict) else value
+            reference = base_value["median_ms"] if isinstance(base_value, dict) else base_value
+            if reference > 0 and current > reference * (1 + threshold):
+                regressions.append((case_name, name, reference, current))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES), help="Zu messende Matrix-Einträge")
+    parser.add_argument("--repeat", type=int, default=None, help="Wiederholungen pro Eintrag (überschreibt die Matrix)")
+    parser.add_argument("--output", help="Ergebnisse als JSON in diese Datei schreiben")
+    parser.add_argument("--baseline", help="JSON-Datei eines früheren Laufs zum Vergleich")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Erlaubte Verlangsamung gegenüber der Baseline (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("DungeonGame").setLevel(logging.WARNING)
+
+    results = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "cases": {},
+    }
+    for name in args.cases:
+        case = dict(CASES[name])
+        if args.repeat is not None:
+            case["repeat"] = args.repeat
+        print(f"Running {name} ...", file=sys.stderr)
+        results["cases"][name] = bench_case(case)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = compare(results, baseline, args.threshold)
+        for case_name, name, reference, current in regressions:
+            print(f"REGRESSION {case_name}/{name}: {reference:.3f} -> {current:.3f} "
+                  f"(+{(current / reference - 1) * 100:.0f}%)", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against baseline.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
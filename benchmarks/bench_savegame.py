@@ -0,0 +1,111 @@
+"""
+Benchmark für das binäre Spielstand-Format im Vergleich zu Pickle und JSON.
+
+Erzeugt einen Lauf mit vielen Ebenen und misst Speichern, Öffnen und vollständiges
+Laden aller Ebenen. Läuft ohne Pygame:
+
+    python -m benchmarks.bench_savegame --levels 200
+"""
+import argparse
+import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+
+from dungeon.dungeon import Dungeon
+from entities.player import Player
+from utils.config import DUNGEON_PARAMS
+from utils.savegame import ENCODING_RAW, ENCODING_RLE, load_game, save_game
+
+
+def generate_levels(count, seed=42):
+    """Generiert `count` zusammenhängende Ebenen und gibt ihre Zustände zurück."""
+    params = dict(DUNGEON_PARAMS, seed=seed)
+    dungeon = Dungeon(**params, level_index=0)
+    dungeon.generate(start_level=True)
+    states = [dungeon.save_state()]
+    for level_index in range(1, count):
+        dungeon = Dungeon(**params, level_index=level_index)
+        dungeon.generate_next_level(states[-1]["staircase_up"])
+        states.append(dungeon.save_state())
+    return states
+
+
+def to_json_state(state):
+    """JSON-Baseline: Tiles als Liste von Listen, Räume als Listen."""
+    room = lambda r: [r.x, r.y, r.width, r.height] if r else None
+    return {
+        "dungeon": [list(row) for row in state["dungeon"]],
+        "rooms": [room(r) for r in state["rooms"]],
+        "staircase_up": state["staircase_up"],
+        "staircase_down": state["staircase_down"],
+        "start_room": room(state["start_room"]),
+    }
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def run(levels):
+    states = generate_levels(levels)
+    player_state = Player(0, 0, 20, 200).save_state()
+    directory = tempfile.mkdtemp(prefix="bench_savegame_")
+    results = []
+
+    for encoding in (ENCODING_RAW, ENCODING_RLE):
+        path = os.path.join(directory, f"save_{encoding}.dcsv")
+        save_ms, _ = timed(lambda: save_game(path, states, 0, player_state, 42, encoding=encoding))
+        open_ms, save = timed(lambda: load_game(path))
+        all_ms, _ = timed(lambda: [save.load_level(i) for i in range(save.level_count)])
+        save.close()
+        results.append((f"binary ({encoding})", save_ms, open_ms, open_ms + all_ms, os.path.getsize(path)))
+
+    path = os.path.join(directory, "save.pickle")
+    def pickle_save():
+        with open(path, "wb") as fh:
+            pickle.dump({"levels": states, "player": player_state}, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    def pickle_load():
+        with open(path, "rb") as fh:
+            return pickle.load(fh)
+    save_ms, _ = timed(pickle_save)
+    load_ms, _ = timed(pickle_load)
+    results.append(("pickle", save_ms, load_ms, load_ms, os.path.getsize(path)))
+
+    path = os.path.join(directory, "save.json")
+    def json_save():
+        with open(path, "w") as fh:
+            json.dump({"levels": [to_json_state(s) for s in states], "player": player_state}, fh)
+    def json_load():
+        with open(path) as fh:
+            data = json.load(fh)
+        return [bytearray(v for row in level["dungeon"] for v in row) for level in data["levels"]]
+    save_ms, _ = timed(json_save)
+    load_ms, _ = timed(json_load)
+    results.append(("json", save_ms, load_ms, load_ms, os.path.getsize(path)))
+
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+
+    print(f"{levels} levels of {DUNGEON_PARAMS['width']}x{DUNGEON_PARAMS['height']}")
+    print(f"{'format':<14} {'save':>10} {'open':>10} {'load all':>10} {'size':>10}")
+    for name, save_ms, open_ms, all_ms, size in results:
+        print(f"{name:<14} {save_ms:8.1f}ms {open_ms:8.1f}ms {all_ms:8.1f}ms {size / 1024:8.0f}KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, default=200, help="Anzahl der Ebenen im Spielstand")
+    args = parser.parse_args()
+
+    logging.getLogger("DungeonGame").setLevel(logging.WARNING)
+    run(args.levels)
+
+
+if __name__ == "__main__":
+    main()
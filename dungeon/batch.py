@@ -0,0 +1,176 @@
+"""
+Headless Batch-Generierung von Dungeon-Ebenen (ohne Pygame).
+
+Erzeugt N Durchläufe mit je `--depth` Ebenen parallel über einen Prozess-Pool und
+schreibt jede Ebene als kompakten Binär-Datensatz in eine Level-Pack-Datei:
+
+    python -m dungeon.batch --count 100 --depth 5 --output levels.dlvp
+"""
+import argparse
+import logging
+import os
+import random
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .dungeon import Dungeon
+from .room import Room
+from utils.config import DUNGEON_PARAMS
+
+logger = logging.getLogger("DungeonGame")
+
+MAGIC = b"DLVP"
+VERSION = 1
+
+# Datensatz-Kopf: Durchlauf, Ebene, Seed, Breite, Höhe, Treppe hoch (x, y), Treppe runter (x, y),
+# Generierungszeit in Sekunden, Anzahl Räume, Länge des komprimierten Tile-Blocks
+RECORD_HEADER = struct.Struct("<IHqHHhhhhdII")
+ROOM_STRUCT = struct.Struct("<HHHH")
+
+
+def encode_record(record):
+    """Kodiert einen Ebenen-Datensatz als Bytes (Kopf, Räume, zlib-komprimierte Tiles)."""
+    stairs_up = record["staircase_up"] or (-1, -1)
+    stairs_down = record["staircase_down"] or (-1, -1)
+    tiles = zlib.compress(bytes(record["tiles"]))
+    rooms = b"".join(ROOM_STRUCT.pack(*room) for room in record["rooms"])
+    header = RECORD_HEADER.pack(
+        record["run"], record["level"], record["seed"], record["width"], record["height"],
+        stairs_up[0], stairs_up[1], stairs_down[0], stairs_down[1],
+        record["generation_time"], len(record["rooms"]), len(tiles),
+    )
+    return header + rooms + tiles
+
+
+def read_records(path):
+    """Liest alle Datensätze einer Level-Pack-Datei (Generator)."""
+    with open(path, "rb") as fh:
+        magic, version = struct.unpack("<4sH", fh.read(6))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a level pack file.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported level pack version {version}.")
+
+        while True:
+            header = fh.read(RECORD_HEADER.size)
+            if not header:
+                return
+            (run, level, seed, width, height, up_x, up_y, down_x, down_y,
+             generation_time, room_count, tiles_size) = RECORD_HEADER.unpack(header)
+            rooms = [ROOM_STRUCT.unpack(fh.read(ROOM_STRUCT.size)) for _ in range(room_count)]
+            tiles = zlib.decompress(fh.read(tiles_size))
+            yield {
+                "run": run,
+                "level": level,
+                "seed": seed,
+                "width": width,
+                "height": height,
+                "staircase_up": (up_x, up_y) if up_x >= 0 else None,
+                "staircase_down": (down_x, down_y) if down_x >= 0 else None,
+                "generation_time": generation_time,
+                "rooms": [Room(*room) for room in rooms],
+                "tiles": tiles,
+            }
+
+
+def generate_run(run, seed, params, depth):
+    """
+    Generiert einen Durchlauf mit `depth` Ebenen (läuft im Worker-Prozess).
+    Jeder Durchlauf bekommt einen eigenen Seed; jede Ebene nutzt ihren eigenen Zufallsgenerator.
+    """
+    records = []
+    staircase_up = None
+    for level in range(depth):
+        start = time.perf_counter()
+        dungeon = Dungeon(**dict(params, seed=seed), level_index=level)
+        if level == 0:
+            dungeon.generate(start_level=True)
+        else:
+            dungeon.generate_next_level(staircase_up)
+        generation_time = time.perf_counter() - start
+
+        staircase_up = dungeon.get_staircase_up()
+        records.append({
+            "run": run,
+            "level": level,
+            "seed": seed,
+            "width": dungeon.width,
+            "height": dungeon.height,
+            "staircase_up": dungeon.get_staircase_up(),
+            "staircase_down": dungeon.get_staircase_down(),
+            "generation_time": generation_time,
+            "rooms": [(room.x, room.y, room.width, room.height) for room in dungeon.rooms],
+            "tiles": dungeon.get_dungeon().tiles,
+        })
+    return records
+
+
+def _init_worker(log_level):
+    """Initialisiert das Logging im Worker-Prozess."""
+    logger.setLevel(log_level)
+
+
+def run_batch(count, depth, params, output, workers=None, base_seed=None, log_level=logging.WARNING):
+    """
+    Verteilt `count` Durchläufe auf einen Prozess-Pool und streamt die Ebenen nach `output`.
+    Gibt die Anzahl der geschriebenen Ebenen zurück.
+    """
+    if base_seed is None:
+        base_seed = random.SystemRandom().randrange(2 ** 62)
+    logger.info("Batch generation: %d runs x %d levels, base seed %d", count, depth, base_seed, extra={"category": "summary"})
+
+    written = 0
+    with open(output, "wb") as fh, ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(log_level,)
+    ) as executor:
+        fh.write(struct.pack("<4sH", MAGIC, VERSION))
+        futures = [executor.submit(generate_run, run, base_seed + run, params, depth) for run in range(count)]
+
+        # In Fertigstellungsreihenfolge schreiben, damit nichts im Speicher wartet
+        for future in as_completed(futures):
+            for record in future.result():
+                fh.write(encode_record(record))
+                written += 1
+
+    logger.info("Batch generation finished: %d levels written to %s", written, output, extra={"category": "summary"})
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10, help="Anzahl der Durchläufe")
+    parser.add_argument("--depth", type=int, default=1, help="Ebenen pro Durchlauf")
+    parser.add_argument("--output", default="levels.dlvp", help="Ziel-Datei für das Level-Pack")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Anzahl der Worker-Prozesse")
+    parser.add_argument("--seed", type=int, default=None, help="Basis-Seed (Durchlauf i nutzt seed + i)")
+    parser.add_argument("--width", type=int, default=DUNGEON_PARAMS["width"])
+    parser.add_argument("--height", type=int, default=DUNGEON_PARAMS["height"])
+    parser.add_argument("--min-rooms", type=int, default=DUNGEON_PARAMS["min_rooms"])
+    parser.add_argument("--max-rooms", type=int, default=DUNGEON_PARAMS["max_rooms"])
+    parser.add_argument("--room-size", type=int, nargs=2, default=DUNGEON_PARAMS["room_size_range"], metavar=("MIN", "MAX"))
+    parser.add_argument("--extra-loops", type=float, default=DUNGEON_PARAMS["extra_loops"])
+    parser.add_argument("--verbose", action="store_true", help="Generator-Logs der Worker anzeigen")
+    args = parser.parse_args(argv)
+
+    params = dict(
+        DUNGEON_PARAMS,
+        width=args.width,
+        height=args.height,
+        min_rooms=args.min_rooms,
+        max_rooms=args.max_rooms,
+        room_size_range=tuple(args.room_size),
+        extra_loops=args.extra_loops,
+    )
+
+    start = time.perf_counter()
+    written = run_batch(
+        args.count, args.depth, params, args.output, args.workers, args.seed,
+        logging.DEBUG if args.verbose else logging.WARNING,
+    )
+    print(f"{written} levels written to {args.output} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
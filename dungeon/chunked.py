@@ -0,0 +1,274 @@
+import logging
+import random
+from collections import OrderedDict
+from .room import Room
+from .room_graph import nearest_neighbour_edges
+from .tile import TileType, WALKABLE
+from .tilemap import TileMap
+from utils.logger_config import logger
+
+logger = logging.getLogger("DungeonGame")
+
+
+class ChunkPlan:
+    """
+    Deterministischer Bauplan eines Chunks: Räume und Korridore in Weltkoordinaten.
+
+    Räume beginnen im eigenen Chunk, dürfen aber nach Osten/Süden in die Nachbarn
+    hineinragen. Korridore verbinden die Räume untereinander (MST) und mit den vier
+    Portalen auf den Chunk-Kanten, über die benachbarte Chunks verbunden werden.
+    """
+
+    def __init__(self, rooms, corridors):
+        self.rooms = rooms          # Liste von (x, y, Breite, Höhe)
+        self.corridors = corridors  # Liste von ((x1, y1), (x2, y2)), L-förmig (erst X, dann Y)
+
+
+class ChunkedWorld:
+    """
+    Endlose Welt aus Chunks fester Größe, die beim ersten Zugriff deterministisch aus
+    (Seed, Chunk-Koordinate) generiert und bei großer Entfernung wieder verworfen werden.
+
+    Ein Chunk wird aus seinem eigenen Bauplan und denen seiner Nachbarn im Westen,
+    Norden und Nordwesten zusammengesetzt, da deren Räume und Korridore hineinragen
+    können. Dadurch passen Räume und Korridore über Chunk-Grenzen hinweg zusammen,
+    unabhängig davon, in welcher Reihenfolge Chunks generiert werden.
+    """
+
+    def __init__(self, seed=None, chunk_size=64, rooms_per_chunk=(2, 4), room_size_range=(6, 12),
+                 view_radius=1, keep_radius=3):
+        if room_size_range[1] >= chunk_size:
+            raise ValueError("Rooms must be smaller than a chunk.")
+
+        self.seed = seed if seed is not None else random.randrange(2 ** 62)
+        self.chunk_size = chunk_size
+        self.rooms_per_chunk = rooms_per_chunk
+        self.room_size_range = room_size_range
+        self.view_radius = view_radius  # Chunks in diesem Radius müssen geladen sein
+        self.keep_radius = keep_radius  # Chunks außerhalb dieses Radius werden verworfen
+
+        # Unbegrenzte Welt: keine feste Breite/Höhe, keine Treppen
+        self.width = None
+        self.height = None
+        self.rng = random.Random(f"{self.seed}:world")
+
+        self._chunks = OrderedDict()  # (cx, cy) -> TileMap
+        self._plans = OrderedDict()   # (cx, cy) -> ChunkPlan (klein, aber ebenfalls begrenzt)
+        self._views = {}              # (Breite, Höhe) -> ((Ursprung x, Ursprung y), TileMap)
+
+        self.generated_chunks = 0
+        self.evicted_chunks = 0
+        self.version = 0  # wird erhöht, sobald Chunks geladen oder verworfen werden (wie TileMap.version)
+
+    # ----------------------------------------------------------------------------------------
+    # Baupläne
+    # ----------------------------------------------------------------------------------------
+
+    def _portal_offset(self, kind, cx, cy):
+        """Position eines Portals auf einer Chunk-Kante; beide Nachbarn berechnen denselben Wert."""
+        rng = random.Random(f"{self.seed}:portal:{kind}:{cx}:{cy}")
+        return rng.randint(2, self.chunk_size - 3)
+
+    def _plan(self, cx, cy):
+        """Gibt den (gecachten) Bauplan des Chunks (cx, cy) zurück."""
+        plan = self._plans.get((cx, cy))
+        if plan is not None:
+            self._plans.move_to_end((cx, cy))
+            return plan
+
+        size = self.chunk_size
+        rng = random.Random(f"{self.seed}:{cx}:{cy}")
+        origin_x, origin_y = cx * size, cy * size
+
+        # Räume: Startpunkt im Chunk, überlappungsfrei innerhalb des Chunks
+        rooms = []
+        target = rng.randint(*self.rooms_per_chunk)
+        for _ in range(target * 5):
+            if len(rooms) >= target:
+                break
+            width = rng.randint(*self.room_size_range)
+            height = rng.randint(*self.room_size_range)
+            x = origin_x + rng.randint(1, size - 2)
+            y = origin_y + rng.randint(1, size - 2)
+            if all(x + width + 1 <= rx or rx + rw + 1 <= x or y + height + 1 <= ry or ry + rh + 1 <= y
+                   for rx, ry, rw, rh in rooms):
+                rooms.append((x, y, width, height))
+        if not rooms:
+            rooms.append((origin_x + size // 2 - 2, origin_y + size // 2 - 2, 4, 4))
+
+        centers = [(x + w // 2, y + h // 2) for x, y, w, h in rooms]
+
+        # Räume innerhalb des Chunks verbinden (MST über die Kandidatenkanten)
+        corridors = []
+        parent = list(range(len(centers)))
+
+        def find(v):
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            return v
+
+        for _, i, j in nearest_neighbour_edges(centers, min(8, len(centers) - 1) or 1):
+            if find(i) != find(j):
+                parent[find(j)] = find(i)
+                corridors.append((centers[i], centers[j]))
+
+        # Portale: West/Nord liegen am eigenen Rand, Ost/Süd eine Kachel im Nachbarn.
+        # Der Nachbar führt seinen West-/Nord-Korridor an dieselbe Kachel.
+        portals = [
+            (origin_x, origin_y + self._portal_offset("v", cx, cy)),
+            (origin_x + size, origin_y + self._portal_offset("v", cx + 1, cy)),
+            (origin_x + self._portal_offset("h", cx, cy), origin_y),
+            (origin_x + self._portal_offset("h", cx, cy + 1), origin_y + size),
+        ]
+        for portal in portals:
+            nearest = min(centers, key=lambda c: abs(c[0] - portal[0]) + abs(c[1] - portal[1]))
+            corridors.append((nearest, portal))
+
+        plan = ChunkPlan(rooms, corridors)
+        self._plans[(cx, cy)] = plan
+
+        # Baupläne werden für die Nachbarn mehrfach gebraucht, aber nicht unbegrenzt
+        max_plans = 4 * (2 * self.keep_radius + 2) ** 2
+        while len(self._plans) > max_plans:
+            self._plans.popitem(last=False)
+        return plan
+
+    # ----------------------------------------------------------------------------------------
+    # Chunks
+    # ----------------------------------------------------------------------------------------
+
+    def _generate_chunk(self, cx, cy):
+        """Setzt die Tiles eines Chunks aus seinem Bauplan und den hineinragenden Nachbarplänen zusammen."""
+        size = self.chunk_size
+        tiles = TileMap(size, size, fill=TileType.WALL)
+        origin_x, origin_y = cx * size, cy * size
+
+        def carve(x1, y1, x2, y2):
+            # Rechteck in Weltkoordinaten (inklusive) auf den Chunk zuschneiden und als Boden setzen
+            lx1, ly1 = max(x1, origin_x) - origin_x, max(y1, origin_y) - origin_y
+            lx2, ly2 = min(x2, origin_x + size - 1) - origin_x, min(y2, origin_y + size - 1) - origin_y
+            if lx1 <= lx2 and ly1 <= ly2:
+                tiles.fill_rect(lx1, ly1, lx2 - lx1 + 1, ly2 - ly1 + 1, TileType.FLOOR)
+
+        for px, py in ((cx, cy), (cx - 1, cy), (cx, cy - 1), (cx - 1, cy - 1)):
+            plan = self._plan(px, py)
+            for x, y, width, height in plan.rooms:
+                carve(x, y, x + width - 1, y + height - 1)
+            for (x1, y1), (x2, y2) in plan.corridors:
+                carve(min(x1, x2), y1, max(x1, x2), y1)
+                carve(x2, min(y1, y2), x2, max(y1, y2))
+
+        self.generated_chunks += 1
+        logger.debug("Chunk (%d, %d) generated.", cx, cy, extra={"category": "chunks"})
+        return tiles
+
+    def get_chunk(self, cx, cy):
+        """Gibt die Tiles eines Chunks zurück und generiert ihn beim ersten Zugriff."""
+        chunk = self._chunks.get((cx, cy))
+        if chunk is None:
+            chunk = self._generate_chunk(cx, cy)
+            self._chunks[(cx, cy)] = chunk
+            self._views.clear()
+            self.version += 1
+        return chunk
+
+    def loaded_chunks(self):
+        """Tile-Karten aller geladenen Chunks."""
+        return list(self._chunks.values())
+
+    def update(self, tile_x, tile_y, budget=1):
+        """
+        Pro Frame aufrufen: stellt sicher, dass die Chunks um den Spieler geladen sind,
+        generiert bis zu `budget` Chunks im nächsten Ring vorab und verwirft entfernte Chunks.
+        """
+        pcx, pcy = tile_x // self.chunk_size, tile_y // self.chunk_size
+
+        for cy in range(pcy - self.view_radius, pcy + self.view_radius + 1):
+            for cx in range(pcx - self.view_radius, pcx + self.view_radius + 1):
+                self.get_chunk(cx, cy)
+
+        # Vorab-Generierung des nächsten Rings, damit beim Weiterlaufen kein Ruckler entsteht
+        ring = self.view_radius + 1
+        for cy in range(pcy - ring, pcy + ring + 1):
+            for cx in range(pcx - ring, pcx + ring + 1):
+                if budget <= 0:
+                    break
+                if (cx, cy) not in self._chunks:
+                    self.get_chunk(cx, cy)
+                    budget -= 1
+
+        for key in [key for key in self._chunks
+                    if max(abs(key[0] - pcx), abs(key[1] - pcy)) > self.keep_radius]:
+            del self._chunks[key]
+            self.evicted_chunks += 1
+            self._views.clear()
+            self.version += 1
+
+    # ----------------------------------------------------------------------------------------
+    # Tile-Zugriff (gleiche Schnittstelle wie TileMap für Kollision)
+    # ----------------------------------------------------------------------------------------
+
+    def in_bounds(self, x, y):
+        """Die Welt ist unbegrenzt."""
+        return True
+
+    def get(self, x, y):
+        """Gibt das Tile an der Weltposition (x, y) zurück."""
+        size = self.chunk_size
+        return self.get_chunk(x // size, y // size).get(x % size, y % size)
+
+    def is_walkable_tile(self, x, y):
+        return WALKABLE[self.get(x, y)] == 1
+
+    def get_view(self, center_x, center_y, width, height):
+        """
+        Gibt einen Ausschnitt der Welt als TileMap zurück: (Tile-Karte, Ursprung x, Ursprung y).
+        Ein Ausschnitt je Größe wird wiederverwendet, solange sich Position und Chunks nicht ändern.
+        """
+        origin_x, origin_y = center_x - width // 2, center_y - height // 2
+        cached = self._views.get((width, height))
+        if cached is not None and cached[0] == (origin_x, origin_y):
+            return cached[1], origin_x, origin_y
+
+        size = self.chunk_size
+        view = TileMap(width, height, fill=TileType.WALL)
+        for row in range(height):
+            y = origin_y + row
+            x = origin_x
+            while x < origin_x + width:
+                chunk = self.get_chunk(x // size, y // size)
+                local_x = x % size
+                span = min(size - local_x, origin_x + width - x)
+                start = (y % size) * size + local_x
+                target = row * width + (x - origin_x)
+                view.tiles[target:target + span] = chunk.tiles[start:start + span]
+                x += span
+
+        self._views[(width, height)] = ((origin_x, origin_y), view)
+        return view, origin_x, origin_y
+
+    # ----------------------------------------------------------------------------------------
+    # Dungeon-kompatible Abfragen für main.py
+    # ----------------------------------------------------------------------------------------
+
+    def get_dungeon(self):
+        return self
+
+    def get_start_room(self):
+        """Erster Raum des Ursprungs-Chunks."""
+        x, y, width, height = self._plan(0, 0).rooms[0]
+        return Room(x, y, width, height)
+
+    def get_staircase_up(self):
+        return None
+
+    def get_staircase_down(self):
+        return None
+
+    def stats(self):
+        return {
+            "loaded_chunks": len(self._chunks),
+            "generated_chunks": self.generated_chunks,
+            "evicted_chunks": self.evicted_chunks,
+        }
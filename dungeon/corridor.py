@@ -1,55 +1,52 @@
 from .tile import TileType
 import logging
-from utils.logger_config import logger
+from utils.logger_config import logger, log_enabled
 
 logger = logging.getLogger("DungeonGame")
 
 class Corridor:
-    existing_corridors = set() # Verhindert doppelte Korridore
-
     @staticmethod
-    def create(dungeon, start, end):
+    def create(dungeon, start, end, existing_corridors=None):
         """
         Erstellt einen L-förmigen Korridor vom Punkt `start` nach `end`.
-        Vermeidet doppelte Korridore mithilfe von `existing_corridors`.
+        Optional werden doppelte Korridore mithilfe der Menge `existing_corridors` vermieden
+        (das Dungeon selbst verhindert Duplikate über seinen Verbindungsgraphen).
+        Rückgabe: True, wenn ein Korridor gezeichnet wurde.
         """
-        if (start, end) in Corridor.existing_corridors or (end, start) in Corridor.existing_corridors:
-            logger.debug("Corridor already exists: %s -> %s", start, end, extra={"category": "corridors"})
-            return
+        if existing_corridors is not None and ((start, end) in existing_corridors or (end, start) in existing_corridors):
+            if log_enabled("corridors"):
+                logger.debug("Corridor already exists: %s -> %s", start, end, extra={"category": "corridors"})
+            return False
 
-        logger.info("Creating corridor: %s -> %s", start, end, extra={"category": "corridors"})
+        if log_enabled("corridors", logging.INFO):
+            logger.info("Creating corridor: %s -> %s", start, end, extra={"category": "corridors"})
 
         # Zeichnet zuerst horizontal (X), dann vertikal (Y)
         Corridor._create_horizontal_segment(dungeon, start[0], end[0], start[1])
         Corridor._create_vertical_segment(dungeon, start[1], end[1], end[0])
 
         # Speichert den neuen Korridor (in beide Richtungen)
-        Corridor.existing_corridors.add((start, end))
-        Corridor.existing_corridors.add((end, start))
-        logger.debug("Corridor successfully created: %s -> %s", start, end, extra={"category": "corridors"})
+        if existing_corridors is not None:
+            existing_corridors.add((start, end))
+            existing_corridors.add((end, start))
+        if log_enabled("corridors"):
+            logger.debug("Corridor successfully created: %s -> %s", start, end, extra={"category": "corridors"})
+        return True
 
     @staticmethod
     def _create_horizontal_segment(dungeon, x1, x2, y):
         """
         Zeichnet einen horizontalen Korridor von x1 nach x2 auf der Zeile y.
         """
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            dungeon[y][x] = TileType.FLOOR
-        logger.debug("Horizontal segment created at y=%d, x1=%d, x2=%d", y, x1, x2, extra={"category": "corridors"})
+        dungeon.fill_hline(x1, x2, y, TileType.FLOOR)
+        if log_enabled("corridors"):
+            logger.debug("Horizontal segment created at y=%d, x1=%d, x2=%d", y, x1, x2, extra={"category": "corridors"})
 
     @staticmethod
     def _create_vertical_segment(dungeon, y1, y2, x):
         """
         Zeichnet einen vertikalen Korridor von y1 nach y2 in der Spalte x.
         """
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            dungeon[y][x] = TileType.FLOOR
-        logger.debug("Vertical segment created at x=%d, y1=%d, y2=%d", x, y1, y2, extra={"category": "corridors"})
-
-    @staticmethod
-    def reset_corridors():
-        """
-        Setzt die gespeicherten Korridore zurück (z. B. beim Neugenerieren eines Dungeons).
-        """
-        Corridor.existing_corridors.clear()
-        logger.info("All corridors reset.", extra={"category": "corridors"})
+        dungeon.fill_vline(x, y1, y2, TileType.FLOOR)
+        if log_enabled("corridors"):
+            logger.debug("Vertical segment created at x=%d, y1=%d, y2=%d", x, y1, y2, extra={"category": "corridors"})
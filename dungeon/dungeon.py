@@ -2,9 +2,11 @@ import random
 import logging
 from .room import Room
 from .corridor import Corridor
-from .tile import TileType
-from heapq import heappop, heappush
-from utils.logger_config import logger
+from .tile import TileType, WALKABLE
+from .tilemap import TileMap
+from .room_graph import RoomGraph, nearest_neighbour_edges
+from .fov import ExploredMap
+from utils.logger_config import logger, log_enabled
 from dungeon.grid import Grid
 from utils.config import TILE_SIZE
 
@@ -12,11 +14,21 @@ from utils.config import TILE_SIZE
 logger = logging.getLogger("DungeonGame")
 
 
+def level_seed(run_seed, level_index):
+    """Leitet den Seed einer Ebene deterministisch aus Lauf-Seed und Ebenen-Index ab."""
+    return f"{run_seed}:{level_index}"
+
+
 class Dungeon:
-    def __init__(self, width, height, min_rooms, max_rooms, room_size_range, seed=None, debug=False, grid=None):
+    def __init__(self, width, height, min_rooms, max_rooms, room_size_range, seed=None, debug=False, grid=None, tiles=None,
+                 extra_loops=0.0, level_index=0):
+        # Eigener Zufallsgenerator pro Dungeon, abgeleitet aus (Lauf-Seed, Ebenen-Index).
+        # Damit ist jede Ebene reproduzierbar und Generierungen in Threads/Prozessen beeinflussen sich nicht.
+        self.seed = seed
+        self.level_index = level_index
+        self.rng = random.Random(level_seed(seed, level_index)) if seed is not None else random.Random()
         if seed is not None:
-            random.seed(seed)  # Seed für die Zufallszahlengenerierung setzen
-            self.debug_print(f"Random seed set to {seed}")
+            logger.debug("Random seed set to %s (level %d)", seed, level_index, extra={"category": "levels"})
 
         self.width = width
         self.height = height
@@ -24,8 +36,15 @@ class Dungeon:
         self.max_rooms = max_rooms
         self.room_size_range = room_size_range
 
-        # 2D-Array zur Darstellung des Dungeons (initial: nur Wände)
-        self.dungeon = [[TileType.WALL for _ in range(width)] for _ in range(height)]
+        # Anteil der zusätzlichen (nicht-MST) Kandidatenkanten, die als Schleifen verbunden werden
+        self.extra_loops = extra_loops
+
+        # Kompakte Tile-Karte des Dungeons (initial: nur Wände)
+        self.dungeon = tiles if tiles is not None else TileMap(width, height, fill=TileType.WALL)
+
+        # Vom Spieler erkundete Tiles (Fog of War, 1 Bit pro Tile); bei übergebenen Tiles
+        # (gespeicherte Ebene) setzt load_state() sie aus dem Zustand
+        self.explored = ExploredMap(width, height) if tiles is None else None
 
         # Liste aller generierten Räume
         self.rooms = []
@@ -34,15 +53,27 @@ class Dungeon:
         self.staircase_up = None
         self.staircase_down = None
 
-        # Bereits verbundene Korridore
-        self.existing_corridors = set() 
+        # Verbindungsgraph der Räume (welcher Raum ist über einen Korridor mit welchem verbunden)
+        self.room_graph = RoomGraph()
 
-        # Startraum-Referenz
+        # Einstiegspunkt (Treppe nach unten) bei Folgeebenen; None für die Start-Ebene
+        self.entry_position = None
+
+        # Startraum-Referenz (und sein Index in self.rooms)
         self.start_room = None
+        self.start_room_index = None
 
         self.generated = False  # Verhindert doppelte Generierung
         self.debug = debug
-        self.grid = grid if grid else Grid(width, height)  # Grid verwenden oder erstellen
+        # Belegungsraster für die Raumplatzierung; wird nur beim Generieren gebraucht und
+        # daher erst beim ersten Zugriff angelegt (nicht beim Laden gespeicherter Ebenen)
+        self._grid = grid
+
+    @property
+    def grid(self):
+        if self._grid is None:
+            self._grid = Grid(self.width, self.height)
+        return self._grid
 
     def log_grid(self):
         """Gibt das aktuelle Dungeon-Grid zeilenweise ins Log aus (nur zu Debugzwecken)."""
@@ -53,7 +84,7 @@ class Dungeon:
 
     def set_grid(self, grid):
         """Erlaubt das Setzen eines externen Grids."""
-        self.grid = grid
+        self._grid = grid
 
     def generate(self, start_level=False):
         """
@@ -67,17 +98,8 @@ class Dungeon:
         self.generated = True
         logger.info("Generating dungeon...", extra={"category": "summary"})
 
-        num_rooms = random.randint(self.min_rooms, self.max_rooms)
-        attempts = 0
-
-        # Räume generieren, bis Mindestanzahl erreicht oder max. Versuche überschritten
-        while len(self.rooms) < num_rooms and attempts < num_rooms * 5:
-            room = self._create_random_room()
-            if not self._rooms_overlap_or_touch(room, self.rooms):  # Hier wird die Methode aufgerufen
-                self.rooms.append(room)
-                self._carve_room(room)
-                logger.debug("Room created: %s", room, extra={"category": "rooms"})
-            attempts += 1
+        num_rooms = self.rng.randint(self.min_rooms, self.max_rooms)
+        self._place_random_rooms(num_rooms)
 
         if not self.rooms:
             logger.error("No rooms generated. Dungeon generation failed.", extra={"category": "levels"})
@@ -91,7 +113,8 @@ class Dungeon:
 
         logger.info("Rooms created: %d", len(self.rooms), extra={"category": "rooms"})
         for i, room in enumerate(self.rooms):
-            logger.debug("Room %d: %s at %s", i, room, room.center(), extra={"category": "rooms"})
+            if log_enabled("rooms"):
+                logger.debug("Room %d: %s at %s", i, room, room.center(), extra={"category": "rooms"})
 
         if start_level:
             # Nur eine Treppe im Start-Level, entfernt vom Start-Raum
@@ -99,7 +122,7 @@ class Dungeon:
                 logger.error("Start room not defined.", extra={"category": "levels"})
                 raise ValueError("Start room not defined.")
             logger.info("Start room selected: %s", self.start_room, extra={"category": "rooms"})
-            distant_room = random.choice([room for room in self.rooms if room != self.start_room])
+            distant_room = self._farthest_room(self.start_room_index)
             self.staircase_up = self._place_staircase(distant_room, TileType.STAIRS_UP)
             logger.info("Staircase Up placed in room: %s at %s", distant_room, self.staircase_up, extra={"category": "stairs"})
             self.staircase_down = None  # Keine Treppe nach unten im Start-Level
@@ -120,18 +143,19 @@ class Dungeon:
         """
         logger.info("Generating next level with staircase_down at %s", staircase_down_position, extra={"category": "levels"})
         self.rooms = [] # Räume zurücksetzen
-        self.dungeon = [[TileType.WALL for _ in range(self.width)] for _ in range(self.height)]
+        self.dungeon = TileMap(self.width, self.height, fill=TileType.WALL)
 
         # 1. Tile an der Treppenposition begehbar machen
         x_down, y_down = staircase_down_position
+        self.entry_position = staircase_down_position
         if not 0 <= x_down < self.width or not 0 <= y_down < self.height:
             logger.error("Staircase Down position %s is out of bounds.", staircase_down_position, extra={"category": "stairs"})
             raise ValueError(f"Staircase Down position {staircase_down_position} is out of bounds.")
-        self.dungeon[y_down][x_down] = TileType.FLOOR
+        self.dungeon.set(x_down, y_down, TileType.FLOOR)
         logger.info("Marked staircase_down position %s as walkable (FLOOR).", staircase_down_position, extra={"category": "stairs"})
 
         # 2. Treppe nach unten auf dem begehbaren Tile platzieren
-        self.dungeon[y_down][x_down] = TileType.STAIRS_DOWN
+        self.dungeon.set(x_down, y_down, TileType.STAIRS_DOWN)
         self.staircase_down = staircase_down_position
         logger.info("Placed staircase_down at %s.", staircase_down_position, extra={"category": "summary"})
 
@@ -142,28 +166,20 @@ class Dungeon:
         logger.info("Created room around staircase_down at %s.", staircase_down_position, extra={"category": "rooms"})
 
         # 4. Weitere Räume hinzufügen (außer dem für die Treppe)
-        num_rooms = random.randint(self.min_rooms, self.max_rooms)
+        num_rooms = self.rng.randint(self.min_rooms, self.max_rooms)
         logger.debug("Generating %d additional rooms for the level.", num_rooms - 1, extra={"category": "levels"})
-        attempts = 0
-
-        while len(self.rooms) < num_rooms and attempts < num_rooms * 5:
-            room = self._create_random_room()
-            if not self._rooms_overlap_or_touch(room, self.rooms):
-                self.rooms.append(room)
-                self._carve_room(room)
-                logger.debug("Room created: %s", room, extra={"category": "rooms"})
-            attempts += 1
+        self._place_random_rooms(num_rooms)
 
         # Räume verbinden
         self._connect_rooms()
 
         # Validierung: Sicherstellen, dass STAIRS_DOWN nicht überschrieben wurde
-        if self.dungeon[y_down][x_down] != TileType.STAIRS_DOWN:
+        if self.dungeon.get(x_down, y_down) != TileType.STAIRS_DOWN:
             logger.error("STAIRS_DOWN at (%d, %d) was overwritten. Restoring...", x_down, y_down, extra={"category": "stairs"})
-            self.dungeon[y_down][x_down] = TileType.STAIRS_DOWN
+            self.dungeon.set(x_down, y_down, TileType.STAIRS_DOWN)
 
         # 5. Treppe nach oben in einem zufälligen Raum platzieren
-        distant_room = random.choice([room for room in self.rooms if room != staircase_room])
+        distant_room = self._farthest_room(0)  # staircase_room ist der erste Raum
         staircase_up_position = distant_room.center()
         x_up, y_up = staircase_up_position
 
@@ -182,13 +198,25 @@ class Dungeon:
                 raise ValueError("No valid walkable position found for Staircase Up.")
 
         # Treppe nach oben platzieren
-        self.dungeon[y_up][x_up] = TileType.STAIRS_UP
+        self.dungeon.set(x_up, y_up, TileType.STAIRS_UP)
         self.staircase_up = staircase_up_position
         logger.info("Placed staircase_up at %s in room %s.", staircase_up_position, distant_room, extra={"category": "summary"})
 
         # Debugging der Treppen
         self.debug_stairs()
 
+    def _place_random_rooms(self, num_rooms):
+        """Platziert zufällige Räume, bis `num_rooms` erreicht oder die max. Versuche überschritten sind."""
+        attempts = 0
+        while len(self.rooms) < num_rooms and attempts < num_rooms * 5:
+            room = self._create_random_room()
+            if not self._rooms_overlap_or_touch(room, self.rooms):
+                self.rooms.append(room)
+                self._carve_room(room)
+                if log_enabled("rooms"):
+                    logger.debug("Room created: %s", room, extra={"category": "rooms"})
+            attempts += 1
+
     def _create_room_around_point(self, x, y):
         """Erstellt einen Raum zufälliger Größe um einen gegebenen Mittelpunkt (z. B. für Treppenplatzierung)."""
         max_attempts = 10
@@ -197,8 +225,8 @@ class Dungeon:
         # Zufällige Raumgröße
         for attempt in range(max_attempts):
             # Zufällige Raumgröße innerhalb des Bereichs
-            room_width = random.randint(self.room_size_range[0], self.room_size_range[1])
-            room_height = random.randint(self.room_size_range[0], self.room_size_range[1])
+            room_width = self.rng.randint(self.room_size_range[0], self.room_size_range[1])
+            room_height = self.rng.randint(self.room_size_range[0], self.room_size_range[1])
 
             # Zentriere Raum um den Punkt, mit minimalem Abstand zum Rand
             room_x = max(1, x - room_width // 2)
@@ -219,12 +247,13 @@ class Dungeon:
                 return new_room
 
             # Versatz für nächsten Versuch
-            logger.debug(
-                "Failed to place room at (%d, %d) on attempt %d. Adjusting parameters...",
-                room_x, room_y, attempt + 1, extra={"category": "rooms"}
-            )
-            x = (x + random.randint(-1, 1)) % self.width
-            y = (y + random.randint(-1, 1)) % self.height
+            if log_enabled("rooms"):
+                logger.debug(
+                    "Failed to place room at (%d, %d) on attempt %d. Adjusting parameters...",
+                    room_x, room_y, attempt + 1, extra={"category": "rooms"}
+                )
+            x = (x + self.rng.randint(-1, 1)) % self.width
+            y = (y + self.rng.randint(-1, 1)) % self.height
 
         # Fallback – wenn alle Versuche fehlschlagen, erstelle einen kleinen Raum
         logger.warning(
@@ -237,60 +266,80 @@ class Dungeon:
         """
         Prüft, ob sich ein Raum mit anderen Räumen überschneidet oder direkt angrenzt.
         buffer=1 erlaubt 1 Feld Abstand.
+        Die Abfrage läuft über den Belegungsindex des Grids (O(Zeilen) statt O(Zellen)).
         """
-        for y in range(room.y - buffer, room.y + room.height + buffer):
-            for x in range(room.x - buffer, room.x + room.width + buffer):
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    if self.grid.is_cell_occupied(x, y):
-                        logger.debug("Room %s overlaps or touches another room at (%d, %d).", room, x, y, extra={"category": "rooms"})
-                        return True
-        logger.debug("Room %s does not overlap with any existing room.", room, extra={"category": "rooms"})
-        return False
+        return not self.grid.is_rect_free(
+            room.x - buffer, room.y - buffer,
+            room.width + 2 * buffer, room.height + 2 * buffer
+        )
 
     def _create_random_room(self):
         """Erstellt einen vollständig zufälligen Raum innerhalb der Dungeon-Grenzen."""
-        width = random.randint(self.room_size_range[0], self.room_size_range[1])
-        height = random.randint(self.room_size_range[0], self.room_size_range[1])
-        x = random.randint(1, self.width - width - 2)
-        y = random.randint(1, self.height - height - 2)
+        width = self.rng.randint(self.room_size_range[0], self.room_size_range[1])
+        height = self.rng.randint(self.room_size_range[0], self.room_size_range[1])
+        x = self.rng.randint(1, self.width - width - 2)
+        y = self.rng.randint(1, self.height - height - 2)
         room = Room(x, y, width, height)
-        logger.debug("Generated random room: %s", room, extra={"category": "rooms"})
+        if log_enabled("rooms"):
+            logger.debug("Generated random room: %s", room, extra={"category": "rooms"})
         return Room(x, y, width, height)
 
-    def _connect_rooms(self):
+    def _connect_rooms(self, neighbours=8):
         """
         Verbindet alle Räume über ein Minimum Spanning Tree (MST),
         um sicherzustellen, dass jeder Raum erreichbar ist.
-        """
-        from heapq import heappop, heappush
-
-        edges = []
-        for i, room1 in enumerate(self.rooms):
-            for j, room2 in enumerate(self.rooms):
-                if i < j:
-                    dist = abs(room1.center()[0] - room2.center()[0]) + abs(room1.center()[1] - room2.center()[1])
-                    heappush(edges, (dist, i, j))
 
+        Der MST wird auf einem dünnen Kandidatengraphen (k nächste Nachbarn der Raumzentren)
+        berechnet statt auf allen n²/2 Raumpaaren. Optional werden mit `extra_loops`
+        zusätzliche Kandidatenkanten als Schleifen verbunden.
+        """
+        centers = [room.center() for room in self.rooms]
         parent = list(range(len(self.rooms)))
+        self.room_graph = RoomGraph(len(self.rooms))
 
         def find(v):
-            if parent[v] != v:
-                parent[v] = find(parent[v])
-            return parent[v]
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+            return v
 
         def union(v1, v2):
             parent[find(v2)] = find(v1)
 
         mst = []
-        while edges and len(mst) < len(self.rooms) - 1:
-            dist, i, j = heappop(edges)
-            if find(i) != find(j):
-                union(i, j)
-                mst.append((i, j))
+        edges = []
+        k = neighbours
+        while True:
+            edges = nearest_neighbour_edges(centers, k)
+            for dist, i, j in edges:
+                if len(mst) >= len(self.rooms) - 1:
+                    break
+                if find(i) != find(j):
+                    union(i, j)
+                    mst.append((i, j))
+
+            # Kandidatengraph nicht zusammenhängend (z. B. getrennte Raumgruppen): k erhöhen
+            if len(mst) >= len(self.rooms) - 1 or k >= len(self.rooms) - 1:
+                break
+            k *= 2
+            logger.debug("Candidate graph not connected, retrying with k=%d.", k, extra={"category": "corridors"})
 
         for i, j in mst:
-            logger.info("Connected room %d to room %d.", i, j, extra={"category": "corridors"})
-            Corridor.create(self.dungeon, self.rooms[i].center(), self.rooms[j].center())
+            if log_enabled("corridors", logging.INFO):
+                logger.info("Connected room %d to room %d.", i, j, extra={"category": "corridors"})
+            self.room_graph.add_edge(i, j)
+            Corridor.create(self.dungeon, centers[i], centers[j])
+
+        # Optionale Schleifen aus den übrigen Kandidatenkanten
+        if self.extra_loops > 0:
+            mst_edges = set(mst)
+            extra = [(i, j) for _, i, j in edges if (i, j) not in mst_edges]
+            loop_count = min(len(extra), round(len(extra) * self.extra_loops))
+            for i, j in self.rng.sample(extra, loop_count):
+                if self.room_graph.add_edge(i, j):
+                    if log_enabled("corridors", logging.INFO):
+                        logger.info("Connected room %d to room %d (loop).", i, j, extra={"category": "corridors"})
+                    Corridor.create(self.dungeon, centers[i], centers[j])
 
         # Überprüfen, ob alle Räume verbunden sind
         connected = set(find(i) for i in range(len(self.rooms)))
@@ -300,44 +349,49 @@ class Dungeon:
 
     def _select_start_room(self):
         """
-        Wählt einen Raum mit nur einer Verbindung als Startpunkt (wenn möglich).
+        Wählt einen Raum mit nur einer Verbindung (Blatt im Verbindungsgraphen) als Startpunkt.
         Fallback: erster Raum in der Liste.
         """
-        for room in self.rooms:
-            connections = sum(1 for other in self.rooms if self._corridor_exists(room.center(), other.center()))
-            logger.debug("Room %s at %s has %d connections.", room, room.center(), connections, extra={"category": "rooms"})
-            if connections == 1:  # Startraum hat nur eine Verbindung
-                self.start_room = room
-                logger.info("Start room selected: %s", room, extra={"category": "rooms"})
+        for index in range(len(self.rooms)):
+            if self.room_graph.degree(index) == 1:  # Startraum hat nur eine Verbindung
+                self.start_room_index = index
+                self.start_room = self.rooms[index]
+                logger.info("Start room selected: %s", self.start_room, extra={"category": "rooms"})
                 return
 
         # Fallback: Wähle den ersten Raum, falls kein passender gefunden wird
         if self.rooms:  # Sicherstellen, dass es mindestens einen Raum gibt
             logger.warning("No suitable start room with one connection found. Selecting the first room as fallback.", extra={"category": "rooms"})
+            self.start_room_index = 0
             self.start_room = self.rooms[0]
         else:
             logger.error("No rooms available to select a start room.", extra={"category": "rooms"})
             raise ValueError("No rooms available to select a start room.")
-        
+
+    def _farthest_room(self, start_index):
+        """Gibt den Raum zurück, der vom Raum `start_index` die meisten Korridor-Schritte entfernt ist."""
+        index, steps = self.room_graph.farthest_from(start_index)
+        if index == start_index:
+            logger.error("No room reachable from room %d.", start_index, extra={"category": "rooms"})
+            raise ValueError("No distant room available for the staircase.")
+        logger.debug("Farthest room from %d: %d (%d steps).", start_index, index, steps, extra={"category": "rooms"})
+        return self.rooms[index]
+
     def _carve_room(self, room, force=False):
-        logger.debug("Carving room: %s (force=%s)", room, force, extra={"category": "rooms"})
+        if log_enabled("rooms"):
+            logger.debug("Carving room: %s (force=%s)", room, force, extra={"category": "rooms"})
         if not force and not self.grid.is_space_free(room.x, room.y, room.width, room.height):
             raise ValueError(f"Nicht genügend Platz für den Raum {room}!")
 
         self.grid.place_room(room.x, room.y, room.width, room.height)
-        for y in range(room.y, room.y + room.height):
-            for x in range(room.x, room.x + room.width):
-                # Überspringen, wenn die Position STAIRS_DOWN ist
-                if self.dungeon[y][x] == TileType.STAIRS_DOWN:
-                    logger.warning("Skipping carving at (%d, %d) to avoid overwriting STAIRS_DOWN.", x, y, extra={"category": "rooms"})
-                    continue
-                self.dungeon[y][x] = TileType.FLOOR
 
-        logger.debug("Finished carving room: %s", room, extra={"category": "rooms"})
+        # Zeilenweise füllen; STAIRS_DOWN wird dabei nicht überschrieben
+        skipped = self.dungeon.fill_rect(room.x, room.y, room.width, room.height, TileType.FLOOR, keep=TileType.STAIRS_DOWN)
+        if skipped:
+            logger.warning("Skipped carving %d tile(s) in room %s to avoid overwriting STAIRS_DOWN.", skipped, room, extra={"category": "rooms"})
 
-    def _corridor_exists(self, start, end):
-        """Prüft, ob ein Korridor zwischen zwei Punkten existiert."""
-        return (start, end) in self.existing_corridors or (end, start) in self.existing_corridors 
+        if log_enabled("rooms"):
+            logger.debug("Finished carving room: %s", room, extra={"category": "rooms"})
 
     def get_start_room(self):
         """Gibt den Startraum zurück."""
@@ -345,14 +399,14 @@ class Dungeon:
 
     def debug_stairs(self):
         """Validiert die Position und Korrektheit der Treppen."""
-        stairs_up_count = sum(row.count(TileType.STAIRS_UP) for row in self.dungeon)
-        stairs_down_count = sum(row.count(TileType.STAIRS_DOWN) for row in self.dungeon)
+        stairs_up_count = self.dungeon.count(TileType.STAIRS_UP)
+        stairs_down_count = self.dungeon.count(TileType.STAIRS_DOWN)
         logger.info("STAIRS_UP count: %d", stairs_up_count, extra={"category": "summary"})
         logger.info("STAIRS_DOWN count: %d", stairs_down_count, extra={"category": "summary"})
 
         if self.staircase_down:
             x, y = self.staircase_down
-            if self.dungeon[y][x] != TileType.STAIRS_DOWN:
+            if self.dungeon.get(x, y) != TileType.STAIRS_DOWN:
                 logger.error("STAIRS_DOWN at (%d, %d) is missing or incorrect.", x, y, extra={"category": "stairs"})
             elif not self.is_walkable_tile(x, y):
                 logger.error("STAIRS_DOWN at (%d, %d) is not walkable.", x, y, extra={"category": "stairs"})
@@ -375,12 +429,12 @@ class Dungeon:
                 raise ValueError(f"No walkable position found in room {room} for {tile_type}.")
             x, y = walkable_position
 
-        self.dungeon[y][x] = tile_type
+        self.dungeon.set(x, y, tile_type)
         logger.info("Placed staircase (%s) at %s.", tile_type, (x, y), extra={"category": "stairs"})
 
         # Validierung hinzufügen
-        if self.dungeon[y][x] != tile_type:
-            logger.error("Failed to place staircase (%s) at %s. Tile is %s.", tile_type, (x, y), self.dungeon[y][x])
+        if self.dungeon.get(x, y) != tile_type:
+            logger.error("Failed to place staircase (%s) at %s. Tile is %s.", tile_type, (x, y), self.dungeon.get(x, y))
             raise ValueError(f"Failed to place staircase at {x}, {y}.")
         return (x, y)
 
@@ -395,6 +449,16 @@ class Dungeon:
     def get_dungeon(self):
         """Gibt die Dungeon-Datenstruktur zurück."""
         return self.dungeon
+
+    def get_view(self, center_x, center_y, width, height):
+        """
+        Gibt den darzustellenden Kartenausschnitt zurück: (Tile-Karte, Ursprung x, Ursprung y).
+        Eine Ebene fester Größe liefert immer die ganze Karte (siehe ChunkedWorld.get_view).
+        """
+        return self.dungeon, 0, 0
+
+    def update(self, tile_x, tile_y):
+        """Eine Ebene fester Größe ist vollständig generiert; nichts nachzuladen."""
     
     def save_state(self):
         """Speichert den aktuellen Zustand des Dungeons (für Levelwechsel)."""
@@ -404,30 +468,73 @@ class Dungeon:
             "staircase_up": self.staircase_up,
             "staircase_down": self.staircase_down,
             "start_room": self.start_room,
+            "room_graph": self.room_graph,
+            "explored": self.explored,
+            "key": self.level_key(),
             # Ergänze weitere Attribute wie Gegner oder Gegenstände hier
         }
 
+    def level_key(self):
+        """
+        Gibt den Schlüssel zurück, aus dem sich diese Ebene neu generieren lässt.
+        None, wenn das Dungeon ohne Seed (nicht reproduzierbar) erzeugt wurde.
+        """
+        if self.seed is None:
+            return None
+        return {"seed": self.seed, "level_index": self.level_index, "entry": self.entry_position}
+
+    @classmethod
+    def from_key(cls, key, **params):
+        """Generiert eine Ebene anhand ihres Schlüssels (siehe level_key) neu."""
+        params = dict(params, seed=key["seed"], level_index=key["level_index"])
+        dungeon = cls(**params)
+        if key["entry"] is None:
+            dungeon.generate(start_level=True)
+        else:
+            dungeon.generate_next_level(key["entry"])
+        return dungeon
+
+    @classmethod
+    def from_state(cls, state, **params):
+        """
+        Erzeugt ein Dungeon aus einem gespeicherten Zustand, ohne vorher eine leere Tile-Karte,
+        ein Belegungsraster oder eine leere ExploredMap anzulegen.
+        """
+        dungeon = cls(**params, tiles=state["dungeon"])
+        dungeon.load_state(state)
+        return dungeon
+
     def load_state(self, state):
         """Lädt einen gespeicherten Dungeon-Zustand."""
         self.dungeon = state["dungeon"]
+        self.width, self.height = self.dungeon.width, self.dungeon.height
         self.rooms = state["rooms"]
         self.staircase_up = state["staircase_up"]
         self.staircase_down = state["staircase_down"]
         self.start_room = state["start_room"]
+        self.room_graph = state.get("room_graph") or RoomGraph(len(self.rooms))
+        explored = state.get("explored")
+        self.explored = explored if explored is not None else ExploredMap(self.width, self.height)
+
+        key = state.get("key")
+        if key is not None:
+            self.seed, self.level_index, self.entry_position = key["seed"], key["level_index"], key["entry"]
         
 
     def is_walkable_tile(self, x, y):
         """Überprüft, ob das Tile an der gegebenen Position begehbar ist."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            tile = self.dungeon[y][x]
-            walkable = tile in [TileType.FLOOR, TileType.STAIRS_UP, TileType.STAIRS_DOWN]
-            logger.debug(
-                "Tile at (%d, %d) is %s", x, y,
-                "walkable" if walkable else "not walkable",
-                extra={"category": "tiles"}
-            )
+            tile = self.dungeon.get(x, y)
+            walkable = WALKABLE[tile] == 1
+            if log_enabled("tiles"):
+                logger.debug(
+                    "Tile at (%d, %d) is %s", x, y,
+                    "walkable" if walkable else "not walkable",
+                    extra={"category": "tiles"}
+                )
             return walkable
-        logger.debug("Tile at (%d, %d) is out of bounds.", x, y, extra={"category": "tiles"})
+        if log_enabled("tiles"):
+            logger.debug("Tile at (%d, %d) is out of bounds.", x, y, extra={"category": "tiles"})
         return False
     
     def _find_walkable_position_in_room(self, room):
@@ -435,7 +542,8 @@ class Dungeon:
         for y in range(room.y, room.y + room.height):
             for x in range(room.x, room.x + room.width):
                 if self.is_walkable_tile(x, y):
-                    logger.debug("Found walkable tile at (%d, %d) in room %s.", x, y, room, extra={"category": "tiles"})
+                    if log_enabled("tiles"):
+                        logger.debug("Found walkable tile at (%d, %d) in room %s.", x, y, room, extra={"category": "tiles"})
                     return (x, y)
         logger.warning("No walkable tiles found in room %s.", room, extra={"category": "tiles"})
         return None
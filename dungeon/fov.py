@@ -0,0 +1,231 @@
+import logging
+import math
+from .tile import OPAQUE, HIDDEN_TILE
+
+logger = logging.getLogger("DungeonGame")
+
+# Sichtweite des Spielers in Tiles
+FOV_RADIUS = 20
+
+# Multiplikatoren (xx, xy, yx, yy) der acht Oktanten für das Shadowcasting
+_OCTANTS = (
+    (1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+    (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1),
+)
+
+# Byte -> 8 Bytes mit 0/1 pro Bit (niedrigstes Bit = linkes Tile)
+_UNPACK = [bytes((byte >> bit) & 1 for bit in range(8)) for byte in range(256)]
+# 0/1 -> 0x00/0xFF, für die Maskierung per Ganzzahl-Operationen
+_MASK_BYTES = bytes((0x00, 0xFF)) + bytes(254)
+
+
+def apply_mask(tiles, mask, hidden=HIDDEN_TILE):
+    """
+    Ersetzt alle Tiles, deren Maske 0 ist, durch `hidden` (Maske: ein Byte 0/1 pro Tile).
+    Läuft über Ganzzahl-Operationen auf dem ganzen Puffer statt einer Schleife pro Tile.
+    """
+    n = len(tiles)
+    if not n:
+        return b""
+    keep = int.from_bytes(mask.translate(_MASK_BYTES), "big")
+    full = (1 << (8 * n)) - 1
+    fill = int.from_bytes(bytes((hidden,)) * n, "big")
+    return ((int.from_bytes(tiles, "big") & keep) | (fill & (full ^ keep))).to_bytes(n, "big")
+
+
+class ExploredMap:
+    """
+    Erkundete Tiles einer Ebene als Bitfeld (1 Bit pro Tile).
+
+    Jede Zeile beginnt an einer Byte-Grenze (`stride` Bytes pro Zeile), damit sich
+    Ausschnitte zeilenweise per Slice lesen lassen. `version` wird erhöht, sobald neue
+    Tiles erkundet werden. Bei 1000x1000 Tiles belegt die Karte rund 125 KB.
+    """
+
+    def __init__(self, width, height, bits=None):
+        self.width = width
+        self.height = height
+        self.stride = (width + 7) // 8
+        if bits is None:
+            bits = bytearray(self.stride * height)
+        elif len(bits) != self.stride * height:
+            raise ValueError(f"Explored bitset has {len(bits)} bytes, expected {self.stride * height}.")
+        self.bits = bytearray(bits)
+        self.version = 0
+
+    def is_explored(self, x, y):
+        return (self.bits[y * self.stride + (x >> 3)] >> (x & 7)) & 1 == 1
+
+    def mark(self, positions):
+        """Markiert Tiles (x, y) als erkundet. Rückgabe: Liste der neu erkundeten Tiles."""
+        bits, stride = self.bits, self.stride
+        new = []
+        for x, y in positions:
+            index = y * stride + (x >> 3)
+            bit = 1 << (x & 7)
+            if not bits[index] & bit:
+                bits[index] |= bit
+                new.append((x, y))
+        if new:
+            self.version += 1
+        return new
+
+    def count(self):
+        """Anzahl erkundeter Tiles."""
+        return int.from_bytes(self.bits, "little").bit_count()
+
+    def region_key(self, x, y, width, height):
+        """Gepackte Bits des Ausschnitts (für Vergleiche, ob sich dort etwas geändert hat)."""
+        bits, stride = self.bits, self.stride
+        first, last = x >> 3, (x + width + 7) >> 3
+        return b"".join(bits[row * stride + first:row * stride + last] for row in range(y, y + height))
+
+    def region_mask(self, x, y, width, height):
+        """Ausschnitt als Bytes mit 0/1 pro Tile (row-major), passend zu TileMap.region_bytes()."""
+        bits, stride, unpack = self.bits, self.stride, _UNPACK
+        first, last = x >> 3, (x + width + 7) >> 3
+        offset = x & 7
+        rows = []
+        for row in range(y, y + height):
+            start = row * stride
+            unpacked = b"".join([unpack[byte] for byte in bits[start + first:start + last]])
+            rows.append(unpacked[offset:offset + width])
+        return b"".join(rows)
+
+    def to_bytes(self):
+        return bytes(self.bits)
+
+
+class FieldOfView:
+    """
+    Sichtfeld des Spielers per rekursivem Shadowcasting über die Tile-Karte
+    (Sichtblockade aus der Tile-Registry, OPAQUE).
+
+    Neu berechnet wird nur, wenn der Spieler auf ein anderes Tile wechselt oder sich die
+    Karte ändert, nicht bei jedem Pixelschritt. Die Kosten hängen nur vom Radius ab, nicht
+    von der Kartengröße: `visible` enthält pro Tile die Berechnungsnummer (1..255), in der es
+    zuletzt gesehen wurde, sichtbar ist es bei Gleichheit mit `stamp`. Die Maske muss so nicht
+    geleert werden. Nur Tiles, die in der vorigen Berechnung nicht sichtbar waren, werden in
+    `explored` eingetragen; die davon neu erkundeten stehen in `newly_explored` (z. B. für
+    Minimap.reveal()).
+    """
+
+    def __init__(self, tilemap, explored=None, radius=FOV_RADIUS):
+        self.tilemap = tilemap
+        self.explored = explored
+        self.radius = radius
+        self.visible = bytearray(tilemap.width * tilemap.height)
+        self.stamp = 0
+        self.newly_explored = []
+        self.origin = None
+        self.revision = 0         # wird bei jeder Neuberechnung erhöht
+        self._version = None
+        self._opaque = None
+        self._candidates = []
+        # Halbe Breite des Sichtkreises pro Zeile
+        self._reach = [int((radius * radius - d * d) ** 0.5) for d in range(radius + 1)]
+
+    def is_visible(self, x, y):
+        return self.tilemap.in_bounds(x, y) and self.visible[y * self.tilemap.width + x] == self.stamp
+
+    def bounds(self):
+        """Rechteck (x, y, width, height) in Tiles, das alle sichtbaren Tiles enthält (geclippt)."""
+        cx, cy = self.origin
+        r = self.radius
+        x0, y0 = max(0, cx - r), max(0, cy - r)
+        x1, y1 = min(self.tilemap.width, cx + r + 1), min(self.tilemap.height, cy + r + 1)
+        return x0, y0, x1 - x0, y1 - y0
+
+    def visible_mask(self, x, y, width, height):
+        """Ausschnitt der Sichtbarkeit als Bytes mit 0/1 pro Tile (row-major)."""
+        visible, stride = self.visible, self.tilemap.width
+        table = bytearray(256)
+        table[self.stamp] = 1
+        return b"".join(visible[row * stride + x:row * stride + x + width] for row in range(y, y + height)).translate(table)
+
+    def update(self, x, y):
+        """Berechnet das Sichtfeld von Tile (x, y) aus. Rückgabe: True, wenn neu berechnet wurde."""
+        tilemap = self.tilemap
+        if self._version != tilemap.version:
+            self._opaque = tilemap.tiles.translate(OPAQUE)
+            self._version = tilemap.version
+        elif self.origin == (x, y):
+            return False
+
+        self._previous = self.stamp
+        self.stamp = self.stamp % 255 + 1
+        if self.stamp == 1:
+            # Nummern laufen über: alte Einträge könnten sonst als sichtbar gelten
+            self.visible[:] = bytes(len(self.visible))
+            self._previous = -1
+        self._candidates = []
+        self.origin = (x, y)
+        self.revision += 1
+
+        if tilemap.in_bounds(x, y):
+            self._mark(y * tilemap.width + x)
+            for xx, xy, yx, yy in _OCTANTS:
+                self._cast(1, 1.0, 0.0, xx, xy, yx, yy)
+
+        self.newly_explored = []
+        if self.explored is not None and self._candidates:
+            width = tilemap.width
+            self.newly_explored = self.explored.mark([(i % width, i // width) for i in self._candidates])
+        return True
+
+    def _mark(self, index):
+        visible = self.visible
+        if visible[index] != self.stamp:
+            if visible[index] != self._previous:
+                self._candidates.append(index)
+            visible[index] = self.stamp
+
+    def _cast(self, row, start, end, xx, xy, yx, yy):
+        """Ein Oktant ab Zeile `row` zwischen den Steigungen `start` und `end` (rekursiv bei Wänden)."""
+        if start < end:
+            return
+        cx, cy = self.origin
+        radius, reach = self.radius, self._reach
+        width, height = self.tilemap.width, self.tilemap.height
+        opaque, visible, stamp, previous = self._opaque, self.visible, self.stamp, self._previous
+        candidates = self._candidates
+        # Liegt der ganze Sichtkreis in der Karte, entfallen die Randprüfungen pro Tile
+        interior = radius <= cx < width - radius and radius <= cy < height - radius
+        # Index-Schrittweiten für dx und dy in diesem Oktanten
+        step_x, step_y = xx + yx * width, xy + yy * width
+        origin = cy * width + cx
+        new_start = start
+
+        for distance in range(row, radius + 1):
+            dy = -distance
+            row_index = origin + dy * step_y
+            # Tiles dieser Zeile zwischen den Steigungen start und end, begrenzt auf den Sichtkreis
+            # und den Oktanten (dx < -distance gehört schon zum Nachbaroktanten)
+            dx_min = max(-distance, -reach[distance], math.ceil(-start * (distance + 0.5) - 0.5))
+            dx_max = min(0, math.floor(0.5 - end * (distance - 0.5)))
+            blocked = False
+            for dx in range(dx_min, dx_max + 1):
+                if interior or (0 <= cx + dx * xx + dy * xy < width and 0 <= cy + dx * yx + dy * yy < height):
+                    index = row_index + dx * step_x
+                    seen = visible[index]
+                    if seen != stamp:
+                        if seen != previous:
+                            candidates.append(index)
+                        visible[index] = stamp
+                    is_opaque = opaque[index]
+                else:
+                    is_opaque = 1  # außerhalb der Karte: wie eine Wand
+
+                if blocked:
+                    if is_opaque:
+                        new_start = (dx + 0.5) / (dy - 0.5)  # rechte Kante dieses Tiles
+                        continue
+                    blocked = False
+                    start = new_start
+                elif is_opaque and distance < radius:
+                    # Wand: sichtbaren Bereich links davon rekursiv weiterverfolgen, dahinter abschatten
+                    blocked = True
+                    self._cast(distance + 1, start, (dx - 0.5) / (dy + 0.5), xx, xy, yx, yy)
+                    new_start = (dx + 0.5) / (dy - 0.5)
+            if blocked:
+                break
@@ -3,30 +3,46 @@ class Grid:
         """Initialisiere ein Raster mit den angegebenen Dimensionen."""
         self.width = width
         self.height = height
-        self.grid = [[0 for _ in range(width)] for _ in range(height)]
+
+        # Belegungsindex: pro Zeile eine Bitmaske (Bit x gesetzt = Zelle belegt).
+        # Ein Rechteck-Test kostet damit eine Ganzzahl-Operation pro Zeile statt einer pro Zelle.
+        self.row_masks = [0] * height
+
+    def is_rect_free(self, x, y, rect_width, rect_height):
+        """
+        Prüft in O(Zeilen), ob im Rechteck keine Zelle belegt ist.
+        Teile des Rechtecks außerhalb des Rasters werden ignoriert.
+        """
+        x_min, y_min = max(0, x), max(0, y)
+        x_max, y_max = min(self.width, x + rect_width), min(self.height, y + rect_height)
+        if x_min >= x_max or y_min >= y_max:
+            return True
+
+        mask = ((1 << (x_max - x_min)) - 1) << x_min
+        row_masks = self.row_masks
+        for i in range(y_min, y_max):
+            if row_masks[i] & mask:
+                return False
+        return True
 
     def is_space_free(self, x, y, room_width, room_height):
         """Prüfe, ob ein Raum mit (room_width x room_height) bei (x, y) platziert werden kann."""
-        if x + room_width > self.width or y + room_height > self.height:
+        if x < 0 or y < 0 or x + room_width > self.width or y + room_height > self.height:
             return False
-
-        for i in range(y, y + room_height):
-            for j in range(x, x + room_width):
-                if self.grid[i][j] == 1:
-                    return False
-        return True
+        return self.is_rect_free(x, y, room_width, room_height)
 
     def place_room(self, x, y, room_width, room_height):
         """Platziere einen Raum im Raster, wenn genügend Platz vorhanden ist."""
         if not self.is_space_free(x, y, room_width, room_height):
             raise ValueError("Nicht genügend Platz für den Raum!")
 
+        # Index inkrementell aktualisieren
+        mask = ((1 << room_width) - 1) << x
         for i in range(y, y + room_height):
-            for j in range(x, x + room_width):
-                self.grid[i][j] = 1
+            self.row_masks[i] |= mask
 
     def is_cell_occupied(self, x, y):
         """Überprüft, ob die Zelle (x, y) belegt ist."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.grid[y][x] == 1
+            return (self.row_masks[y] >> x) & 1 == 1
         raise ValueError(f"Position ({x}, {y}) liegt außerhalb des Rasters.")
@@ -0,0 +1,185 @@
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import zlib
+from collections import OrderedDict
+from utils.logger_config import logger
+
+logger = logging.getLogger("DungeonGame")
+
+
+class LevelStore:
+    """
+    Begrenzter Speicher für Ebenen-Zustände (save_state()) mit LRU-Verdrängung.
+
+    Nur die `capacity` zuletzt genutzten Ebenen bleiben im Speicher. Ältere Ebenen werden
+    komprimiert in `cache_dir` ausgelagert und beim Zugriff transparent wieder geladen.
+    Verhält sich nach außen wie eine Liste (len, [], append).
+    """
+
+    def __init__(self, capacity=8, cache_dir=None, regenerate=None):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1.")
+
+        self.capacity = capacity
+        self.cache_dir = cache_dir
+        self._owns_cache_dir = False
+
+        # Optionaler Fallback: Ebene aus ihrem Schlüssel neu generieren (falls die Datei fehlt)
+        self.regenerate = regenerate
+
+        # Optionale externe Quelle für noch nie geladene Ebenen (z. B. ein geöffneter Spielstand)
+        self._loader = None
+
+        self._resident = OrderedDict()  # Index -> Zustand, in LRU-Reihenfolge
+        self._spilled = {}              # Index -> Dateipfad
+        self._keys = {}                 # Index -> Ebenen-Schlüssel (siehe Dungeon.level_key)
+        self._count = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.regenerations = 0
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, index):
+        return 0 <= index < self._count
+
+    def __getitem__(self, index):
+        state = self.get(index)
+        if state is None:
+            raise IndexError(f"Level {index} is not available.")
+        return state
+
+    def __setitem__(self, index, state):
+        if not 0 <= index <= self._count:
+            raise IndexError(f"Level index {index} out of range.")
+        self.put(index, state)
+
+    def append(self, state):
+        """Hängt eine neue Ebene an."""
+        self.put(self._count, state)
+
+    def put(self, index, state):
+        """Speichert (oder ersetzt) den Zustand einer Ebene und markiert sie als zuletzt genutzt."""
+        self._resident[index] = state
+        self._resident.move_to_end(index)
+        self._keys[index] = state.get("key")
+        self._count = max(self._count, index + 1)
+
+        # Eine eventuell ausgelagerte Version ist jetzt veraltet
+        path = self._spilled.pop(index, None)
+        if path:
+            self._remove_file(path)
+
+        self._evict()
+
+    def attach(self, count, loader):
+        """
+        Meldet `count` Ebenen an, die erst bei Bedarf über loader(index) geladen werden.
+        So lässt sich ein Spielstand mit vielen Ebenen öffnen, ohne alle sofort zu erzeugen.
+        """
+        self._loader = loader
+        self._count = max(self._count, count)
+
+    def get(self, index, cache=True):
+        """
+        Gibt den Zustand einer Ebene zurück, lädt ihn bei Bedarf von der Festplatte.
+        Mit cache=False wird eine nachgeladene Ebene nicht in den Speicher übernommen
+        (z. B. beim Speichern aller Ebenen).
+        """
+        state = self._resident.get(index)
+        if state is not None:
+            self.hits += 1
+            self._resident.move_to_end(index)
+            return state
+
+        if index not in self:
+            return None
+
+        self.misses += 1
+        state = self._load(index)
+        if state is None or not cache:
+            return state
+
+        self._keys.setdefault(index, state.get("key"))
+        self._resident[index] = state
+        self._evict()
+        return state
+
+    def stats(self):
+        """Gibt die Zähler für Treffer, Fehlzugriffe und Verdrängungen zurück."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "regenerations": self.regenerations,
+            "resident": len(self._resident),
+            "spilled": len(self._spilled),
+        }
+
+    def close(self):
+        """Löscht alle ausgelagerten Dateien (und das Cache-Verzeichnis, falls selbst angelegt)."""
+        for path in self._spilled.values():
+            self._remove_file(path)
+        self._spilled.clear()
+        if self._owns_cache_dir and self.cache_dir:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self.cache_dir = None
+            self._owns_cache_dir = False
+
+    def _evict(self):
+        """Verdrängt die am längsten nicht genutzten Ebenen, bis die Kapazität eingehalten ist."""
+        while len(self._resident) > self.capacity:
+            index, state = self._resident.popitem(last=False)
+            self._spill(index, state)
+            self.evictions += 1
+
+    def _spill(self, index, state):
+        """Schreibt eine Ebene komprimiert in das Cache-Verzeichnis."""
+        if self.cache_dir is None:
+            self.cache_dir = tempfile.mkdtemp(prefix="dungeon_levels_")
+            self._owns_cache_dir = True
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        path = os.path.join(self.cache_dir, f"level_{index:05d}.bin")
+        with open(path, "wb") as fh:
+            fh.write(zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 1))
+        self._spilled[index] = path
+        logger.debug("Level %d spilled to %s.", index + 1, path, extra={"category": "levels"})
+
+    def _load(self, index):
+        """Lädt eine ausgelagerte Ebene; Fallback: Neugenerierung aus dem Schlüssel."""
+        path = self._spilled.get(index)
+        if path is not None:
+            try:
+                with open(path, "rb") as fh:
+                    state = pickle.loads(zlib.decompress(fh.read()))
+                logger.debug("Level %d reloaded from %s.", index + 1, path, extra={"category": "levels"})
+                return state
+            except (OSError, zlib.error, pickle.UnpicklingError) as e:
+                logger.error("Failed to reload level %d from %s: %s", index + 1, path, e, extra={"category": "errors"})
+                del self._spilled[index]
+
+        if self._loader is not None and index not in self._keys:
+            return self._loader(index)
+
+        key = self._keys.get(index)
+        if key is not None and self.regenerate is not None:
+            self.regenerations += 1
+            logger.info("Regenerating level %d from its key.", index + 1, extra={"category": "levels"})
+            return self.regenerate(key)
+
+        logger.error("Level %d is neither resident nor on disk.", index + 1, extra={"category": "errors"})
+        return None
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,119 @@
+import logging
+from .tile import OPAQUE
+
+logger = logging.getLogger("DungeonGame")
+
+
+class LineOfSight:
+    """
+    Sichtlinien-Abfragen "kann A B sehen?" zwischen Tiles, z. B. für Gegner-Aggro,
+    Fernkampf-Fähigkeiten und Fallen.
+
+    Jede Abfrage läuft per Bresenham über die Sichtblockade der Karte (die Tiles einmal mit
+    OPAQUE übersetzt, neu nur bei geänderter TileMap.version), mit Index-Schritten statt
+    Koordinaten; rein waagrechte und senkrechte Linien werden per Slice durchsucht.
+    Ergebnisse werden pro Frame nach (Start, Ziel) gemerkt, da viele Gegner auf denselben
+    Tiles stehen und dasselbe Ziel haben. Der Besitzer ruft begin_frame() einmal pro Frame auf;
+    alle Nutzer dieses Frames teilen sich den Cache.
+
+    Ergebnis einer Abfrage: (sichtbar, erstes blockierendes Tile als (x, y) oder None).
+    Start- und Ziel-Tile selbst blockieren nicht (eine Wand als Ziel ist also sichtbar).
+    """
+
+    def __init__(self, tilemap):
+        self.tilemap = tilemap
+        self._opaque = None
+        self._version = None
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def begin_frame(self):
+        """Verwirft die gemerkten Ergebnisse des vorigen Frames."""
+        self._cache.clear()
+
+    def _sync(self):
+        tilemap = self.tilemap
+        if self._version != tilemap.version:
+            self._opaque = tilemap.tiles.translate(OPAQUE)
+            self._version = tilemap.version
+            self._cache.clear()
+
+    def check(self, source, target):
+        """Sichtlinie von Tile `source` zu Tile `target`. Rückgabe: (sichtbar, Blocker oder None)."""
+        self._sync()
+        key = (source[0], source[1], target[0], target[1])
+        result = self._cache.get(key)
+        if result is None:
+            self.misses += 1
+            result = self._cache[key] = self._trace(*key)
+        else:
+            self.hits += 1
+        return result
+
+    def check_batch(self, pairs):
+        """Löst eine Liste von (source, target)-Paaren auf. Rückgabe: Liste von (sichtbar, Blocker oder None)."""
+        self._sync()
+        cache, trace = self._cache, self._trace
+        results = []
+        misses = 0
+        for (sx, sy), (tx, ty) in pairs:
+            key = (sx, sy, tx, ty)
+            result = cache.get(key)
+            if result is None:
+                misses += 1
+                result = cache[key] = trace(sx, sy, tx, ty)
+            results.append(result)
+        self.misses += misses
+        self.hits += len(results) - misses
+        return results
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "cached": len(self._cache),
+        }
+
+    def _trace(self, sx, sy, tx, ty):
+        width, height = self.tilemap.width, self.tilemap.height
+        if not (0 <= sx < width and 0 <= sy < height and 0 <= tx < width and 0 <= ty < height):
+            return False, None
+        opaque = self._opaque
+        start, end = sy * width + sx, ty * width + tx
+        dx, dy = abs(tx - sx), abs(ty - sy)
+
+        if dx <= 1 and dy <= 1:
+            # Gleiches oder benachbartes Tile: nichts dazwischen
+            return True, None
+        if dy == 0 or dx == 0:
+            # Gerade Linie: Tiles dazwischen als ein Slice durchsuchen (auch rückwärts)
+            step = 1 if dy == 0 else width
+            if end < start:
+                step = -step
+            first = opaque[start + step:end:step].find(1)
+            if first < 0:
+                return True, None
+            index = start + step * (first + 1)
+            return False, (index % width, index // width)
+
+        # Bresenham in Index-Schritten; `major` ist die schnelle Achse
+        step_x = 1 if tx > sx else -1
+        step_y = width if ty > sy else -width
+        if dx >= dy:
+            major, minor, step_major, step_minor = dx, dy, step_x, step_y
+        else:
+            major, minor, step_major, step_minor = dy, dx, step_y, step_x
+        error = major // 2
+        index = start
+        for _ in range(major - 1):
+            index += step_major
+            error -= minor
+            if error < 0:
+                index += step_minor
+                error += major
+            if opaque[index]:
+                return False, (index % width, index // width)
+        return True, None
@@ -0,0 +1,326 @@
+import heapq
+import logging
+from array import array
+from collections import deque
+from .tile import WALKABLE
+
+logger = logging.getLogger("DungeonGame")
+
+# Kosten in ganzen Zahlen: gerader Schritt 10, diagonaler Schritt 14 (≈ 10 * √2)
+ORTHOGONAL_COST = 10
+DIAGONAL_COST = 14
+
+UNREACHABLE = -1
+
+_ORTHOGONAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_DIAGONAL = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def manhattan_cost(dx, dy):
+    """Heuristik für Bewegung ohne Diagonalen (dx, dy als Beträge)."""
+    return ORTHOGONAL_COST * (dx + dy)
+
+
+def octile_cost(dx, dy):
+    """Heuristik für Bewegung mit Diagonalen (dx, dy als Beträge)."""
+    return ORTHOGONAL_COST * (dx + dy) + (DIAGONAL_COST - 2 * ORTHOGONAL_COST) * min(dx, dy)
+
+
+class _Grid:
+    """
+    Gemeinsame Grundlage für A* und Flow-Fields: die Begehbarkeit der Karte als Bytes
+    (per bytes.translate aus der Tile-Registry), neu bestimmt nur bei geänderter TileMap.version.
+    """
+
+    def __init__(self, tilemap, diagonal):
+        self.tilemap = tilemap
+        self.diagonal = diagonal
+        self.width = tilemap.width
+        self.height = tilemap.height
+        self.walkable = None
+        self.version = None
+
+    def _sync(self):
+        """Aktualisiert die Begehbarkeit; Rückgabe True, wenn sich die Karte geändert hat."""
+        if self.version == self.tilemap.version:
+            return False
+        self.walkable = self.tilemap.tiles.translate(WALKABLE)
+        self.version = self.tilemap.version
+        return True
+
+    def is_walkable(self, x, y):
+        self._sync()
+        return 0 <= x < self.width and 0 <= y < self.height and self.walkable[y * self.width + x] == 1
+
+    def _neighbours(self, index):
+        """Begehbare Nachbarn als (Index, Kosten); Diagonalen nicht über Ecken von Wänden."""
+        width, height, walkable = self.width, self.height, self.walkable
+        y, x = divmod(index, width)
+        for dx, dy in _ORTHOGONAL:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and walkable[ny * width + nx]:
+                yield ny * width + nx, ORTHOGONAL_COST
+        if not self.diagonal:
+            return
+        for dx, dy in _DIAGONAL:
+            nx, ny = x + dx, y + dy
+            if (0 <= nx < width and 0 <= ny < height and walkable[ny * width + nx]
+                    and walkable[y * width + nx] and walkable[ny * width + x]):
+                yield ny * width + nx, DIAGONAL_COST
+
+
+class PathFinder(_Grid):
+    """
+    A* für einzelne Wegabfragen auf einer TileMap.
+
+    Kostenfelder, Vorgänger und die Besuchsmarken liegen in Arrays in Kartengröße, die
+    zwischen den Abfragen wiederverwendet werden: statt sie zu leeren, bekommt jede Suche
+    eine neue Generationsnummer, ältere Einträge gelten als unbesucht. Auch die Liste
+    der offenen Knoten (Heap) wird wiederverwendet.
+    """
+
+    def __init__(self, tilemap, diagonal=True):
+        super().__init__(tilemap, diagonal)
+        self.heuristic = octile_cost if diagonal else manhattan_cost
+        size = self.width * self.height
+        self._cost = array("i", [0]) * size
+        self._parent = array("i", [-1]) * size
+        self._seen = array("I", [0]) * size  # Generationsnummer der letzten Suche, die das Tile erreicht hat
+        self._generation = 0
+        self._open = []
+
+        self.searches = 0
+        self.expanded = 0
+
+    def find_path(self, start, goal, max_expansions=None):
+        """
+        Kürzester Weg von `start` nach `goal` (Tile-Koordinaten).
+        Rückgabe: Liste der Tiles ohne Start, mit Ziel ([] wenn start == goal),
+        None wenn das Ziel nicht erreichbar ist (oder max_expansions überschritten wird).
+        """
+        self._sync()
+        if not (self.is_walkable(*start) and self.is_walkable(*goal)):
+            return None
+        if start == goal:
+            return []
+
+        self.searches += 1
+        self._generation += 1
+        generation, cost, parent, seen = self._generation, self._cost, self._parent, self._seen
+        width, heuristic = self.width, self.heuristic
+        goal_x, goal_y = goal
+        start_index = start[1] * width + start[0]
+        goal_index = goal_y * width + goal_x
+
+        open_heap = self._open
+        open_heap.clear()
+        seen[start_index] = generation
+        cost[start_index] = 0
+        parent[start_index] = -1
+        heapq.heappush(open_heap, (heuristic(abs(start[0] - goal_x), abs(start[1] - goal_y)), 0, start_index))
+
+        expanded = 0
+        while open_heap:
+            _, current_cost, current = heapq.heappop(open_heap)
+            if current_cost != cost[current]:
+                continue  # veralteter Heap-Eintrag
+            if current == goal_index:
+                self.expanded += expanded
+                return self._reconstruct(goal_index)
+
+            expanded += 1
+            if max_expansions is not None and expanded > max_expansions:
+                break
+
+            for neighbour, step_cost in self._neighbours(current):
+                new_cost = current_cost + step_cost
+                if seen[neighbour] == generation and cost[neighbour] <= new_cost:
+                    continue
+                seen[neighbour] = generation
+                cost[neighbour] = new_cost
+                parent[neighbour] = current
+                ny, nx = divmod(neighbour, width)
+                heapq.heappush(open_heap, (new_cost + heuristic(abs(nx - goal_x), abs(ny - goal_y)), new_cost, neighbour))
+
+        self.expanded += expanded
+        return None
+
+    def _reconstruct(self, index):
+        width, parent = self.width, self._parent
+        path = []
+        while parent[index] != -1:
+            path.append((index % width, index // width))
+            index = parent[index]
+        path.reverse()
+        return path
+
+
+class FlowField(_Grid):
+    """
+    Distanzfeld (Dijkstra) zu einem Ziel, z. B. dem Spieler, geteilt von allen Gegnern.
+
+    Jeder Gegner folgt einfach dem Nachbar-Tile mit der kleinsten Distanz (next_step()),
+    die Kosten sind damit unabhängig von der Zahl der Gegner. Neu berechnet wird nur,
+    wenn das Ziel auf ein anderes Tile wechselt oder sich die Karte ändert.
+    Mit `max_cost` endet die Ausbreitung bei dieser Distanz (weiter entfernt: UNREACHABLE).
+    """
+
+    def __init__(self, tilemap, diagonal=True, max_cost=None):
+        super().__init__(tilemap, diagonal)
+        self.max_cost = max_cost
+        self.distance = array("i", [UNREACHABLE]) * (self.width * self.height)
+        self.goal = None
+        self.recomputes = 0
+
+    def update(self, goal_x, goal_y):
+        """Richtet das Feld auf das Ziel-Tile aus. Rückgabe: True, wenn neu berechnet wurde."""
+        changed = self._sync()
+        if not changed and self.goal == (goal_x, goal_y):
+            return False
+        self.goal = (goal_x, goal_y)
+        self._compute(goal_x, goal_y)
+        self.recomputes += 1
+        return True
+
+    def _compute(self, goal_x, goal_y):
+        distance = self.distance
+        distance[:] = array("i", [UNREACHABLE]) * len(distance)
+        if not self.is_walkable(goal_x, goal_y):
+            return
+
+        max_cost = self.max_cost
+        goal_index = goal_y * self.width + goal_x
+        distance[goal_index] = 0
+
+        if not self.diagonal:
+            # Einheitliche Kosten: Breitensuche genügt
+            queue = deque((goal_index,))
+            while queue:
+                current = queue.popleft()
+                new_cost = distance[current] + ORTHOGONAL_COST
+                if max_cost is not None and new_cost > max_cost:
+                    continue
+                for neighbour, _ in self._neighbours(current):
+                    if distance[neighbour] == UNREACHABLE:
+                        distance[neighbour] = new_cost
+                        queue.append(neighbour)
+            return
+
+        # Nachbarn inline statt über _neighbours(): das ist die heiße Schleife bei jedem Tile-Wechsel
+        width, height, walkable = self.width, self.height, self.walkable
+        heappush, heappop = heapq.heappush, heapq.heappop
+        limit = max_cost if max_cost is not None else float("inf")
+        heap = [(0, goal_index)]
+        while heap:
+            current_cost, current = heappop(heap)
+            if current_cost != distance[current]:
+                continue
+            y, x = divmod(current, width)
+            for dx, dy in _ORTHOGONAL:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbour = ny * width + nx
+                new_cost = current_cost + ORTHOGONAL_COST
+                if walkable[neighbour] and new_cost <= limit and (
+                        distance[neighbour] == UNREACHABLE or new_cost < distance[neighbour]):
+                    distance[neighbour] = new_cost
+                    heappush(heap, (new_cost, neighbour))
+            for dx, dy in _DIAGONAL:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbour = ny * width + nx
+                new_cost = current_cost + DIAGONAL_COST
+                if (walkable[neighbour] and walkable[y * width + nx] and walkable[ny * width + x]
+                        and new_cost <= limit
+                        and (distance[neighbour] == UNREACHABLE or new_cost < distance[neighbour])):
+                    distance[neighbour] = new_cost
+                    heappush(heap, (new_cost, neighbour))
+
+    def get(self, x, y):
+        """Distanz vom Tile (x, y) zum Ziel (UNREACHABLE außerhalb der Karte oder ohne Weg)."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return UNREACHABLE
+        return self.distance[y * self.width + x]
+
+    def next_step(self, x, y):
+        """Nächstes Tile in Richtung Ziel oder None (am Ziel oder ohne Weg)."""
+        if self.get(x, y) <= 0:
+            return None
+        distance, width = self.distance, self.width
+        best, best_distance = None, self.get(x, y)
+        for neighbour, _ in self._neighbours(y * width + x):
+            d = distance[neighbour]
+            if d != UNREACHABLE and d < best_distance:
+                best, best_distance = neighbour, d
+        if best is None:
+            return None
+        return best % width, best // width
+
+
+class RoomPaths:
+    """
+    Wege zwischen Räumen eines Dungeons, abgeleitet aus dem Korridor-Graphen (room_graph).
+
+    Die Raumfolge ergibt sich per Breitensuche im Graphen, jedes Teilstück zwischen zwei
+    verbundenen Räumen (Mittelpunkt zu Mittelpunkt) per A*. Teilstücke und fertige Wege
+    werden pro Ebene zwischengespeichert; ändert sich die Karte (TileMap.version) oder der
+    Graph, wird der Cache verworfen.
+    """
+
+    def __init__(self, dungeon, diagonal=True):
+        self.dungeon = dungeon
+        self.pathfinder = PathFinder(dungeon.dungeon, diagonal)
+        self._edges = {}   # (i, j) mit i < j -> Tile-Weg von Raum i nach Raum j
+        self._paths = {}   # (a, b) -> Tile-Weg von Raum a nach Raum b
+        self._version = None
+        self._graph = None
+
+    def _validate(self):
+        tilemap, graph = self.dungeon.dungeon, self.dungeon.room_graph
+        if self._version != tilemap.version or self._graph is not graph:
+            self._edges.clear()
+            self._paths.clear()
+            self._version = tilemap.version
+            self._graph = graph
+
+    def invalidate(self):
+        self._version = None
+
+    def room_route(self, a, b):
+        """Raumfolge von Raum a nach Raum b (inklusive beider) oder None ohne Verbindung."""
+        return self.dungeon.room_graph.route(a, b)
+
+    def _edge_path(self, i, j):
+        key = (i, j) if i < j else (j, i)
+        if key not in self._edges:
+            rooms = self.dungeon.rooms
+            self._edges[key] = self.pathfinder.find_path(rooms[key[0]].center(), rooms[key[1]].center())
+        path = self._edges[key]
+        if path is None or i < j:
+            return path
+        # Rückweg: Tiles in umgekehrter Reihenfolge, ohne Start (Mittelpunkt von i), mit Ziel
+        return path[-2::-1] + [self.dungeon.rooms[j].center()]
+
+    def path(self, a, b):
+        """Tile-Weg vom Mittelpunkt von Raum a zum Mittelpunkt von Raum b (ohne Start) oder None."""
+        self._validate()
+        key = (a, b)
+        if key in self._paths:
+            return self._paths[key]
+
+        route = self.room_route(a, b)
+        path = None
+        if route is not None:
+            path = []
+            for i, j in zip(route, route[1:]):
+                segment = self._edge_path(i, j)
+                if segment is None:
+                    logger.warning("No tile path between connected rooms %d and %d.", i, j,
+                                   extra={"category": "pathfinding"})
+                    path = None
+                    break
+                path.extend(segment)
+        self._paths[key] = path
+        return path
@@ -0,0 +1,78 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from .dungeon import Dungeon
+from utils.logger_config import logger
+
+logger = logging.getLogger("DungeonGame")
+
+
+def generate_level_state(params, level_index, staircase_position):
+    """Generiert eine Folgeebene ab der Treppenposition und gibt ihren save_state() zurück."""
+    dungeon = Dungeon(**params, level_index=level_index)
+    dungeon.generate_next_level(staircase_position)
+    return dungeon.save_state()
+
+
+class LevelPrefetcher:
+    """
+    Generiert die nächste Dungeon-Ebene spekulativ in einem Hintergrund-Thread,
+    sobald die aktuelle Ebene betreten wird.
+
+    Beim Treppenwechsel liefert take() den fertigen save_state() aus; ist die
+    Generierung noch nicht gestartet, erzeugt der Aufrufer die Ebene selbst (synchron).
+    """
+
+    def __init__(self, params):
+        self.params = params
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LevelPrefetch")
+        self._key = None
+        self._future = None
+
+    def schedule(self, level_index, staircase_position):
+        """Startet die Generierung der Ebene `level_index` ab `staircase_position`."""
+        key = (level_index, staircase_position)
+        if self._key == key:
+            return
+
+        self.cancel()
+        self._key = key
+        self._future = self._executor.submit(generate_level_state, self.params, level_index, staircase_position)
+        logger.debug("Prefetching level %d from staircase %s.", level_index + 1, staircase_position, extra={"category": "levels"})
+
+    def take(self, level_index, staircase_position):
+        """
+        Gibt den vorab generierten Zustand für (level_index, staircase_position) zurück.
+        Rückgabe None, wenn nichts Passendes vorbereitet ist (Aufrufer generiert synchron).
+        """
+        key = (level_index, staircase_position)
+        if self._key != key:
+            return None
+
+        future = self._future
+        self._key, self._future = None, None
+
+        # Noch nicht gestartet: abbrechen und synchron generieren lassen.
+        # Läuft die Generierung bereits, ist Warten günstiger als ein Neustart.
+        if future.cancel():
+            logger.info("Prefetch for level %d not started yet, generating synchronously.", level_index + 1, extra={"category": "levels"})
+            return None
+
+        try:
+            state = future.result()
+        except Exception as e:
+            logger.error("Prefetch for level %d failed: %s", level_index + 1, e, extra={"category": "errors"})
+            return None
+
+        logger.info("Using prefetched level %d.", level_index + 1, extra={"category": "levels"})
+        return state
+
+    def cancel(self):
+        """Verwirft eine ausstehende Vorab-Generierung."""
+        if self._future is not None:
+            self._future.cancel()
+        self._key, self._future = None, None
+
+    def shutdown(self):
+        """Beendet den Hintergrund-Thread (laufende Generierung wird abgewartet)."""
+        self.cancel()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,176 @@
+import math
+
+
+def manhattan(a, b):
+    """Manhattan-Distanz zwischen zwei Punkten."""
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def nearest_neighbour_edges(centers, k=8):
+    """
+    Liefert einen dünnen Kandidatengraphen: jede Position wird mit ihren k nächsten
+    Nachbarn (Manhattan-Distanz) verbunden.
+
+    Die Nachbarn werden über ein gleichmäßiges Raster (Buckets) um die Position gesucht,
+    der Aufwand liegt damit bei etwa O(n * k) statt O(n²).
+    Rückgabe: sortierte Liste von (Distanz, i, j) mit i < j.
+    """
+    n = len(centers)
+    if n < 2:
+        return []
+
+    min_x = min(c[0] for c in centers)
+    min_y = min(c[1] for c in centers)
+    max_x = max(c[0] for c in centers)
+    max_y = max(c[1] for c in centers)
+
+    # Zellgröße so wählen, dass im Mittel etwa zwei Punkte in einer Zelle liegen
+    area = max(1, (max_x - min_x + 1) * (max_y - min_y + 1))
+    cell_size = max(1, int(math.sqrt(2 * area / n)))
+    cols = (max_x - min_x) // cell_size + 1
+    rows = (max_y - min_y) // cell_size + 1
+
+    buckets = {}
+    cells = []
+    for index, (x, y) in enumerate(centers):
+        cell = ((x - min_x) // cell_size, (y - min_y) // cell_size)
+        cells.append(cell)
+        buckets.setdefault(cell, []).append(index)
+
+    k = min(k, n - 1)
+    max_ring = max(cols, rows)
+    edges = set()
+
+    for i, (cx, cy) in enumerate(cells):
+        origin = centers[i]
+        found = []
+        ring = 0
+        while ring <= max_ring:
+            # Alle Zellen auf dem Rand des Quadrats mit Radius `ring` besuchen
+            for gy in range(cy - ring, cy + ring + 1):
+                if not 0 <= gy < rows:
+                    continue
+                step = 1 if gy in (cy - ring, cy + ring) else 2 * ring
+                for gx in range(cx - ring, cx + ring + 1, max(1, step)):
+                    for j in buckets.get((gx, gy), ()):
+                        if j != i:
+                            found.append((manhattan(origin, centers[j]), j))
+
+            # Abbruch, sobald kein Punkt außerhalb des Rings näher sein kann
+            if len(found) >= k:
+                found.sort()
+                if found[k - 1][0] <= ring * cell_size:
+                    break
+            ring += 1
+
+        found.sort()
+        for dist, j in found[:k]:
+            edges.add((dist, min(i, j), max(i, j)))
+
+    return sorted(edges)
+
+
+def all_pair_edges(centers):
+    """Vollständiger Kandidatengraph (alle Paare), sortiert nach Distanz."""
+    return sorted(
+        (manhattan(centers[i], centers[j]), i, j)
+        for i in range(len(centers))
+        for j in range(i + 1, len(centers))
+    )
+
+
+class RoomGraph:
+    """
+    Adjazenzlisten der Räume eines Dungeons: welcher Raum (Index in `rooms`) ist über
+    einen Korridor mit welchem verbunden. Wird in Dungeon._connect_rooms aufgebaut.
+
+    Grad, Blatträume, Entfernungen (in Korridor-Schritten), der am weitesten entfernte
+    Raum und der Durchmesser lassen sich damit in O(Räume + Korridore) bestimmen.
+    """
+
+    def __init__(self, room_count=0):
+        self.adjacency = [[] for _ in range(room_count)]
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """Erzeugt einen Graphen aus gespeicherten Adjazenzlisten (z. B. aus einem Spielstand)."""
+        graph = cls()
+        graph.adjacency = [list(neighbours) for neighbours in adjacency]
+        return graph
+
+    def __len__(self):
+        return len(self.adjacency)
+
+    def add_edge(self, i, j):
+        """Verbindet die Räume i und j; Rückgabe False, falls die Verbindung schon existiert."""
+        if i == j or j in self.adjacency[i]:
+            return False
+        self.adjacency[i].append(j)
+        self.adjacency[j].append(i)
+        return True
+
+    def has_edge(self, i, j):
+        return j in self.adjacency[i]
+
+    def neighbours(self, i):
+        return self.adjacency[i]
+
+    def degree(self, i):
+        return len(self.adjacency[i])
+
+    def edge_count(self):
+        return sum(len(neighbours) for neighbours in self.adjacency) // 2
+
+    def leaves(self):
+        """Indizes aller Räume mit genau einer Verbindung (Sackgassen)."""
+        return [i for i, neighbours in enumerate(self.adjacency) if len(neighbours) == 1]
+
+    def distances(self, start):
+        """Breitensuche ab `start`: Korridor-Schritte zu jedem Raum (-1 = nicht erreichbar)."""
+        dist = [-1] * len(self.adjacency)
+        dist[start] = 0
+        queue = [start]
+        for current in queue:
+            for neighbour in self.adjacency[current]:
+                if dist[neighbour] < 0:
+                    dist[neighbour] = dist[current] + 1
+                    queue.append(neighbour)
+        return dist
+
+    def route(self, start, goal):
+        """Breitensuche: Raumfolge von `start` nach `goal` (inklusive beider) oder None ohne Verbindung."""
+        parent = [-1] * len(self.adjacency)
+        parent[start] = start
+        queue = [start]
+        for current in queue:
+            if current == goal:
+                break
+            for neighbour in self.adjacency[current]:
+                if parent[neighbour] < 0:
+                    parent[neighbour] = current
+                    queue.append(neighbour)
+        if parent[goal] < 0:
+            return None
+
+        route = [goal]
+        while route[-1] != start:
+            route.append(parent[route[-1]])
+        route.reverse()
+        return route
+
+    def farthest_from(self, start):
+        """Gibt (Raum-Index, Schritte) des vom Raum `start` am weitesten entfernten Raums zurück."""
+        dist = self.distances(start)
+        farthest = max(range(len(dist)), key=dist.__getitem__)
+        return farthest, dist[farthest]
+
+    def diameter(self, start=0):
+        """
+        Längster kürzester Weg als (Raum a, Raum b, Schritte) per doppelter Breitensuche.
+        Exakt für Bäume (reiner MST); mit zusätzlichen Schleifen eine untere Schranke.
+        """
+        if not self.adjacency:
+            return None, None, 0
+        a, _ = self.farthest_from(start)
+        b, length = self.farthest_from(a)
+        return a, b, length
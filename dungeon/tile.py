@@ -1,5 +1,66 @@
+from utils.config import COLORS
+
+
 class TileType:
     WALL = 1
     FLOOR = 0
     STAIRS_UP = 3
     STAIRS_DOWN = 4
+
+
+# Tiles werden als Bytes in der TileMap gespeichert: höchstens 256 Tile-Typen
+MAX_TILE_TYPES = 256
+
+BACKGROUND_COLOR = COLORS.get("BACKGROUND_COLOR", (0, 0, 0))
+
+# Reservierte ID für unerkundete Tiles (Fog of War), wird nie registriert: Hintergrundfarbe, blockiert die Sicht
+HIDDEN_TILE = MAX_TILE_TYPES - 1
+
+# Eigenschaftstabellen, Index = Tile-ID. Nachschlagen ist ein einfacher Listenzugriff;
+# WALKABLE und OPAQUE sind Bytetabellen und lassen sich auch direkt mit
+# bytes.translate() auf ganze Tile-Zeilen anwenden.
+TILE_NAMES = [None] * MAX_TILE_TYPES
+WALKABLE = bytearray(MAX_TILE_TYPES)          # 1 = begehbar
+OPAQUE = bytearray(b"\x01" * MAX_TILE_TYPES)  # 1 = blockiert die Sicht (unbekannte Tiles: ja)
+TILE_COLORS = [BACKGROUND_COLOR] * MAX_TILE_TYPES
+MINIMAP_COLORS = [BACKGROUND_COLOR] * MAX_TILE_TYPES
+REMEMBERED_COLORS = [BACKGROUND_COLOR] * MAX_TILE_TYPES  # erkundet, aber gerade nicht sichtbar (Fog of War)
+TILE_TRIGGERS = [None] * MAX_TILE_TYPES       # Aktion beim Benutzen (z. B. "stairs_up"), None = keine
+
+
+def register_tile(tile_id, name, walkable, opaque, color, minimap_color=None, trigger=None, remembered_color=None):
+    """
+    Registriert einen Tile-Typ mit seinen Eigenschaften.
+    Neue Tile-Typen (Fallen, Türen, Wasser, ...) werden nur hier eingetragen.
+    """
+    if not 0 <= tile_id < MAX_TILE_TYPES:
+        raise ValueError(f"Tile id {tile_id} out of range.")
+    if tile_id == HIDDEN_TILE:
+        raise ValueError(f"Tile id {tile_id} is reserved for unexplored tiles.")
+    if TILE_NAMES[tile_id] is not None and TILE_NAMES[tile_id] != name:
+        raise ValueError(f"Tile id {tile_id} is already registered as {TILE_NAMES[tile_id]}.")
+
+    TILE_NAMES[tile_id] = name
+    WALKABLE[tile_id] = 1 if walkable else 0
+    OPAQUE[tile_id] = 1 if opaque else 0
+    TILE_COLORS[tile_id] = color
+    MINIMAP_COLORS[tile_id] = minimap_color if minimap_color is not None else color
+    # Standard: halbe Helligkeit
+    REMEMBERED_COLORS[tile_id] = remembered_color if remembered_color is not None else tuple(c // 2 for c in color)
+    TILE_TRIGGERS[tile_id] = trigger
+
+
+def is_walkable(tile_id):
+    return WALKABLE[tile_id] == 1
+
+
+def is_opaque(tile_id):
+    return OPAQUE[tile_id] == 1
+
+
+register_tile(TileType.FLOOR, "floor", walkable=True, opaque=False, color=COLORS["FLOOR_COLOR"])
+register_tile(TileType.WALL, "wall", walkable=False, opaque=True, color=COLORS["WALL_COLOR"])
+register_tile(TileType.STAIRS_UP, "stairs_up", walkable=True, opaque=False,
+              color=COLORS["STAIRS_UP_COLOR"], trigger="stairs_up")
+register_tile(TileType.STAIRS_DOWN, "stairs_down", walkable=True, opaque=False,
+              color=COLORS["STAIRS_DOWN_COLOR"], trigger="stairs_down")
@@ -0,0 +1,114 @@
+class TileMap:
+    """
+    Kompakte Tile-Karte auf Basis eines zusammenhängenden bytearray (row-major, 1 Byte pro Tile).
+
+    Ersetzt die bisherige Liste von Listen. Der Zugriff über dungeon[y][x] bleibt
+    kompatibel: Eine Zeile wird als memoryview auf den gemeinsamen Puffer geliefert,
+    Schreibzugriffe über die Zeile landen also direkt in der Karte.
+
+    `version` wird bei jeder Änderung über die Methoden erhöht (Cache-Invalidierung,
+    z. B. im Renderer). Wer direkt in `tiles` oder eine Zeile schreibt, erhöht `version` selbst.
+    """
+
+    def __init__(self, width, height, fill=0, tiles=None):
+        if width <= 0 or height <= 0:
+            raise ValueError("Width and height must be positive.")
+
+        if tiles is None:
+            tiles = bytearray((fill,)) * (width * height)
+        elif len(tiles) != width * height:
+            raise ValueError(f"Tile buffer has {len(tiles)} bytes, expected {width * height}.")
+
+        self.width = width
+        self.height = height
+        self.tiles = tiles
+        self.version = 0
+
+    def __len__(self):
+        """Anzahl der Zeilen (kompatibel zu len(dungeon))."""
+        return self.height
+
+    def __getitem__(self, y):
+        """Gibt die Zeile y als beschreibbare Sicht (memoryview) auf den Puffer zurück."""
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError(f"Row {y} out of range.")
+        start = y * self.width
+        return memoryview(self.tiles)[start:start + self.width]
+
+    def __iter__(self):
+        """Iteriert zeilenweise über die Karte."""
+        view = memoryview(self.tiles)
+        for start in range(0, self.width * self.height, self.width):
+            yield view[start:start + self.width]
+
+    def __repr__(self):
+        return f"TileMap(width={self.width}, height={self.height})"
+
+    def in_bounds(self, x, y):
+        """Prüft, ob (x, y) innerhalb der Karte liegt."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x, y):
+        """Gibt das Tile an (x, y) zurück."""
+        return self.tiles[y * self.width + x]
+
+    def set(self, x, y, value):
+        """Setzt das Tile an (x, y)."""
+        self.tiles[y * self.width + x] = value
+        self.version += 1
+
+    def fill_rect(self, x, y, width, height, value, keep=None):
+        """
+        Füllt ein Rechteck mit einem Tile-Wert.
+        Tiles mit dem Wert `keep` (z. B. eine Treppe) werden nicht überschrieben.
+        Gibt die Anzahl der übersprungenen Tiles zurück.
+        """
+        run = bytes((value,)) * width
+        keep_byte = bytes((keep,)) if keep is not None else None
+        skipped = 0
+        self.version += 1
+
+        for row in range(y, y + height):
+            start = row * self.width + x
+            end = start + width
+            if keep_byte is None or self.tiles.find(keep_byte, start, end) == -1:
+                self.tiles[start:end] = run
+                continue
+
+            # Langsamer Pfad nur für Zeilen, die ein geschütztes Tile enthalten
+            for i in range(start, end):
+                if self.tiles[i] == keep:
+                    skipped += 1
+                else:
+                    self.tiles[i] = value
+        return skipped
+
+    def fill_hline(self, x1, x2, y, value):
+        """Füllt die Zeile y von x1 bis einschließlich x2."""
+        x_min, x_max = min(x1, x2), max(x1, x2)
+        start = y * self.width
+        self.version += 1
+        self.tiles[start + x_min:start + x_max + 1] = bytes((value,)) * (x_max - x_min + 1)
+
+    def fill_vline(self, x, y1, y2, value):
+        """Füllt die Spalte x von y1 bis einschließlich y2."""
+        y_min, y_max = min(y1, y2), max(y1, y2)
+        start = y_min * self.width + x
+        stop = y_max * self.width + x + 1
+        self.version += 1
+        self.tiles[start:stop:self.width] = bytes((value,)) * (y_max - y_min + 1)
+
+    def region_bytes(self, x, y, width, height):
+        """Gibt das Rechteck (x, y, width, height) als zusammenhängende Bytes (row-major) zurück."""
+        tiles, stride = self.tiles, self.width
+        return b"".join(tiles[row * stride + x:row * stride + x + width] for row in range(y, y + height))
+
+    def count(self, value):
+        """Zählt alle Tiles mit dem angegebenen Wert."""
+        return self.tiles.count(bytes((value,)))
+
+    def copy(self):
+        """Erstellt eine unabhängige Kopie der Karte."""
+        return TileMap(self.width, self.height, tiles=bytearray(self.tiles))
@@ -0,0 +1,301 @@
+import logging
+from array import array
+from dungeon.tile import WALKABLE
+from utils.logger_config import logger, log_enabled
+
+logger = logging.getLogger("DungeonGame")
+
+
+class EnemyState:
+    IDLE = 0
+    CHASE = 1
+    ATTACK = 2
+
+
+# Kein Ziel / Ziel ist der Spieler (weitere Ziele, z. B. andere Gegner, später als Slot-Nummer)
+TARGET_NONE = -1
+TARGET_PLAYER = 0
+
+# Gegnertypen als Tabellen, Index = Typ-ID (wie die Tile-Registry in dungeon/tile.py)
+MAX_ENEMY_TYPES = 256
+ENEMY_NAMES = [None] * MAX_ENEMY_TYPES
+ENEMY_HEALTH = [0] * MAX_ENEMY_TYPES
+ENEMY_SPEED = [0.0] * MAX_ENEMY_TYPES          # Pixel pro Sekunde
+ENEMY_SIZE = [0] * MAX_ENEMY_TYPES             # Kantenlänge in Pixeln
+ENEMY_DAMAGE = [0] * MAX_ENEMY_TYPES           # Schaden pro Angriff
+ENEMY_ATTACK_RANGE = [0.0] * MAX_ENEMY_TYPES   # Pixel (Mittelpunkt zu Mittelpunkt)
+ENEMY_SIGHT_RANGE = [0.0] * MAX_ENEMY_TYPES    # Pixel
+ENEMY_ATTACK_COOLDOWN = [0.0] * MAX_ENEMY_TYPES  # Sekunden
+
+
+def register_enemy_type(type_id, name, health, speed, size, damage, attack_range, sight_range, attack_cooldown):
+    """Registriert einen Gegnertyp. Neue Gegner werden nur hier eingetragen."""
+    if not 0 <= type_id < MAX_ENEMY_TYPES:
+        raise ValueError(f"Enemy type id {type_id} out of range.")
+    if ENEMY_NAMES[type_id] is not None and ENEMY_NAMES[type_id] != name:
+        raise ValueError(f"Enemy type id {type_id} is already registered as {ENEMY_NAMES[type_id]}.")
+
+    ENEMY_NAMES[type_id] = name
+    ENEMY_HEALTH[type_id] = health
+    ENEMY_SPEED[type_id] = speed
+    ENEMY_SIZE[type_id] = size
+    ENEMY_DAMAGE[type_id] = damage
+    ENEMY_ATTACK_RANGE[type_id] = attack_range
+    ENEMY_SIGHT_RANGE[type_id] = sight_range
+    ENEMY_ATTACK_COOLDOWN[type_id] = attack_cooldown
+
+
+class EnemyType:
+    SKELETON = 0
+    ORC = 1
+
+
+register_enemy_type(EnemyType.SKELETON, "skeleton", health=30, speed=90.0, size=20, damage=5,
+                    attack_range=30.0, sight_range=240.0, attack_cooldown=1.0)
+register_enemy_type(EnemyType.ORC, "orc", health=80, speed=60.0, size=24, damage=12,
+                    attack_range=34.0, sight_range=180.0, attack_cooldown=1.6)
+
+
+class EnemyPool:
+    """
+    Alle Gegner einer Ebene, spaltenweise gespeichert (Struct of Arrays).
+
+    Statt eines Python-Objekts pro Gegner gibt es pro Eigenschaft ein typisiertes Array
+    (array-Modul); ein Gegner ist nur eine Slot-Nummer. Frei gewordene Slots kommen auf eine
+    Free-List und werden beim nächsten spawn() wiederverwendet, die Arrays wachsen nur, wenn
+    keine freien Slots mehr da sind.
+
+    update() läuft in getrennten Durchgängen über die Spalten (KI/Cooldowns, Bewegung mit
+    Tile-Kollision, Aufräumen); Schaden wird gesammelt mit damage() / damage_in_radius()
+    angewendet. Tote Gegner werden am Ende von update() freigegeben.
+
+    Mit `spatial_hash` (entities.spatial_hash.SpatialHash, mit Spieler, Items usw. geteilt)
+    trägt der Pool jeden Gegner mit seiner Mitte unter dem Schlüssel (pool, slot) ein und hält
+    die Position aktuell; Nähe-Abfragen wie damage_in_radius() laufen dann über das Raster.
+    """
+
+    def __init__(self, capacity=256, spatial_hash=None):
+        self.x = array("d")
+        self.y = array("d")
+        self.vx = array("d")
+        self.vy = array("d")
+        self.health = array("i")
+        self.cooldown = array("d")
+        self.type_id = array("B")
+        self.state = array("B")
+        self.target = array("i")
+        self.alive = bytearray()
+        self.spatial_hash = spatial_hash
+        self._keys = []  # Schlüssel im Spatial Hash, pro Slot
+
+        self._free = []  # freie Slots, der zuletzt freigegebene wird zuerst wiederverwendet
+        self.count = 0
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.alive)
+
+    def _grow(self, amount):
+        start = self.capacity
+        for column in (self.x, self.y, self.vx, self.vy, self.cooldown, self.health, self.type_id, self.state):
+            column.extend(array(column.typecode, [0]) * amount)
+        self.target.extend(array("i", [TARGET_NONE]) * amount)
+        self.alive.extend(bytes(amount))
+        self._keys.extend((self, slot) for slot in range(start, start + amount))
+        # Niedrige Slots zuerst vergeben (hält die aktiven Gegner vorne in den Arrays)
+        self._free.extend(range(start + amount - 1, start - 1, -1))
+
+    def spawn(self, type_id, x, y):
+        """Erzeugt einen Gegner (Position in Pixeln, linke obere Ecke). Rückgabe: Slot-Nummer."""
+        if ENEMY_NAMES[type_id] is None:
+            raise ValueError(f"Unknown enemy type id {type_id}.")
+        if not self._free:
+            self._grow(max(16, self.capacity))
+
+        slot = self._free.pop()
+        self.x[slot] = x
+        self.y[slot] = y
+        self.vx[slot] = 0.0
+        self.vy[slot] = 0.0
+        self.health[slot] = ENEMY_HEALTH[type_id]
+        self.cooldown[slot] = 0.0
+        self.type_id[slot] = type_id
+        self.state[slot] = EnemyState.IDLE
+        self.target[slot] = TARGET_NONE
+        self.alive[slot] = 1
+        self.count += 1
+        if self.spatial_hash is not None:
+            half = ENEMY_SIZE[type_id] * 0.5
+            self.spatial_hash.insert(self._keys[slot], x + half, y + half)
+        return slot
+
+    def despawn(self, slot):
+        """Entfernt einen Gegner; der Slot wird wiederverwendet."""
+        if not self.alive[slot]:
+            return
+        self.alive[slot] = 0
+        self.target[slot] = TARGET_NONE
+        self._free.append(slot)
+        self.count -= 1
+        if self.spatial_hash is not None:
+            self.spatial_hash.remove(self._keys[slot])
+
+    def clear(self):
+        """Entfernt alle Gegner (z. B. beim Ebenenwechsel); die Arrays bleiben für die nächste Ebene erhalten."""
+        for slot in self.slots():
+            self.despawn(slot)
+
+    def slots(self):
+        """Slot-Nummern aller lebenden Gegner."""
+        alive = self.alive
+        return [slot for slot in range(len(alive)) if alive[slot]]
+
+    def damage(self, slot, amount):
+        """Fügt einem Gegner Schaden zu (Freigabe toter Gegner erfolgt in update())."""
+        if self.alive[slot]:
+            self.health[slot] -= amount
+
+    def slots_in_radius(self, center_x, center_y, radius):
+        """Slot-Nummern aller lebenden Gegner, deren Mitte höchstens `radius` Pixel entfernt ist."""
+        if self.spatial_hash is not None:
+            return [key[1] for key in self.spatial_hash.query_radius(center_x, center_y, radius)
+                    if type(key) is tuple and key[0] is self]
+
+        alive, xs, ys, type_id = self.alive, self.x, self.y, self.type_id
+        radius_sq = radius * radius
+        found = []
+        for slot in range(len(alive)):
+            if not alive[slot]:
+                continue
+            half = ENEMY_SIZE[type_id[slot]] * 0.5
+            dx = xs[slot] + half - center_x
+            dy = ys[slot] + half - center_y
+            if dx * dx + dy * dy <= radius_sq:
+                found.append(slot)
+        return found
+
+    def damage_in_radius(self, center_x, center_y, radius, amount):
+        """Flächenschaden um einen Punkt (Pixel). Rückgabe: Anzahl getroffener Gegner."""
+        slots = self.slots_in_radius(center_x, center_y, radius)
+        health = self.health
+        for slot in slots:
+            health[slot] -= amount
+        return len(slots)
+
+    def update(self, delta_time, player_x, player_y, player_size, dungeon, tile_size, flow_field=None,
+               line_of_sight=None):
+        """
+        Simuliert einen Frame für alle Gegner.
+        Mit `flow_field` (dungeon.pathfinding.FlowField zum Spieler, auf derselben Karte) folgen
+        verfolgende Gegner dem Distanzfeld um Wände herum, sonst laufen sie direkt auf den Spieler zu.
+        Mit `line_of_sight` (dungeon.line_of_sight.LineOfSight) bemerken ruhende Gegner den Spieler
+        nur bei freier Sichtlinie; die Prüfungen aller Gegner laufen gesammelt in einem Batch.
+        Wer schon verfolgt, bleibt dran, solange der Spieler in Sichtweite ist.
+        Rückgabe: Schaden, den die Gegner dem Spieler in diesem Frame zufügen.
+        """
+        alive, xs, ys, vxs, vys = self.alive, self.x, self.y, self.vx, self.vy
+        health, cooldown, type_id, state, target = self.health, self.cooldown, self.type_id, self.state, self.target
+        player_center_x = player_x + player_size * 0.5
+        player_center_y = player_y + player_size * 0.5
+        damage_to_player = 0
+        moving = []
+        aggro = []  # ruhende Gegner in Sichtweite, warten auf die Sichtlinien-Prüfung
+
+        def chase(slot, half, dx, dy, distance_sq):
+            state[slot] = EnemyState.CHASE
+            target[slot] = TARGET_PLAYER
+            if flow_field is not None:
+                step = flow_field.next_step(int((xs[slot] + half) // tile_size), int((ys[slot] + half) // tile_size))
+                if step is not None:
+                    # Auf die Mitte des nächsten Tiles zu
+                    dx = (step[0] + 0.5) * tile_size - (xs[slot] + half)
+                    dy = (step[1] + 0.5) * tile_size - (ys[slot] + half)
+                    distance_sq = dx * dx + dy * dy or 1.0
+            scale = ENEMY_SPEED[type_id[slot]] / distance_sq ** 0.5
+            vxs[slot] = dx * scale
+            vys[slot] = dy * scale
+            moving.append(slot)
+
+        # Durchgang 1: KI (Zustandswechsel, Geschwindigkeit) und Cooldowns.
+        # Seit dem letzten Frame getötete Gegner handeln nicht mehr; sie werden in Durchgang 3 freigegeben.
+        for slot in range(len(alive)):
+            if not alive[slot] or health[slot] <= 0:
+                continue
+            kind = type_id[slot]
+            half = ENEMY_SIZE[kind] * 0.5
+            dx = player_center_x - (xs[slot] + half)
+            dy = player_center_y - (ys[slot] + half)
+            distance_sq = dx * dx + dy * dy
+
+            if cooldown[slot] > 0.0:
+                cooldown[slot] -= delta_time
+
+            attack_range = ENEMY_ATTACK_RANGE[kind]
+            sight_range = ENEMY_SIGHT_RANGE[kind]
+            if distance_sq <= attack_range * attack_range:
+                state[slot] = EnemyState.ATTACK
+                target[slot] = TARGET_PLAYER
+                vxs[slot] = vys[slot] = 0.0
+                if cooldown[slot] <= 0.0:
+                    damage_to_player += ENEMY_DAMAGE[kind]
+                    cooldown[slot] = ENEMY_ATTACK_COOLDOWN[kind]
+            elif distance_sq <= sight_range * sight_range:
+                if line_of_sight is not None and state[slot] == EnemyState.IDLE:
+                    aggro.append((slot, half, dx, dy, distance_sq))
+                else:
+                    chase(slot, half, dx, dy, distance_sq)
+            else:
+                state[slot] = EnemyState.IDLE
+                target[slot] = TARGET_NONE
+                vxs[slot] = vys[slot] = 0.0
+
+        if aggro:
+            # Alle Sichtlinien auf einmal; Gegner auf demselben Tile teilen sich das Ergebnis
+            player_tile = (int(player_center_x // tile_size), int(player_center_y // tile_size))
+            results = line_of_sight.check_batch([
+                ((int((xs[slot] + half) // tile_size), int((ys[slot] + half) // tile_size)), player_tile)
+                for slot, half, _, _, _ in aggro
+            ])
+            for (slot, half, dx, dy, distance_sq), (visible, _) in zip(aggro, results):
+                if visible:
+                    chase(slot, half, dx, dy, distance_sq)
+                else:
+                    vxs[slot] = vys[slot] = 0.0
+
+        # Durchgang 2: Bewegung mit Tile-Kollision (Achsen getrennt, wie beim Spieler)
+        get, in_bounds = dungeon.get, dungeon.in_bounds
+
+        def blocked(x, y, size):
+            for corner_x, corner_y in ((x, y), (x + size, y), (x, y + size), (x + size, y + size)):
+                tile_x, tile_y = int(corner_x // tile_size), int(corner_y // tile_size)
+                if not in_bounds(tile_x, tile_y) or not WALKABLE[get(tile_x, tile_y)]:
+                    return True
+            return False
+
+        spatial_hash, keys = self.spatial_hash, self._keys
+        for slot in moving:
+            size = ENEMY_SIZE[type_id[slot]]
+            new_x = xs[slot] + vxs[slot] * delta_time
+            if not blocked(new_x, ys[slot], size):
+                xs[slot] = new_x
+            new_y = ys[slot] + vys[slot] * delta_time
+            if not blocked(xs[slot], new_y, size):
+                ys[slot] = new_y
+            if spatial_hash is not None:
+                half = size * 0.5
+                spatial_hash.move(keys[slot], xs[slot] + half, ys[slot] + half)
+
+        # Durchgang 3: tote Gegner freigeben
+        killed = 0
+        for slot in range(len(alive)):
+            if alive[slot] and health[slot] <= 0:
+                self.despawn(slot)
+                killed += 1
+        if killed and log_enabled("enemies"):
+            logger.debug("%d enemies killed, %d remaining.", killed, self.count, extra={"category": "enemies"})
+
+        return damage_to_player
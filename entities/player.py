@@ -1,5 +1,5 @@
 import logging
-from dungeon.tile import TileType
+from dungeon.tile import WALKABLE
 from utils.logger_config import logger
 from .stats import Stats
 
@@ -49,14 +49,38 @@ class Player:
             tile_x = int(corner_x // tile_size)
             tile_y = int(corner_y // tile_size)
 
-            if not (0 <= tile_x < len(dungeon[0]) and 0 <= tile_y < len(dungeon)):
+            if not dungeon.in_bounds(tile_x, tile_y):
                 return False
 
-            if dungeon[tile_y][tile_x] not in [TileType.FLOOR, TileType.STAIRS_UP, TileType.STAIRS_DOWN]:
+            if not WALKABLE[dungeon.get(tile_x, tile_y)]:
                 return False
 
         return True
     
+    def save_state(self):
+        """Gibt die speicherbaren Spielerwerte zurück (für Spielstände)."""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "max_health": self.max_health,
+            "current_health": self.current_health,
+            "max_resource": self.max_resource,
+            "current_resource": self.current_resource,
+            "skill_cooldowns": list(self.skill_cooldowns),
+            "stats": self.stats.data,
+        }
+
+    def load_state(self, state):
+        """Übernimmt gespeicherte Spielerwerte."""
+        self.x = state["x"]
+        self.y = state["y"]
+        self.max_health = state["max_health"]
+        self.current_health = state["current_health"]
+        self.max_resource = state["max_resource"]
+        self.current_resource = state["current_resource"]
+        self.skill_cooldowns = list(state["skill_cooldowns"])
+        self.stats.data = state["stats"]
+
     def get_position_in_tiles(self, tile_size):
         """Gibt die Position des Spielers in Dungeon-Tiles zurück."""
         return self.x // tile_size, self.y // tile_size
@@ -0,0 +1,108 @@
+from utils.config import TILE_SIZE
+
+
+class SpatialHash:
+    """
+    Gleichmäßiges Raster für die Frage "was ist in der Nähe dieses Punkts?" (Spieler, Gegner,
+    Items, Fallen-Trigger, ...), ohne alle Objekte durchzugehen.
+
+    Jeder Eintrag ist ein beliebiger hashbarer Schlüssel mit einer Position in Pixeln (z. B. die
+    Mitte eines Objekts) und liegt in genau einer Zelle von `cell_size` Pixeln, standardmäßig
+    ein Tile. Zellen werden nur angelegt, solange etwas darin liegt. insert(), move() und
+    remove() sind O(1); move() fasst die Zellen nur an, wenn der Eintrag die Zelle wechselt.
+    Abfragen (query_radius(), query_rect()) besuchen nur die Zellen, die den Bereich berühren,
+    und liefern die Schlüssel in Einfügereihenfolge pro Zelle.
+    """
+
+    def __init__(self, cell_size=TILE_SIZE):
+        if cell_size <= 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}.")
+        self.cell_size = cell_size
+        self._cells = {}      # (Zelle x, Zelle y) -> {Schlüssel: None}, als geordnete Menge
+        self._positions = {}  # Schlüssel -> (x, y, Zelle)
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, key, x, y):
+        if key in self._positions:
+            raise ValueError(f"{key!r} is already in the spatial hash.")
+        cell = self._cell(x, y)
+        self._positions[key] = (x, y, cell)
+        self._cells.setdefault(cell, {})[key] = None
+
+    def move(self, key, x, y):
+        """Setzt die Position eines Eintrags."""
+        cell = self._cell(x, y)
+        old = self._positions[key][2]
+        self._positions[key] = (x, y, cell)
+        if cell != old:
+            bucket = self._cells[old]
+            del bucket[key]
+            if not bucket:
+                del self._cells[old]
+            self._cells.setdefault(cell, {})[key] = None
+
+    def remove(self, key):
+        """Entfernt einen Eintrag; unbekannte Schlüssel werden ignoriert."""
+        entry = self._positions.pop(key, None)
+        if entry is None:
+            return
+        bucket = self._cells[entry[2]]
+        del bucket[key]
+        if not bucket:
+            del self._cells[entry[2]]
+
+    def clear(self):
+        self._cells.clear()
+        self._positions.clear()
+
+    def position(self, key):
+        """Position (x, y) eines Eintrags."""
+        x, y, _ = self._positions[key]
+        return x, y
+
+    def _buckets(self, cell_x0, cell_y0, cell_x1, cell_y1):
+        """Belegte Zellen im Zellbereich (inklusive); bei großen Bereichen über die belegten Zellen statt das Raster."""
+        cells = self._cells
+        if (cell_x1 - cell_x0 + 1) * (cell_y1 - cell_y0 + 1) > len(cells):
+            return [bucket for (cell_x, cell_y), bucket in cells.items()
+                    if cell_x0 <= cell_x <= cell_x1 and cell_y0 <= cell_y <= cell_y1]
+        buckets = []
+        for cell_y in range(cell_y0, cell_y1 + 1):
+            for cell_x in range(cell_x0, cell_x1 + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket is not None:
+                    buckets.append(bucket)
+        return buckets
+
+    def query_rect(self, x, y, width, height):
+        """Alle Schlüssel, deren Position im Rechteck (x, y, width, height) liegt (Pixel, Rand inklusive)."""
+        x1, y1 = x + width, y + height
+        positions = self._positions
+        found = []
+        for bucket in self._buckets(*self._cell(x, y), *self._cell(x1, y1)):
+            for key in bucket:
+                px, py, _ = positions[key]
+                if x <= px <= x1 and y <= py <= y1:
+                    found.append(key)
+        return found
+
+    def query_radius(self, x, y, radius):
+        """Alle Schlüssel, deren Position höchstens `radius` Pixel von (x, y) entfernt ist."""
+        radius_sq = radius * radius
+        positions = self._positions
+        found = []
+        for bucket in self._buckets(*self._cell(x - radius, y - radius), *self._cell(x + radius, y + radius)):
+            for key in bucket:
+                px, py, _ = positions[key]
+                dx, dy = px - x, py - y
+                if dx * dx + dy * dy <= radius_sq:
+                    found.append(key)
+        return found
@@ -3,23 +3,49 @@ import random
 import logging
 import time
 from dungeon.dungeon import Dungeon
-from rendering.renderer import Renderer, draw_character_ui, draw_inventory_ui, draw_skillbar
+from dungeon.chunked import ChunkedWorld
+from dungeon.tile import TILE_TRIGGERS
+from dungeon.prefetch import LevelPrefetcher
+from dungeon.level_store import LevelStore
+from dungeon.fov import FieldOfView
+from rendering.renderer import Renderer
+from rendering.panels import CharacterPanel, InventoryPanel, SkillbarPanel, StatsPanel
 from rendering.camera import Camera
 from entities.player import Player
-from rendering.minimap import draw_minimap
+from rendering.minimap import Minimap
+from rendering.dirty import DirtyRegions
+from rendering.text import render_text, text_cache
 from utils.helpers import print_staircase_positions
-from utils.logger_config import logger
+from utils.logger_config import logger, log_enabled, shutdown_logging
+from utils.savegame import save_game, load_game
 from entities.stats import Stats
 from menu import Menu
-from utils.config import SCREEN_HEIGHT, SCREEN_WIDTH, DUNGEON_PARAMS, TILE_SIZE, MINIMAP_SIZE, FPS
+from utils.config import SCREEN_HEIGHT, SCREEN_WIDTH, DUNGEON_PARAMS, TILE_SIZE, MINIMAP_SIZE, FPS, LEVEL_CACHE_SIZE, LEVEL_CACHE_DIR, SAVE_PATH
+from utils.config import WORLD_MODE, CHUNKED_WORLD_PARAMS, MINIMAP_WORLD_TILES
 
 # Logger konfigurieren
 logger = logging.getLogger("DungeonGame")
 
+# Lauf-Seed: aus der Konfiguration oder zufällig. Jede Ebene leitet daraus ihren eigenen Seed ab,
+# dadurch lässt sich jede Ebene aus ihrem Schlüssel neu generieren.
+RUN_SEED = DUNGEON_PARAMS["seed"] if DUNGEON_PARAMS["seed"] is not None else random.randrange(2 ** 62)
+LEVEL_PARAMS = dict(DUNGEON_PARAMS, seed=RUN_SEED)
+
+
+def regenerate_level(key):
+    """Generiert eine Ebene aus ihrem Schlüssel neu (Fallback des Ebenen-Caches)."""
+    return Dungeon.from_key(key, **LEVEL_PARAMS).save_state()
+
+
 # Globale Variablen zur Verwaltung der Dungeon-Ebenen
-dungeons = []               # Liste der bisher generierten Dungeons (mehrere Ebenen)
+dungeons = LevelStore(LEVEL_CACHE_SIZE, LEVEL_CACHE_DIR, regenerate=regenerate_level)  # Bisher generierte Ebenen (LRU, Auslagerung auf Festplatte)
 current_level_index = 0     # Aktuelle Ebene im Dungeon
 current_dungeon = None      # Referenz auf das aktuell aktive Dungeon-Objekt
+open_save_game = None       # Zuletzt geladener Spielstand (Ebenen werden daraus bei Bedarf nachgeladen)
+field_of_view = None        # Sichtfeld des Spielers auf der aktuellen Ebene (Fog of War)
+
+# Vorab-Generierung der nächsten Ebene im Hintergrund
+level_prefetcher = LevelPrefetcher(LEVEL_PARAMS)
 
 # Timing für Treppen-Nutzung
 last_stair_use_time = 0
@@ -42,6 +68,17 @@ debounce_duration = 0.2  # Zeit in Sekunden zwischen F-Tastendrücken
 # Menü erstellen
 menu = Menu(screen, font)
 
+# Minimap (zwischengespeichertes Kartenbild, wird nur bei Ebenenwechsel neu erzeugt)
+minimap = Minimap(MINIMAP_SIZE)
+
+# UI-Panels (Layout einmal gebacken, nur Änderungen werden neu gezeichnet)
+character_panel = CharacterPanel()
+inventory_panel = InventoryPanel()
+skillbar_panel = SkillbarPanel()
+
+# Geänderte Bildschirmbereiche (Teil-Updates statt Flip in jedem Frame)
+dirty_regions = DirtyRegions(screen.get_rect())
+
 # Spielstatus
 game_state = "menu" 
 running = True
@@ -51,7 +88,6 @@ player = None
 renderer = None
 camera = None
 
-dungeons = []
 current_level_index = 0
 
 
@@ -63,24 +99,23 @@ def initialize_game() -> tuple:
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     clock = pygame.time.Clock()
 
-    # Dungeon generieren
-    dungeon = Dungeon(
-        width=DUNGEON_PARAMS["width"],
-        height=DUNGEON_PARAMS["height"],
-        min_rooms=DUNGEON_PARAMS["min_rooms"],
-        max_rooms=DUNGEON_PARAMS["max_rooms"],
-        room_size_range=DUNGEON_PARAMS["room_size_range"],
-        seed=DUNGEON_PARAMS["seed"],
-    )
-    dungeon.generate(start_level=True)
-    current_dungeon = dungeon
+    if WORLD_MODE == "chunked":
+        # Endlose Welt: Chunks entstehen erst beim Betreten der Umgebung
+        dungeon = ChunkedWorld(seed=RUN_SEED, **CHUNKED_WORLD_PARAMS)
+        current_dungeon = dungeon
+        logger.info("Chunked world created (run seed %d)", RUN_SEED, extra={"category": "summary"})
+    else:
+        # Dungeon generieren
+        dungeon = Dungeon(**LEVEL_PARAMS, level_index=0)
+        dungeon.generate(start_level=True)
+        current_dungeon = dungeon
 
-    # Validierung: Wurden Räume erzeugt?
-    if not current_dungeon.rooms:
-        logger.error("Dungeon generation failed. No rooms were created.", extra={"category": "levels"})
-        raise ValueError("Dungeon generation failed. No rooms were created.")
+        # Validierung: Wurden Räume erzeugt?
+        if not current_dungeon.rooms:
+            logger.error("Dungeon generation failed. No rooms were created.", extra={"category": "levels"})
+            raise ValueError("Dungeon generation failed. No rooms were created.")
 
-    logger.info("Dungeon generated with %d rooms", len(current_dungeon.rooms), extra={"category": "summary"})
+        logger.info("Dungeon generated with %d rooms (run seed %d)", len(current_dungeon.rooms), RUN_SEED, extra={"category": "summary"})
 
     # Startposition des Spielers: zufällig innerhalb des Start-Raums
     start_room = current_dungeon.get_start_room()
@@ -90,8 +125,8 @@ def initialize_game() -> tuple:
     x_min, y_min = start_room.x, start_room.y
     x_max, y_max = start_room.x + start_room.width - 1, start_room.y + start_room.height - 1
 
-    player_x = random.randint(x_min, x_max) * TILE_SIZE
-    player_y = random.randint(y_min, y_max) * TILE_SIZE
+    player_x = current_dungeon.rng.randint(x_min, x_max) * TILE_SIZE
+    player_y = current_dungeon.rng.randint(y_min, y_max) * TILE_SIZE
 
     # Spielerobjekt erstellen
     player = Player(x=player_x, y=player_y, size=20, speed=200, stats=Stats())
@@ -121,20 +156,35 @@ def save_current_dungeon():
 
 
 def load_dungeon(index):
-    """Lädt einen gespeicherten Dungeon-Zustand anhand seines Index."""
+    """Lädt einen gespeicherten Dungeon-Zustand anhand seines Index (ggf. aus dem Festplatten-Cache)."""
     global current_dungeon
 
     if index < 0 or index >= len(dungeons):
         logger.error("Invalid dungeon index: %d", index, extra={"category": "errors"})
         return
 
-    current_dungeon = Dungeon(**DUNGEON_PARAMS)
-    current_dungeon.load_state(dungeons[index])
+    state = dungeons.get(index)
+    if state is None:
+        logger.error("Failed to load dungeon at index %d", index, extra={"category": "errors"})
+        current_dungeon = None
+        return
+
+    current_dungeon = Dungeon.from_state(state, **LEVEL_PARAMS)
 
     if current_dungeon is None:
         logger.error("Failed to load dungeon at index %d", index, extra={"category": "errors"})
 
 
+def prefetch_next_level():
+    """Startet die Hintergrund-Generierung der nächsten Ebene, falls diese noch nicht existiert."""
+    if current_dungeon is None or current_level_index + 1 < len(dungeons):
+        return
+
+    staircase_up_position = current_dungeon.get_staircase_up()
+    if staircase_up_position is not None:
+        level_prefetcher.schedule(current_level_index + 1, staircase_up_position)
+
+
 def place_player_on_staircase(player, dungeon, renderer, use_staircase_up=True):
     """
     Positioniert den Spieler auf einer Treppe (hoch oder runter).
@@ -170,6 +220,10 @@ def go_to_next_level(player, renderer, camera):
         logger.error("Cannot go to next level: current_dungeon is None!", extra={"category": "errors"})
         return camera  # Rückgabe der aktuellen Kamera, falls nichts passiert
 
+    if WORLD_MODE == "chunked":
+        logger.warning("The chunked world has no levels.", extra={"category": "levels"})
+        return camera
+
     # Speichern des aktuellen Dungeon-Zustands
     save_current_dungeon()
 
@@ -180,9 +234,13 @@ def go_to_next_level(player, renderer, camera):
             logger.error("No staircase found! Cannot generate next level.", extra={"category": "errors"})
             return camera
 
-        new_dungeon = Dungeon(**DUNGEON_PARAMS)
-        new_dungeon.generate_next_level(staircase_up_position)
-        dungeons.append(new_dungeon.save_state())
+        # Vorab generierte Ebene übernehmen, sonst synchron generieren
+        state = level_prefetcher.take(current_level_index + 1, staircase_up_position)
+        if state is None:
+            new_dungeon = Dungeon(**LEVEL_PARAMS, level_index=current_level_index + 1)
+            new_dungeon.generate_next_level(staircase_up_position)
+            state = new_dungeon.save_state()
+        dungeons.append(state)
 
     # Erhöht Levelzahl und lade neues Dungeon
     current_level_index += 1
@@ -201,7 +259,10 @@ def go_to_next_level(player, renderer, camera):
     place_player_on_staircase(player, current_dungeon, renderer, use_staircase_up=False)
 
     # **Kamera auf den Spieler zentrieren**
-    camera.center_on(player.x, player.y, len(current_dungeon.get_dungeon()), renderer.tile_size)
+    camera.center_on(player.x, player.y, current_dungeon.height, renderer.tile_size)
+
+    # Nächste Ebene bereits im Hintergrund vorbereiten
+    prefetch_next_level()
 
     return camera  # Neue Kamera zurückgeben
 
@@ -225,68 +286,171 @@ def go_to_previous_level(player, renderer, camera):
 
         # Kamera neu initialisieren und zentrieren
         camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
-        camera.center_on(player.x, player.y, len(current_dungeon.get_dungeon()), renderer.tile_size)
+        camera.center_on(player.x, player.y, current_dungeon.height, renderer.tile_size)
 
         logger.info("Moved to previous level: %d", current_level_index + 1, extra={"category": "summary"})
 
     return camera
 
 
+def save_game_to_file(player):
+    """Speichert alle Ebenen, die aktuelle Ebene und den Spielerzustand in SAVE_PATH."""
+    if WORLD_MODE == "chunked":
+        logger.warning("Saving is not supported in chunked world mode.", extra={"category": "errors"})
+        return
+
+    save_current_dungeon()
+    try:
+        levels = (dungeons.get(index, cache=False) for index in range(len(dungeons)))
+        save_game(SAVE_PATH, levels, current_level_index, player.save_state(), RUN_SEED)
+    except OSError as e:
+        logger.error("Saving game failed: %s", e, extra={"category": "errors"})
+
+
+def load_game_from_file(player, renderer, camera):
+    """
+    Lädt einen Spielstand aus SAVE_PATH. Die Ebenen werden erst bei Bedarf aus der
+    Datei erzeugt. Rückgabe: neue Kamera (bei Fehler die bisherige).
+    """
+    global dungeons, current_level_index, current_dungeon, open_save_game, RUN_SEED, LEVEL_PARAMS
+
+    if WORLD_MODE == "chunked":
+        logger.warning("Loading is not supported in chunked world mode.", extra={"category": "errors"})
+        return camera
+
+    try:
+        save = load_game(SAVE_PATH)
+    except (OSError, ValueError) as e:
+        logger.error("Loading game failed: %s", e, extra={"category": "errors"})
+        return camera
+
+    # Bisherigen Lauf verwerfen
+    level_prefetcher.cancel()
+    dungeons.close()
+    if open_save_game is not None:
+        open_save_game.close()
+    open_save_game = save
+
+    RUN_SEED = save.run_seed
+    LEVEL_PARAMS = dict(DUNGEON_PARAMS, seed=RUN_SEED)
+    level_prefetcher.params = LEVEL_PARAMS
+
+    dungeons = LevelStore(LEVEL_CACHE_SIZE, LEVEL_CACHE_DIR, regenerate=regenerate_level)
+    dungeons.attach(save.level_count, save.load_level)
+    current_level_index = save.current_level_index
+    load_dungeon(current_level_index)
+    player.load_state(save.player)
+
+    camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+    if current_dungeon is not None:
+        camera.center_on(player.x, player.y, current_dungeon.height, renderer.tile_size)
+        prefetch_next_level()
+    return camera
+
+
+def update_field_of_view(player):
+    """
+    Aktualisiert das Sichtfeld des Spielers (neu berechnet nur bei Tile-Wechsel) und trägt
+    neu erkundete Tiles in die Minimap ein. In der Chunk-Welt gibt es keinen Fog of War.
+    """
+    global field_of_view
+
+    if WORLD_MODE == "chunked" or current_dungeon is None:
+        field_of_view = None
+        return
+
+    tilemap, explored = current_dungeon.dungeon, current_dungeon.explored
+    if field_of_view is None or field_of_view.tilemap is not tilemap or field_of_view.explored is not explored:
+        field_of_view = FieldOfView(tilemap, explored)
+
+    center_x = int((player.x + player.size / 2) // TILE_SIZE)
+    center_y = int((player.y + player.size / 2) // TILE_SIZE)
+    if field_of_view.update(center_x, center_y) and field_of_view.newly_explored:
+        minimap.reveal(tilemap, field_of_view.newly_explored)
+
+
 def render_game(screen, dungeon, player, renderer, camera):
     """Rendert Dungeon, Spieler, UI und Minimap."""
-    char_slots = {}
-    
-    # Kamera auf Spieler zentrieren
+    tile_size = renderer.tile_size
+    player_tile_x, player_tile_y = int(player.x // tile_size), int(player.y // tile_size)
+
+    # Kamera auf Spieler zentrieren (Kartenhöhe None = unbegrenzte Welt)
     camera.center_on(
         player.x,
         player.y,
-        len(dungeon.get_dungeon()),  # Anzahl der Zeilen im Dungeon als Höhe der Karte
-        renderer.tile_size 
+        dungeon.height,
+        tile_size
     )
     camera_offset_x, camera_offset_y = camera.offset_x, camera.offset_y
 
-    # Hintergrund löschen & Dungeon rendern
-    screen.fill((0, 0, 0))
-    renderer.render(screen, dungeon.get_dungeon(), camera_offset_x, camera_offset_y)
-    renderer.draw_player(screen, player.x, player.y, player.size, camera_offset_x, camera_offset_y)
-
-    # Minimap zeichnen
-    minimap_x = SCREEN_WIDTH - MINIMAP_SIZE[0] - 20
-    minimap_y = 20
-    draw_minimap(screen, dungeon.get_dungeon(), player.x, player.y, MINIMAP_SIZE)
-
-    # Aktuelle Ebene anzeigen (z. B. „Level 2/5“)
-    font = pygame.font.Font(None, 18)
+    # Kartenquelle: bei festen Ebenen die ganze Karte. Die Chunk-Welt wird direkt aus ihren
+    # Chunks gezeichnet (Weltkoordinaten), damit die gebackenen Surfaces von Renderer und
+    # Minimap nicht bei jedem Tile-Schritt an einem neuen Ausschnitt hängen.
+    chunked = WORLD_MODE == "chunked"
+    view = dungeon if chunked else dungeon.dungeon
     level_text = f"Level {current_level_index + 1}/{max(1, len(dungeons))}"
-    text_surface = font.render(level_text, True, (255, 255, 255))
-    screen.blit(text_surface, (minimap_x, minimap_y + MINIMAP_SIZE[1] + 8))
-
-    # Charakter-UI zeichnen
-    draw_character_ui(screen, player)
-
-    # Inventar-UI zeichnen, falls geöffnet
+    fov = field_of_view
+    explored = fov.explored if fov is not None else None
+
+    # Änderungen seit dem letzten Frame bestimmen: Kamera, Ebene oder offene Fenster
+    # erfordern ein vollständiges Neuzeichnen, sonst nur die Bereiche geänderter Elemente
+    player_rect = pygame.Rect(int(player.x - camera_offset_x), int(player.y - camera_offset_y), player.size, player.size)
+    dirty_regions.begin((int(camera_offset_x), int(camera_offset_y), id(view), view.version,
+                         fov.revision if fov is not None else None, inventory_open, stats_visible))
+    dirty_regions.track("player", tuple(player_rect), player_rect)
+    dirty_regions.track("minimap", (id(view), view.version, player_tile_x, player_tile_y))
+    dirty_regions.track("level_text", level_text)
+    dirty_regions.track("character", (player.current_health, player.max_health,
+                                      player.current_resource, player.max_resource))
+    dirty_regions.track("skillbar", tuple((cooldown > 0, int(cooldown)) for cooldown in player.skill_cooldowns))
     if inventory_open:
-        logger.debug("Inventory is open. Drawing inventory UI...", extra={"category": "ui"})
-        slot_size = 50
-        char_area_y = 100
-        char_area_height = 200
-
-        # Inventar- und Charakterwerte zeichnen
-        char_slots = draw_inventory_ui(
-            screen,
-            stats_visible,
-            player.stats,
-            char_slots,  # Übergibt bestehende Slots oder ein leeres Dict
-            char_area_y,
-            char_area_height,
-            slot_size
-        )
-
-    # Skillbar zeichnen (aktuell nur Platzhalter / in Arbeit)
-    draw_skillbar(screen, player.skills, player.skill_cooldowns)
-
-    # 🔁 Anzeige aktualisieren
-    pygame.display.flip()
+        hovered_slot = inventory_panel.slot_at(pygame.mouse.get_pos())
+        dirty_regions.track("inventory", (hovered_slot, StatsPanel.snapshot(player.stats.data) if stats_visible else None))
+
+    rects = {}
+    for region in dirty_regions.regions():
+        # Alle Zeichenaufrufe werden auf den geänderten Bereich beschnitten
+        screen.set_clip(region)
+
+        # Hintergrund löschen & Dungeon rendern
+        screen.fill((0, 0, 0))
+        if chunked:
+            renderer.render_world(screen, dungeon, camera_offset_x, camera_offset_y)
+        else:
+            renderer.render(screen, view, camera_offset_x, camera_offset_y, explored, fov)
+        rects["player"] = renderer.draw_player(screen, player.x, player.y, player.size, camera_offset_x, camera_offset_y)
+
+        # Minimap zeichnen
+        if chunked:
+            rects["minimap"] = minimap.draw_world(screen, dungeon, player.x, player.y, MINIMAP_WORLD_TILES)
+        else:
+            rects["minimap"] = minimap.draw(screen, view, player.x, player.y, explored)
+
+        # Aktuelle Ebene anzeigen (z. B. „Level 2/5“)
+        minimap_x = SCREEN_WIDTH - MINIMAP_SIZE[0] - 20
+        minimap_y = 20
+        text_surface = render_text(level_text, 18, (255, 255, 255))
+        text_rect = text_surface.get_rect(topleft=(minimap_x, minimap_y + MINIMAP_SIZE[1] + 8))
+        screen.blit(text_surface, text_rect)
+        rects["level_text"] = text_rect  # ungeclippt, blit() liefert nur den sichtbaren Teil
+
+        # Charakter-UI zeichnen
+        rects["character"] = character_panel.draw(screen, player)
+
+        # Inventar-UI zeichnen, falls geöffnet
+        if inventory_open:
+            if log_enabled("ui"):
+                logger.debug("Inventory is open. Drawing inventory UI...", extra={"category": "ui"})
+            rects["inventory"] = inventory_panel.draw(screen, stats_visible, player.stats.data, hovered_slot)
+
+        # Skillbar zeichnen (aktuell nur Platzhalter / in Arbeit)
+        rects["skillbar"] = skillbar_panel.draw(screen, player.skills, player.skill_cooldowns)
+
+    screen.set_clip(None)
+    dirty_regions.end(rects)
+
+    # 🔁 Anzeige aktualisieren (Flip nur bei vollständigem Neuzeichnen, sonst geänderte Bereiche)
+    dirty_regions.present()
 
 
 def handle_input(player, dungeon, renderer, camera, delta_time, events):
@@ -306,30 +470,31 @@ def handle_input(player, dungeon, renderer, camera, delta_time, events):
 
         if move_x != 0 or move_y != 0:
             player.move(move_x, move_y, dungeon.get_dungeon(), renderer.tile_size)
-            logger.debug(f"Player moved: dx={move_x}, dy={move_y}", extra={"category": "movement"})
+            if log_enabled("movement"):
+                logger.debug(f"Player moved: dx={move_x}, dy={move_y}", extra={"category": "movement"})
 
     # Weitere Tasteneingaben (Events)
     for event in events:
         if event.type == pygame.KEYDOWN:
-            logger.debug(f"Key pressed: {pygame.key.name(event.key)}", extra={"category": "input"})
+            if log_enabled("input"):
+                logger.debug(f"Key pressed: {pygame.key.name(event.key)}", extra={"category": "input"})
 
             # Treppen benutzen mit Taste E (entprellt)
             if not inventory_open and event.key == pygame.K_e:
                 if current_time - last_stair_use_time > stair_debounce_time:
-                    player_x, player_y = player.x // renderer.tile_size, player.y // renderer.tile_size
-                    staircase_up = dungeon.get_staircase_up()
-                    staircase_down = dungeon.get_staircase_down()
+                    player_x, player_y = int(player.x // renderer.tile_size), int(player.y // renderer.tile_size)
+                    trigger = TILE_TRIGGERS[dungeon.get_dungeon().get(player_x, player_y)]
 
-                    if staircase_up and (player_x, player_y) == staircase_up:
+                    if trigger == "stairs_up":
                         logger.info("Interacting with staircase up...", extra={"category": "stairs"})
                         camera = go_to_next_level(player, renderer, camera)
 
-                    elif staircase_down and (player_x, player_y) == staircase_down:
+                    elif trigger == "stairs_down":
                         logger.info("Interacting with staircase down...", extra={"category": "stairs"})
                         camera = go_to_previous_level(player, renderer, camera)
 
                     last_stair_use_time = current_time  # Entprellung für Treppen
-                else:
+                elif log_enabled("input"):
                     logger.debug("Stair interaction ignored due to debounce timing", extra={"category": "input"})
 
             # Inventar öffnen/schließen mit Taste B (entprellt)
@@ -338,7 +503,7 @@ def handle_input(player, dungeon, renderer, camera, delta_time, events):
                     inventory_open = not inventory_open  # Status umschalten
                     last_f_press_time = current_time
                     logger.info(f"Inventory {'opened' if inventory_open else 'closed'}.", extra={"category": "ui"})
-                else:
+                elif log_enabled("debug"):
                     logger.debug(f"B key debounce active. Time since last press: {current_time - last_f_press_time:.3f}s",
                                  extra={"category": "debug"})
 
@@ -356,7 +521,7 @@ def handle_input(player, dungeon, renderer, camera, delta_time, events):
                                 logger.info(f"Skill {skill_index + 1} used!", extra={"category": "skills"})
                             else:
                                 logger.warning(f"Skill {skill_index + 1} failed (not enough resources?)", extra={"category": "skills"})
-                        else:
+                        elif log_enabled("skills"):
                             logger.debug(f"Skill {skill_index + 1} is on cooldown ({player.skill_cooldowns[skill_index]:.1f}s left)", extra={"category": "skills"})
                     else:
                         logger.warning(f"Invalid skill index: {skill_index}", extra={"category": "skills"})
@@ -374,9 +539,11 @@ def handle_input(player, dungeon, renderer, camera, delta_time, events):
         elif event.type == pygame.KEYUP:
             if event.key == pygame.K_b:
                 f_key_pressed = False
-                logger.debug("f_key_pressed reset to False.", extra={"category": "input"})
+                if log_enabled("input"):
+                    logger.debug("f_key_pressed reset to False.", extra={"category": "input"})
 
-    logger.debug(f"Final Inventory open state: {inventory_open}", extra={"category": "state"})
+    if log_enabled("state"):
+        logger.debug(f"Final Inventory open state: {inventory_open}", extra={"category": "state"})
 
 
 def main():
@@ -389,6 +556,7 @@ def main():
     screen, clock, dungeon, player, renderer, camera = initialize_game()
 
     current_dungeon = dungeon  # Speichert das initialisierte Dungeon
+    prefetch_next_level()
 
     # Debug-Ausgabe der Treppenpositionen
     logger.debug("Printing staircase positions...", extra={"category": "stairs"})
@@ -397,16 +565,26 @@ def main():
     running = True
     while running:
         if game_state == "menu":
+            clock.tick(FPS)  # Menü nicht ungebremst neu prüfen
             menu.draw()
             selection = menu.handle_input()
             if selection == "Spiel starten":
                 game_state = "playing"  # ❌ Kein erneutes `initialize_game()`!
+                dirty_regions.invalidate()
+            elif selection == "Spiel speichern":
+                save_game_to_file(player)
+            elif selection == "Spiel laden":
+                camera = load_game_from_file(player, renderer, camera)
+                if current_dungeon is not None:
+                    game_state = "playing"
+                    dirty_regions.invalidate()
             elif selection == "Spiel beenden":
                 running = False
 
         elif game_state == "playing":
             delta_time = clock.tick(FPS) / 1000.0
-            logger.debug("Frame time (delta_time): %.4f seconds", delta_time, extra={"category": "timing"})
+            if log_enabled("timing"):
+                logger.debug("Frame time (delta_time): %.4f seconds", delta_time, extra={"category": "timing"})
 
             events = pygame.event.get()  # ❗ Nur einmal Events holen!
 
@@ -414,16 +592,21 @@ def main():
                 if event.type == pygame.QUIT:
                     logger.info("Quit event detected. Exiting game.", extra={"category": "quit"})
                     running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    dirty_regions.invalidate()  # Fensterinhalt verloren: vollständig neu zeichnen
                 elif event.type == pygame.KEYDOWN:
-                    logger.debug("Key press detected: %s", pygame.key.name(event.key), extra={"category": "input"})
+                    if log_enabled("input"):
+                        logger.debug("Key press detected: %s", pygame.key.name(event.key), extra={"category": "input"})
                     if event.key == pygame.K_ESCAPE:
                         game_state = "menu"
+                        menu.invalidate()
                     elif event.key == pygame.K_n:
                         go_to_next_level(player, renderer, camera) 
                     elif event.key == pygame.K_p:
                         go_to_previous_level(player, renderer, camera)
 
-            logger.debug(f"Events existiert? {events is not None} | Typ: {type(events)}", extra={"category": "debug"})
+            if log_enabled("debug"):
+                logger.debug(f"Events existiert? {events is not None} | Typ: {type(events)}", extra={"category": "debug"})
             handle_input(player, current_dungeon, renderer, camera, delta_time, events)  # ✅ Korrekt!
 
             # FPS in Titelzeile anzeigen
@@ -434,9 +617,23 @@ def main():
                 logger.error("Rendering stopped: current_dungeon is None!", extra={"category": "errors"})
                 break
 
-            logger.debug("Rendering game...", extra={"category": "rendering"})
+            # Chunk-Welt: Umgebung des Spielers nachladen, entfernte Chunks verwerfen
+            current_dungeon.update(int(player.x // TILE_SIZE), int(player.y // TILE_SIZE))
+            update_field_of_view(player)
+
+            if log_enabled("rendering"):
+                logger.debug("Rendering game...", extra={"category": "rendering"})
             render_game(screen, current_dungeon, player, renderer, camera)
 
+    level_prefetcher.shutdown()
+    logger.info("Level cache: %s", dungeons.stats(), extra={"category": "summary"})
+    logger.info("Display updates: %s", dirty_regions.stats(), extra={"category": "summary"})
+    logger.info("Text cache: %s", text_cache.stats(), extra={"category": "summary"})
+    if WORLD_MODE == "chunked":
+        logger.info("Chunked world: %s", current_dungeon.stats(), extra={"category": "summary"})
+    dungeons.close()
+    if open_save_game is not None:
+        open_save_game.close()
     pygame.quit()
     logger.info("Game exited successfully.", extra={"category": "quit"})
 
@@ -447,3 +644,6 @@ if __name__ == "__main__":
         main()
     except Exception as e:
         logger.exception("An error occurred: %s", e, extra={"category": "errors"})
+    finally:
+        # Wartende Log-Meldungen schreiben und den Log-Thread beenden
+        shutdown_logging()
@@ -7,8 +7,18 @@ class Menu:
         self.font = font
         self.options = ["Spiel starten", "Spiel speichern", "Spiel laden", "Spiel beenden"]
         self.selected_index = 0
+        self._drawn_index = None  # Zuletzt gezeichnete Auswahl (None = neu zeichnen)
+
+    def invalidate(self):
+        """Erzwingt beim nächsten draw() ein Neuzeichnen (z. B. beim Wechsel ins Menü)."""
+        self._drawn_index = None
 
     def draw(self):
+        # Das Menü ist statisch: nur bei geänderter Auswahl neu zeichnen
+        if self._drawn_index == self.selected_index:
+            return
+        self._drawn_index = self.selected_index
+
         self.screen.fill((0, 0, 0))  # Schwarzer Hintergrund
         for i, option in enumerate(self.options):
             color = (255, 255, 255) if i == self.selected_index else (150, 150, 150)
@@ -22,6 +32,8 @@ class Menu:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.invalidate()  # Fensterinhalt verloren (z. B. verdeckt gewesen)
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_DOWN:
                     self.selected_index = (self.selected_index + 1) % len(self.options)
@@ -10,6 +10,12 @@ class Camera:
         self.offset_x = max(0, player_x - self.screen_width // 2)
         self.offset_y = max(0, player_y - self.screen_height // 2)
 
+        # Unbegrenzte (chunkweise generierte) Welt: keine Kartenränder
+        if map_height is None:
+            self.offset_x = player_x - self.screen_width // 2
+            self.offset_y = player_y - self.screen_height // 2
+            return
+
         # Begrenzung auf die Kartenränder
         max_x = map_height * tile_size - self.screen_width
         max_y = map_height * tile_size - self.screen_height
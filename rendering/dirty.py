@@ -0,0 +1,101 @@
+import pygame
+import logging
+
+logger = logging.getLogger("DungeonGame")
+
+
+class DirtyRegions:
+    """
+    Verfolgt, welche Bildschirmbereiche sich seit dem letzten Frame geändert haben.
+
+    Pro Frame meldet die Szene ihren Gesamtzustand (Kamera, Ebene, offene Fenster) und jedes
+    Element (Spieler, Minimap, UI) einen Zustandsschlüssel. Ändert sich der Gesamtzustand,
+    wird alles neu gezeichnet und geflippt. Sonst werden nur die Bereiche geänderter Elemente
+    (alte und neue Position) neu gezeichnet und per pygame.display.update(rects) übertragen.
+    Hat sich nichts geändert, entfällt der Frame vollständig.
+    """
+
+    def __init__(self, screen_rect):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self._scene_key = None
+        self._states = {}   # Element -> Zustandsschlüssel des letzten Frames
+        self._rects = {}    # Element -> zuletzt gezeichneter Bereich
+        self._full = True
+        self._dirty = []
+
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.skipped_frames = 0
+
+    def invalidate(self):
+        """Erzwingt im nächsten Frame ein vollständiges Neuzeichnen (z. B. nach dem Menü)."""
+        self._scene_key = None
+
+    def begin(self, scene_key):
+        """Beginnt einen Frame mit dem Gesamtzustand der Szene."""
+        self._full = scene_key != self._scene_key
+        self._scene_key = scene_key
+        self._dirty = []
+
+    def track(self, name, state, rect=None):
+        """
+        Meldet ein Element mit seinem Zustand. Ist er geändert, wird der bisherige Bereich
+        (und `rect`, falls die neue Position schon bekannt ist) als geändert markiert.
+        """
+        if self._states.get(name) == state and name in self._rects:
+            return
+        self._states[name] = state
+        if self._full:
+            return
+        if name in self._rects:
+            self._dirty.append(self._rects[name])
+        if rect is not None:
+            self._dirty.append(pygame.Rect(rect))
+        elif name not in self._rects:
+            # Bereich unbekannt: sicherheitshalber alles neu zeichnen
+            self._full = True
+
+    def regions(self):
+        """Bereiche, die in diesem Frame neu gezeichnet werden müssen (leer = nichts zu tun)."""
+        if self._full:
+            return [self.screen_rect]
+
+        # Überlappende Bereiche zusammenfassen, damit nichts doppelt gezeichnet wird
+        merged = []
+        for rect in self._dirty:
+            rect = rect.clip(self.screen_rect)
+            if not rect.width or not rect.height:
+                continue
+            for i, other in enumerate(merged):
+                if rect.colliderect(other):
+                    merged[i] = other.union(rect)
+                    break
+            else:
+                merged.append(rect)
+        self._dirty = merged
+        return merged
+
+    def end(self, rects):
+        """Übernimmt die beim Zeichnen gemeldeten Bereiche der Elemente (Name -> Rect)."""
+        for name, rect in rects.items():
+            if rect is not None:
+                self._rects[name] = pygame.Rect(rect)
+
+    def present(self):
+        """Überträgt den Frame: Flip bei vollständigem Neuzeichnen, sonst nur geänderte Bereiche."""
+        if self._full:
+            pygame.display.flip()
+            self.full_frames += 1
+        elif self._dirty:
+            pygame.display.update(self._dirty)
+            self.partial_frames += 1
+        else:
+            self.skipped_frames += 1
+        self._dirty = []
+
+    def stats(self):
+        return {
+            "full_frames": self.full_frames,
+            "partial_frames": self.partial_frames,
+            "skipped_frames": self.skipped_frames,
+        }
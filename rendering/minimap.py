@@ -1,58 +1,137 @@
 import pygame
 import logging
-from dungeon.tile import TileType
+from collections import OrderedDict
+from dungeon.fov import apply_mask
+from dungeon.tile import MINIMAP_COLORS
+from rendering.tile_image import tiles_to_surface
 from utils.config import TILE_SIZE, COLORS
 
 logger = logging.getLogger("DungeonGame")
 
-def draw_minimap(surface, dungeon, player_x, player_y, minimap_size):
-    """Zeichnet die Minimap korrekt, ohne doppelte Rahmen oder überflüssige Zeichnungen."""
-    if not dungeon:
-        print("FEHLER: Dungeon-Daten fehlen!")
-        return
-
-    minimap_width, minimap_height = minimap_size
-    dungeon_width, dungeon_height = len(dungeon[0]), len(dungeon)
-    scale_x, scale_y = minimap_width / dungeon_width, minimap_height / dungeon_height
-
-    # **Minimap-Position**
-    minimap_x, minimap_y = surface.get_width() - minimap_width - 20, 20
-
-    # **Erstelle eine separate Minimap-Oberfläche**
-    minimap_surface = pygame.Surface((minimap_width, minimap_height), pygame.SRCALPHA)
-    minimap_surface.fill((20, 20, 20, 180))  # Dunkelgrau, leicht transparent
-
-    # **Dungeon-Kacheln zeichnen**
-    tile_colors = {
-        TileType.FLOOR: COLORS["FLOOR_COLOR"],
-        TileType.WALL: COLORS["WALL_COLOR"],
-        TileType.STAIRS_DOWN: COLORS["STAIRS_DOWN_COLOR"],
-        TileType.STAIRS_UP: COLORS["STAIRS_UP_COLOR"]
-    }
-
-    for y, row in enumerate(dungeon):
-        for x, tile in enumerate(row):
-            rect = pygame.Rect(
-                round(x * scale_x),
-                round(y * scale_y),
-                max(1, round(scale_x)),  # Mindestgröße von 1 Pixel
-                max(1, round(scale_y))
-            )
-            color = tile_colors.get(tile, COLORS.get("BACKGROUND_COLOR", (0, 0, 0)))
-            pygame.draw.rect(minimap_surface, color, rect)
-
-    # **Spielerposition zeichnen**
-    player_tile_x, player_tile_y = int(player_x / TILE_SIZE), int(player_y / TILE_SIZE)
-    if 0 <= player_tile_x < dungeon_width and 0 <= player_tile_y < dungeon_height:
-        player_minimap_x, player_minimap_y = round(player_tile_x * scale_x), round(player_tile_y * scale_y)
-        player_rect = pygame.Rect(player_minimap_x, player_minimap_y, max(1, round(scale_x)), max(1, round(scale_y)))
-        pygame.draw.rect(minimap_surface, COLORS["PLAYER_COLOR"], player_rect)
-
-    # **Minimap nur EINMAL auf den Hauptbildschirm zeichnen**
-    surface.blit(minimap_surface, (minimap_x, minimap_y))
-
-    # **Weiße Umrandung um die Minimap**
-    pygame.draw.rect(surface, (255, 255, 255), (minimap_x - 1, minimap_y - 1, minimap_width + 2, minimap_height + 2), 2)
-
-    # **Debugging**
-    #print(f"DEBUG: Minimap bei ({minimap_x}, {minimap_y}) mit Größe {minimap_width}x{minimap_height}")
+
+class Minimap:
+    """
+    Minimap mit zwischengespeicherter Kartenebene.
+
+    Die Ebene wird einmal als Bild mit einem Pixel pro Tile erzeugt (Farben per
+    bytes.translate aus der Tile-Registry) und auf die Minimap-Größe skaliert. Neu erzeugt
+    wird sie nur, wenn sich die Tile-Karte ändert (andere Ebene oder TileMap.version).
+    Pro Frame werden nur das fertige Bild, die Spielermarkierung und der Rahmen gezeichnet;
+    einzelne Tiles lassen sich mit reveal() nachträglich eintragen.
+
+    Mit einer ExploredMap (Fog of War) enthält das Bild nur erkundete Tiles; neu erkundete
+    werden per reveal() ergänzt, ohne das Bild neu zu erzeugen.
+
+    Für die Chunk-Welt (draw_world()) wird je Welt-Chunk ein Bild erzeugt und zwischengespeichert;
+    bei einem Schritt des Spielers wird der Ausschnitt nur aus diesen Bildern neu zusammengesetzt.
+    """
+
+    # Höchstzahl zwischengespeicherter Chunk-Bilder der Chunk-Welt
+    WORLD_CHUNK_CACHE_SIZE = 32
+
+    def __init__(self, size, margin=20):
+        self.size = size
+        self.margin = margin
+        self._tilemap = None
+        self._version = None
+        self._explored = None
+        self._base = None
+
+        # Chunk-Welt: id(Chunk-TileMap) -> (TileMap, Version, Bild), in LRU-Reihenfolge
+        self._world_chunks = OrderedDict()
+        self._window = None      # zusammengesetzter Ausschnitt, ein Pixel pro Tile
+        self._window_key = None
+
+    def _tile_rect(self, columns, rows, x, y):
+        scale_x, scale_y = self.size[0] / columns, self.size[1] / rows
+        return pygame.Rect(round(x * scale_x), round(y * scale_y), max(1, round(scale_x)), max(1, round(scale_y)))
+
+    def _rebuild(self, tilemap, explored=None):
+        """Erzeugt das Kartenbild der Minimap neu (ein Pixel pro Tile, danach skaliert)."""
+        tiles = tilemap.tiles
+        if explored is not None:
+            tiles = apply_mask(tiles, explored.region_mask(0, 0, tilemap.width, tilemap.height))
+        image = tiles_to_surface(tiles, tilemap.width, tilemap.height, MINIMAP_COLORS)
+        self._base = pygame.transform.scale(image, self.size)
+        self._tilemap = tilemap
+        self._version = tilemap.version
+        self._explored = explored
+        self._window_key = None
+        logger.debug("Minimap rebuilt for %dx%d map.", tilemap.width, tilemap.height, extra={"category": "rendering"})
+
+    def reveal(self, tilemap, positions):
+        """Trägt einzelne Tiles (z. B. neu erkundete) in das zwischengespeicherte Bild ein."""
+        if self._base is None or self._tilemap is not tilemap:
+            return
+        for x, y in positions:
+            self._base.fill(MINIMAP_COLORS[tilemap.get(x, y)], self._tile_rect(tilemap.width, tilemap.height, x, y))
+
+    def draw(self, surface, tilemap, player_x, player_y, explored=None):
+        """
+        Zeichnet die Minimap mit Spielerposition (in Pixeln relativ zur Tile-Karte),
+        mit `explored` nur die erkundeten Tiles. Rückgabe: gezeichneter Bereich (inklusive Rahmen).
+        """
+        if not tilemap:
+            logger.error("Minimap: dungeon data missing.", extra={"category": "errors"})
+            return None
+
+        if self._tilemap is not tilemap or self._version != tilemap.version or self._explored is not explored:
+            self._rebuild(tilemap, explored)
+
+        minimap_x, minimap_y = surface.get_width() - self.size[0] - self.margin, self.margin
+        surface.blit(self._base, (minimap_x, minimap_y))
+
+        # Spielerposition
+        player_tile_x, player_tile_y = int(player_x / TILE_SIZE), int(player_y / TILE_SIZE)
+        if tilemap.in_bounds(player_tile_x, player_tile_y):
+            player_rect = self._tile_rect(tilemap.width, tilemap.height, player_tile_x, player_tile_y)
+            pygame.draw.rect(surface, COLORS["PLAYER_COLOR"], player_rect.move(minimap_x, minimap_y))
+
+        return self._draw_frame(surface, minimap_x, minimap_y)
+
+    def draw_world(self, surface, world, player_x, player_y, tiles):
+        """
+        Zeichnet die Minimap der Chunk-Welt: `tiles` x `tiles` Tiles um den Spieler
+        (Position in Weltpixeln). Rückgabe: gezeichneter Bereich (inklusive Rahmen).
+        """
+        player_tile_x, player_tile_y = int(player_x // TILE_SIZE), int(player_y // TILE_SIZE)
+        origin_x, origin_y = player_tile_x - tiles // 2, player_tile_y - tiles // 2
+        size = world.chunk_size
+
+        # Welt-Chunks im Ausschnitt; neu zusammengesetzt wird nur bei anderem Ausschnitt oder geänderten Chunks
+        chunks = []
+        for cy in range(origin_y // size, (origin_y + tiles - 1) // size + 1):
+            for cx in range(origin_x // size, (origin_x + tiles - 1) // size + 1):
+                chunks.append((cx, cy, world.get_chunk(cx, cy)))
+        key = (origin_x, origin_y, tiles, tuple((id(chunk), chunk.version) for _, _, chunk in chunks))
+        if self._window_key != key:
+            if self._window is None or self._window.get_width() != tiles:
+                self._window = pygame.Surface((tiles, tiles))
+            for cx, cy, chunk in chunks:
+                self._window.blit(self._world_chunk_image(chunk), (cx * size - origin_x, cy * size - origin_y))
+            self._base = pygame.transform.scale(self._window, self.size)
+            self._tilemap = None  # Bild gehört zu keiner Tile-Karte einer Ebene
+            self._window_key = key
+
+        minimap_x, minimap_y = surface.get_width() - self.size[0] - self.margin, self.margin
+        surface.blit(self._base, (minimap_x, minimap_y))
+        player_rect = self._tile_rect(tiles, tiles, player_tile_x - origin_x, player_tile_y - origin_y)
+        pygame.draw.rect(surface, COLORS["PLAYER_COLOR"], player_rect.move(minimap_x, minimap_y))
+        return self._draw_frame(surface, minimap_x, minimap_y)
+
+    def _world_chunk_image(self, chunk):
+        """Bild eines Welt-Chunks mit einem Pixel pro Tile (zwischengespeichert, neu bei geänderter Version)."""
+        entry = self._world_chunks.get(id(chunk))
+        if entry is None or entry[0] is not chunk or entry[1] != chunk.version:
+            image = tiles_to_surface(chunk.tiles, chunk.width, chunk.height, MINIMAP_COLORS)
+            entry = self._world_chunks[id(chunk)] = (chunk, chunk.version, image)
+        self._world_chunks.move_to_end(id(chunk))
+        while len(self._world_chunks) > self.WORLD_CHUNK_CACHE_SIZE:
+            self._world_chunks.popitem(last=False)
+        return entry[2]
+
+    def _draw_frame(self, surface, minimap_x, minimap_y):
+        # Weiße Umrandung um die Minimap
+        frame = pygame.Rect(minimap_x - 1, minimap_y - 1, self.size[0] + 2, self.size[1] + 2)
+        pygame.draw.rect(surface, (255, 255, 255), frame, 2)
+        return frame
@@ -0,0 +1,369 @@
+import pygame
+import logging
+from abc import ABC, abstractmethod
+from rendering.text import render_text
+
+logger = logging.getLogger("DungeonGame")
+
+_UNSET = object()
+
+
+class Panel(ABC):
+    """
+    Basisklasse für UI-Panels im Retained Mode.
+
+    Das statische Layout (Rahmen, Slots, feste Beschriftungen) wird einmal in eine
+    Hintergrund-Surface gezeichnet (_build). Dynamische Teile (Balken, Cooldowns, Hover)
+    werden nur neu gezeichnet, wenn sich der übergebene Zustand ändert (_render_state);
+    sonst wird pro Frame nur die fertige Surface geblittet.
+    Neu aufgebaut wird das Layout, wenn sich die Bildschirmgröße ändert oder nach invalidate().
+    Unterklassen müssen _build() implementieren, sonst schlägt schon das Erzeugen des Panels fehl.
+    """
+
+    def __init__(self):
+        self.rect = None
+        self._screen_size = None
+        self._background = None
+        self._surface = None
+        self._state = _UNSET
+
+    def invalidate(self):
+        """Verwirft das gebackene Layout (z. B. nach Änderung der Skills oder Icons)."""
+        self._background = None
+
+    @abstractmethod
+    def _build(self, screen_size):
+        """Setzt self.rect und liefert die Hintergrund-Surface mit dem statischen Layout."""
+
+    def _render_state(self, surface, state):
+        """Zeichnet die dynamischen Teile für `state` auf eine Kopie des Hintergrunds."""
+
+    def _layout(self, screen_size):
+        """Baut das statische Layout bei Bedarf (neu) auf."""
+        if self._background is None or self._screen_size != screen_size:
+            self._screen_size = screen_size
+            self._background = self._build(screen_size)
+            self._state = _UNSET
+
+    def _compose(self, screen_size, state):
+        self._layout(screen_size)
+        if self._state != state:
+            self._surface = self._background.copy()
+            self._render_state(self._surface, state)
+            self._state = state
+        return self._surface
+
+    def draw(self, screen, state=None):
+        """Zeichnet das Panel. Rückgabe: gezeichneter Bereich."""
+        screen.blit(self._compose(screen.get_size(), state), self.rect)
+        return self.rect
+
+
+class CharacterPanel(Panel):
+    """Charakterbild mit Lebens- und Ressourcenbalken (oben links)."""
+
+    UI_X = 20  # Abstand vom linken Bildschirmrand
+    UI_Y = 20  # Abstand vom oberen Bildschirmrand
+    BAR_WIDTH = 200  # Breite der Lebens- und Ressourcenbalken
+    BAR_HEIGHT = 20  # Höhe eines Balkens
+    PADDING = 5  # Abstand zwischen den Balken
+
+    def _build(self, screen_size):
+        character_size = self.BAR_HEIGHT * 2 + self.PADDING  # Höhe des Charakterbilds (2 Balken + Abstand)
+        self.rect = pygame.Rect(self.UI_X, self.UI_Y, character_size + 10 + self.BAR_WIDTH, character_size)
+        self._health_bar = pygame.Rect(character_size + 10, 0, self.BAR_WIDTH, self.BAR_HEIGHT)
+        self._resource_bar = pygame.Rect(character_size + 10, self.BAR_HEIGHT + self.PADDING, self.BAR_WIDTH, self.BAR_HEIGHT)
+
+        # Zwischen Bild und Balken bleibt die Karte sichtbar
+        background = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        background.fill((150, 150, 150), (0, 0, character_size, character_size))  # Platzhalter für das Bild
+        background.fill((255, 0, 0), self._health_bar)  # Hintergrund (Rot)
+        background.fill((50, 50, 255), self._resource_bar)  # Hintergrund (Dunkelblau)
+        return background
+
+    def _render_state(self, surface, state):
+        health, max_health, resource, max_resource = state
+        for bar, value, maximum, color in (
+            (self._health_bar, health, max_health, (0, 255, 0)),  # Vordergrund (Grün)
+            (self._resource_bar, resource, max_resource, (0, 0, 255)),  # Vordergrund (Hellblau)
+        ):
+            surface.fill(color, (bar.x, bar.y, int(bar.width * value / maximum), bar.height))
+            surface.blit(render_text(f"{value}/{maximum}", 24, (255, 255, 255)), (bar.x + 5, bar.y + 2))
+
+    def draw(self, screen, player):
+        state = (player.current_health, player.max_health, player.current_resource, player.max_resource)
+        return super().draw(screen, state)
+
+
+class SkillbarPanel(Panel):
+    """Transparente Skillbar mit Umrandung, abgerundeten Ecken und Cooldown-Anzeige (unten mittig)."""
+
+    PADDING = 10  # Abstand innerhalb der Skillbar
+    SLOT_SIZE = 50  # Größe der einzelnen Slots
+    SPACING = 10  # Abstand zwischen den Slots
+    BOTTOM_MARGIN = 20  # Abstand vom unteren Bildschirmrand
+
+    def __init__(self):
+        super().__init__()
+        self.skills = None
+        # Halbtransparentes Schwarz über Slots mit aktivem Cooldown (einmal erzeugt, mehrfach geblittet)
+        self._overlay = pygame.Surface((self.SLOT_SIZE, self.SLOT_SIZE), pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 150))
+
+    def _slot_rect(self, index):
+        return pygame.Rect(self.PADDING + index * (self.SLOT_SIZE + self.SPACING), self.PADDING,
+                           self.SLOT_SIZE, self.SLOT_SIZE)
+
+    def _build(self, screen_size):
+        screen_width, screen_height = screen_size
+        skill_count = len(self.skills)
+        total_width = (skill_count * self.SLOT_SIZE) + ((skill_count - 1) * self.SPACING) + (2 * self.PADDING)
+        total_height = self.SLOT_SIZE + (2 * self.PADDING)
+        self.rect = pygame.Rect((screen_width - total_width) // 2, screen_height - total_height - self.BOTTOM_MARGIN,
+                                total_width, total_height)
+
+        background = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(background, (30, 30, 30, 180), (0, 0, total_width, total_height), border_radius=12)
+        pygame.draw.rect(background, (255, 255, 255), (0, 0, total_width, total_height), 3, border_radius=12)
+
+        for i, skill in enumerate(self.skills):
+            slot_rect = self._slot_rect(i)
+            pygame.draw.rect(background, (80, 80, 80), slot_rect, border_radius=8)
+            pygame.draw.rect(background, (255, 255, 255), slot_rect, 2, border_radius=8)
+            if skill["icon"]:
+                background.blit(skill["icon"], slot_rect.topleft)
+        return background
+
+    def _render_state(self, surface, state):
+        for i, cooldown in enumerate(state):
+            slot_rect = self._slot_rect(i)
+            if cooldown is not None:
+                surface.blit(self._overlay, slot_rect.topleft)
+                surface.blit(render_text(str(cooldown), 24, (255, 255, 255)), (slot_rect.x + 15, slot_rect.y + 10))
+
+            # Tastenbelegung (1-5) oben rechts im Slot, über dem Cooldown-Overlay
+            key_text = render_text(str(i + 1), 24, (255, 255, 255))
+            surface.blit(key_text, (slot_rect.right - key_text.get_width() - 3, slot_rect.y + 3))
+
+    def draw(self, screen, skills, cooldowns):
+        if skills is not self.skills:
+            self.skills = skills
+            self.invalidate()
+        # Neu gezeichnet wird nur, wenn sich die angezeigte (ganzzahlige) Restzeit ändert
+        state = tuple(int(cooldown) if cooldown > 0 else None for cooldown in cooldowns)
+        return super().draw(screen, state)
+
+
+class StatsPanel(Panel):
+    """Werte des Charakters, nach Kategorien geordnet (links neben dem Charakterbereich)."""
+
+    def __init__(self, position, size):
+        super().__init__()
+        self.position = position
+        self.size = size
+
+    def _build(self, screen_size):
+        self.rect = pygame.Rect(self.position, self.size)
+        background = pygame.Surface(self.rect.size)
+        background.fill((50, 50, 50))
+        pygame.draw.rect(background, (255, 255, 255), background.get_rect(), 2)
+        return background
+
+    def _render_state(self, surface, state):
+        y = 20
+        line_height = 30
+        for category, category_stats in state:
+            surface.blit(render_text(f"=== {category} ===", 24, (255, 255, 255)), (10, y))
+            y += line_height
+            for stat_name, stat_value in category_stats:
+                surface.blit(render_text(f"{stat_name}: {stat_value}", 24, (255, 255, 255)), (20, y))
+                y += line_height
+
+    @staticmethod
+    def snapshot(stats):
+        """Unveränderlicher Zustandsschlüssel der Stats (Kategorie -> Werte)."""
+        return tuple((category, tuple(values.items())) for category, values in stats.items())
+
+    def draw(self, screen, stats):
+        return super().draw(screen, self.snapshot(stats))
+
+
+class InventoryPanel(Panel):
+    """
+    Inventar- und Charakterfenster mit Ausrüstungs- und Inventarslots sowie optionalen Stats.
+    Das komplette Fensterlayout wird einmal gebacken; pro Zustand kommt nur die
+    Hervorhebung des Slots unter dem Mauszeiger hinzu.
+    """
+
+    WINDOW_WIDTH = 800
+    WINDOW_HEIGHT = 600
+    INVENTORY_SLOTS_PER_ROW = 6
+    UNLOCKED_SLOTS = 24
+    HOVER_COLOR = (255, 215, 0)
+
+    def __init__(self):
+        super().__init__()
+        self.char_slots = {}      # Ausrüstungsslot -> Position (Bildschirmkoordinaten)
+        self.slot_rects = {}      # ("inventory", Nummer) / ("equipment", Name) -> Rect (Bildschirmkoordinaten)
+        self.stats_panel = None
+
+    def slot_at(self, pos):
+        """Liefert den Slot unter der Bildschirmposition `pos` oder None (vor dem ersten draw() immer None)."""
+        if self.rect is None or not self.rect.collidepoint(pos):
+            return None
+        for key, rect in self.slot_rects.items():
+            if rect.collidepoint(pos):
+                return key
+        return None
+
+    def _build(self, screen_size):
+        screen_width, screen_height = screen_size
+        window_x = (screen_width - self.WINDOW_WIDTH) // 2
+        window_y = (screen_height - self.WINDOW_HEIGHT) // 2
+        self.rect = pygame.Rect(window_x, window_y, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+        self.slot_rects = {}
+
+        # Gezeichnet wird in Fensterkoordinaten, gespeichert werden Bildschirmkoordinaten
+        background = pygame.Surface(self.rect.size)
+
+        def box(fill, border, rect, width=2):
+            local = pygame.Rect(rect).move(-window_x, -window_y)
+            pygame.draw.rect(background, fill, local)
+            pygame.draw.rect(background, border, local, width)
+
+        def label(surface, x, y):
+            background.blit(surface, (x - window_x, y - window_y))
+
+        # Fensterhintergrund
+        box((30, 30, 30), (200, 200, 200), self.rect, 4)
+
+        # Charakterbereich
+        char_area_width = (self.WINDOW_WIDTH - 60) // 2
+        char_area_height = self.WINDOW_HEIGHT - 40
+        char_area_x = window_x + 20
+        char_area_y = window_y + 20
+        box((50, 50, 50), (255, 255, 255), (char_area_x, char_area_y, char_area_width, char_area_height))
+
+        # Inventarbereich
+        inv_area_width = (self.WINDOW_WIDTH - 60) // 2
+        inv_area_height = self.WINDOW_HEIGHT - 40
+        inv_area_x = char_area_x + char_area_width + 20
+        inv_area_y = char_area_y
+        box((50, 50, 50), (255, 255, 255), (inv_area_x, inv_area_y, inv_area_width, inv_area_height))
+
+        # Inventar-Titel
+        label(render_text("Inventar", 36, (255, 255, 255)), inv_area_x + 10, inv_area_y + 10)
+
+        # Inventarslots, zentriert
+        slot_size = 50
+        slot_margin = 10
+        total_slot_width = self.INVENTORY_SLOTS_PER_ROW * (slot_size + slot_margin) - slot_margin
+        start_x = inv_area_x + (inv_area_width - total_slot_width) // 2
+        max_rows = (inv_area_height - 70) // (slot_size + slot_margin)
+
+        for row in range(max_rows):
+            for col in range(self.INVENTORY_SLOTS_PER_ROW):
+                slot_index = row * self.INVENTORY_SLOTS_PER_ROW + col + 1
+                slot_x = start_x + col * (slot_size + slot_margin)
+                slot_y = inv_area_y + row * (slot_size + slot_margin) + 50
+
+                if slot_y + slot_size > inv_area_y + inv_area_height - 20:
+                    break
+
+                # Farbe basierend auf Freischaltungsstatus
+                if slot_index <= self.UNLOCKED_SLOTS:
+                    slot_color, border_color, text_color = (70, 70, 70), (255, 255, 255), (255, 255, 255)
+                else:
+                    slot_color, border_color, text_color = (40, 40, 40), (100, 100, 100), (150, 150, 150)
+
+                slot_rect = pygame.Rect(slot_x, slot_y, slot_size, slot_size)
+                box(slot_color, border_color, slot_rect)
+                self.slot_rects[("inventory", slot_index)] = slot_rect
+
+                slot_label = render_text(f"{slot_index}", 14, text_color)
+                label(slot_label, slot_x + (slot_size - slot_label.get_width()) // 2,
+                      slot_y + (slot_size - slot_label.get_height()) // 2)
+
+        # Charakterbild
+        scaling_factor = 1.4
+        model_width = int((char_area_width // 3) * scaling_factor)
+        model_height = int(model_width * 1.5)
+        model_x = char_area_x + (char_area_width - model_width) // 2
+        model_y = char_area_y * 2 - 30
+        box((100, 100, 100), (255, 255, 255), (model_x, model_y, model_width, model_height))
+
+        # Ausrüstungsslots rund um das Modell
+        slot_size = 70
+        slot_margin = 20
+        model_width = char_area_width // 3
+        model_height = int(model_width * 1.5)
+        model_x = char_area_x + (char_area_width - model_width) // 2
+        model_y = char_area_y + (char_area_height - model_height) // 2
+
+        self.char_slots = {
+            "Kopf": (model_x + model_width // 2 + 6 - slot_size - slot_margin, model_y - slot_size - 107),
+            "Hals": (model_x + model_width // 2 - 6 + slot_margin, model_y - slot_size - 107),
+            "Schulter Links": (model_x - slot_size - slot_margin -20 , model_y - slot_size - 28),
+            "Schulter Rechts": (model_x + model_width + slot_margin + 20, model_y - slot_size - 28),
+            "Brust": (model_x + model_width + slot_margin + 20, model_y - 3),
+            "Beine": (model_x - slot_size - slot_margin - 20, model_y - 3),
+            "Ring 1": (model_x - slot_size - slot_margin -20, model_y + slot_size + slot_margin * 1.5 - 10),
+            "Ring 2": (model_x + model_width + slot_margin + 20, model_y + slot_size + slot_margin * 1.5 - 10),
+            "Gürtel": (model_x + model_width // 2 - slot_size * 3 // 2 - slot_margin, model_y + model_height -15),
+            "Hände": (model_x + model_width // 2 - slot_size // 2, model_y + model_height -15),
+            "Füße": (model_x + model_width // 2 + slot_size // 2 + slot_margin, model_y + model_height -15),
+            "Waffe": (model_x + model_width // 2 + 10 - slot_size - slot_margin, model_y + model_height + slot_size - 5),
+            "Nebenhand": (model_x + model_width // 2 - 10 + slot_margin, model_y + model_height + slot_size - 5),
+        }
+
+        for slot_name, (slot_x, slot_y) in self.char_slots.items():
+            slot_rect = pygame.Rect(slot_x, slot_y, slot_size, slot_size)
+            box((70, 70, 70), (255, 255, 255), slot_rect)
+            self.slot_rects[("equipment", slot_name)] = slot_rect
+
+            # Mehrzeilige Beschriftung bei Leerzeichen (und für "Nebenhand")
+            words = ["Neben", "hand"] if slot_name == "Nebenhand" else slot_name.split(" ")
+            for i, word in enumerate(words):
+                slot_label = render_text(word, 14, (255, 255, 255))
+                label_x = slot_x + (slot_size - slot_label.get_width()) // 2
+                if len(words) > 1:
+                    label_y = slot_y + (slot_size // 2 - len(words) * 8) + i * 16
+                else:
+                    label_y = slot_y + (slot_size - slot_label.get_height()) // 2
+                label(slot_label, label_x, label_y)
+
+        # Stats-Button: mittig zwischen "Waffe" und "Nebenhand", zwischen Slots und Unterkante
+        button_width, button_height = 100, 40
+        waffe_x, waffe_y = self.char_slots["Waffe"]
+        nebenhand_x, _ = self.char_slots["Nebenhand"]
+        button_x = waffe_x + (nebenhand_x - waffe_x) // 2 - button_width // 3 + 20
+        container_bottom = char_area_y + char_area_height
+        button_y = waffe_y + slot_size + (container_bottom - (waffe_y + slot_size)) // 2 - button_height // 2
+        box((70, 70, 70), (255, 255, 255), (button_x, button_y, button_width, button_height))
+
+        button_text = render_text("Stats", 24, (255, 255, 255))
+        label(button_text, button_x + (button_width - button_text.get_width()) // 2,
+              button_y + (button_height - button_text.get_height()) // 2)
+
+        # Stats-Bereich links neben dem Charakterbereich, gleiche Höhe
+        stats_area_width = 300
+        self.stats_panel = StatsPanel((char_area_y - stats_area_width - 10, char_area_y),
+                                      (stats_area_width, char_area_height))
+
+        logger.debug("Inventory panel layout built.", extra={"category": "ui"})
+        return background
+
+    def _render_state(self, surface, hovered):
+        if hovered is not None:
+            local = self.slot_rects[hovered].move(-self.rect.x, -self.rect.y)
+            pygame.draw.rect(surface, self.HOVER_COLOR, local, 2)
+
+    def draw(self, screen, stats_visible, stats, hovered=None):
+        """
+        Zeichnet das Fenster (und die Stats, falls sichtbar) mit hervorgehobenem Slot `hovered`
+        (siehe slot_at()). Rückgabe: gezeichneter Bereich.
+        """
+        rect = super().draw(screen, hovered)
+        if stats_visible:
+            rect = rect.union(self.stats_panel.draw(screen, stats))
+        return rect
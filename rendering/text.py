@@ -0,0 +1,69 @@
+import pygame
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger("DungeonGame")
+
+
+class TextCache:
+    """
+    Zwischenspeicher für Schriftarten und gerenderte Texte.
+
+    Schriftarten werden einmal pro Größe geladen. Gerenderte Texte liegen in einem LRU-Cache,
+    Schlüssel ist (Text, Größe, Farbe, Antialiasing); wiederkehrende Beschriftungen (Slot-Nummern,
+    Lebenspunkte, Tastenbelegung) werden so nur beim ersten Auftreten gerendert.
+    Die gelieferten Surfaces werden geteilt und dürfen nicht verändert werden.
+    """
+
+    def __init__(self, max_entries=512, font_name=None):
+        self.max_entries = max_entries
+        self.font_name = font_name
+        self._fonts = {}                 # Größe -> pygame.font.Font
+        self._surfaces = OrderedDict()   # (Text, Größe, Farbe, Antialiasing) -> Surface, in LRU-Reihenfolge
+
+        self.hits = 0
+        self.misses = 0
+        self.font_loads = 0
+
+    def font(self, size):
+        """Liefert die Schriftart in der gewünschten Größe (wird nur beim ersten Mal geladen)."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(self.font_name, size)
+            self.font_loads += 1
+        return font
+
+    def render(self, text, size, color, antialias=True):
+        """Liefert den Text als Surface, aus dem Cache oder neu gerendert."""
+        key = (text, size, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = self.font(size).render(text, antialias, color)
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Verwirft alle gerenderten Texte (die geladenen Schriftarten bleiben erhalten)."""
+        self._surfaces.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._surfaces),
+            "fonts": len(self._fonts),
+            "font_loads": self.font_loads,
+        }
+
+
+# Gemeinsamer Cache für HUD, Inventar und Skillbar
+text_cache = TextCache()
+render_text = text_cache.render
@@ -0,0 +1,42 @@
+import pygame
+
+
+def rgb_tables(colors):
+    """Erzeugt aus einer Farbtabelle (Index = Tile-ID) je eine Übersetzungstabelle für R, G und B."""
+    return (
+        bytes(color[0] for color in colors),
+        bytes(color[1] for color in colors),
+        bytes(color[2] for color in colors),
+    )
+
+
+def tiles_to_rgb(tiles, tables):
+    """
+    Wandelt einen Tile-Puffer (1 Byte pro Tile) in RGB-Pixel (3 Bytes pro Tile) um.
+    Die Farbzuordnung läuft über bytes.translate, das Verschränken über Slice-Zuweisungen,
+    beides ohne Python-Schleife pro Tile.
+    """
+    red, green, blue = tables
+    rgb = bytearray(len(tiles) * 3)
+    rgb[0::3] = tiles.translate(red)
+    rgb[1::3] = tiles.translate(green)
+    rgb[2::3] = tiles.translate(blue)
+    return rgb
+
+
+def tiles_to_surface(tiles, width, height, colors, scale=1):
+    """
+    Erzeugt aus einem Tile-Puffer (width x height, row-major) eine Surface mit einem Pixel
+    pro Tile (optional auf `scale` Pixel pro Tile vergrößert).
+    """
+    rgb = tiles_to_rgb(tiles, rgb_tables(colors))
+    surface = pygame.image.frombuffer(rgb, (width, height), "RGB")
+    if scale != 1:
+        surface = pygame.transform.scale(surface, (width * scale, height * scale))
+    else:
+        surface = surface.copy()  # frombuffer teilt sich den Puffer mit `rgb`
+
+    # An das Pixelformat des Bildschirms anpassen (schnellere Blits), sobald ein Fenster existiert
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
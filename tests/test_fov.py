@@ -0,0 +1,90 @@
+import random
+
+from dungeon.fov import FieldOfView, ExploredMap, _OCTANTS
+from dungeon.tile import TileType, OPAQUE
+from dungeon.tilemap import TileMap
+
+
+def reference_fov(tilemap, cx, cy, radius):
+    """Klassisches rekursives Shadowcasting (ein Tile nach dem anderen, ohne Optimierungen)."""
+    visible = {(cx, cy)}
+
+    def blocks(x, y):
+        return not tilemap.in_bounds(x, y) or OPAQUE[tilemap.get(x, y)] == 1
+
+    def cast(row, start, end, xx, xy, yx, yy):
+        if start < end:
+            return
+        new_start = start
+        for distance in range(row, radius + 1):
+            dy = -distance
+            blocked = False
+            for dx in range(-distance, 1):
+                x, y = cx + dx * xx + dy * xy, cy + dx * yx + dy * yy
+                left, right = (dx - 0.5) / (dy + 0.5), (dx + 0.5) / (dy - 0.5)
+                if start < right:
+                    continue
+                if end > left:
+                    break
+                if dx * dx + dy * dy <= radius * radius and tilemap.in_bounds(x, y):
+                    visible.add((x, y))
+                if blocked:
+                    if blocks(x, y):
+                        new_start = right
+                        continue
+                    blocked = False
+                    start = new_start
+                elif blocks(x, y) and distance < radius:
+                    blocked = True
+                    cast(distance + 1, start, left, xx, xy, yx, yy)
+                    new_start = right
+            if blocked:
+                break
+
+    for octant in _OCTANTS:
+        cast(1, 1.0, 0.0, *octant)
+    return visible
+
+
+def random_map(rng, width, height, density):
+    tilemap = TileMap(width, height)
+    for _ in range(int(width * height * density)):
+        tilemap.set(rng.randrange(width), rng.randrange(height), TileType.WALL)
+    return tilemap
+
+
+def test_matches_reference_on_random_maps():
+    rng = random.Random(1234)
+    for _ in range(300):
+        width, height = rng.randint(10, 50), rng.randint(10, 50)
+        tilemap = random_map(rng, width, height, rng.uniform(0.05, 0.4))
+        radius = rng.randint(3, 20)
+        x, y = rng.randrange(width), rng.randrange(height)
+
+        fov = FieldOfView(tilemap, radius=radius)
+        fov.update(x, y)
+        seen = {(tx, ty) for ty in range(height) for tx in range(width) if fov.is_visible(tx, ty)}
+        assert seen == reference_fov(tilemap, x, y, radius), (width, height, radius, x, y)
+
+
+def test_no_view_past_diagonal_wall_corner():
+    # Wände rechts und oberhalb schließen die Diagonale ab: dahinter darf nichts sichtbar sein
+    tilemap = TileMap(9, 9)
+    for i in range(9):
+        tilemap.set(i, 2, TileType.WALL)
+        tilemap.set(6, i, TileType.WALL)
+    fov = FieldOfView(tilemap, radius=8)
+    fov.update(4, 4)
+    assert not any(fov.is_visible(x, y) for y in range(2) for x in range(9))
+    assert not any(fov.is_visible(x, y) for y in range(9) for x in range(7, 9))
+
+
+def test_explored_follows_visibility():
+    rng = random.Random(7)
+    tilemap = random_map(rng, 40, 30, 0.2)
+    explored = ExploredMap(40, 30)
+    fov = FieldOfView(tilemap, explored, radius=10)
+    fov.update(20, 15)
+    for y in range(30):
+        for x in range(40):
+            assert explored.is_explored(x, y) == fov.is_visible(x, y)
@@ -11,10 +11,32 @@ DUNGEON_PARAMS = {
     "max_rooms": 20,
     "room_size_range": (8, 14),
     "seed": None,  # None für zufällige Ergebnisse
+    "extra_loops": 0.0,  # Anteil zusätzlicher Korridore (Schleifen) neben dem MST, 0.0 = reiner Baum
 }
 
 MINIMAP_SIZE = (200, 200)
 
+# Weltmodus: "levels" = Ebenen fester Größe mit Treppen, "chunked" = endlose, chunkweise generierte Welt
+WORLD_MODE = "levels"
+
+CHUNKED_WORLD_PARAMS = {
+    "chunk_size": 64,
+    "rooms_per_chunk": (2, 4),
+    "room_size_range": (6, 12),
+    "view_radius": 1,  # Chunks um den Spieler, die sofort verfügbar sein müssen
+    "keep_radius": 3,  # Weiter entfernte Chunks werden verworfen
+}
+
+# Ausschnitt der Chunk-Welt (in Tiles), der auf der Minimap angezeigt wird
+MINIMAP_WORLD_TILES = 96
+
+# Ebenen-Cache: Anzahl der Ebenen im Speicher, ältere werden komprimiert ausgelagert
+LEVEL_CACHE_SIZE = 8
+LEVEL_CACHE_DIR = None  # None für ein temporäres Verzeichnis
+
+# Spielstand-Datei für "Spiel speichern" / "Spiel laden"
+SAVE_PATH = "savegame.dcsv"
+
 # Farben als Konstanten
 COLORS = {
     "FLOOR_COLOR": (30, 60, 30),
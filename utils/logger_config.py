@@ -1,4 +1,8 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 
 # Logger erstellen
 logger = logging.getLogger("DungeonGame")
@@ -8,6 +12,20 @@ logger.setLevel(logging.DEBUG)  # Setze das allgemeine Log-Level auf DEBUG
 ENABLE_ALL_DEBUG = False
 ENABLED_CATEGORIES = {"summary", "ui", "movement"}  # Kategorien "summary" und "ui" bleiben aktiv
 
+# Asynchrone Ausgabe: Meldungen landen in einer begrenzten Queue, ein Hintergrund-Thread
+# formatiert und schreibt sie. Bei voller Queue: "drop" verwirft, "block" wartet.
+LOG_QUEUE_SIZE = 10000
+LOG_QUEUE_POLICY = "drop"
+
+# Optionale Log-Datei (rotierend); None = keine Datei
+LOG_FILE = None
+LOG_FILE_LEVEL = logging.INFO
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
+
+# Handler, die vom Hintergrund-Thread bedient werden
+sinks = []
+
 # Format für Logs
 formatter = logging.Formatter("%(asctime)s [%(levelname)s] [%(category)s] %(message)s")
 
@@ -22,7 +40,7 @@ class SummaryFilter(logging.Filter):
         return getattr(record, "category", None) == "summary"
 
 summary_handler.addFilter(SummaryFilter())
-logger.addHandler(summary_handler)
+sinks.append(summary_handler)
 
 # UI-Handler: Aktiv für Nachrichten der Kategorie "ui"
 ui_handler = logging.StreamHandler()
@@ -35,7 +53,7 @@ class UiFilter(logging.Filter):
         return getattr(record, "category", None) == "ui"
 
 ui_handler.addFilter(UiFilter())
-logger.addHandler(ui_handler)
+sinks.append(ui_handler)
 
 # Debug-Handler: Zeigt alle Debug-Nachrichten an
 debug_handler = logging.StreamHandler()
@@ -46,7 +64,7 @@ debug_handler.setFormatter(debug_formatter)
 # Filter für Debugging: Zeige alles an, wenn ENABLE_ALL_DEBUG True ist
 if ENABLE_ALL_DEBUG:
     logger.setLevel(logging.DEBUG)
-    logger.addHandler(debug_handler)
+    sinks.append(debug_handler)
 
 # Kategorie-Filter: Allgemeiner Filter für andere Kategorien
 class CategoryFilter(logging.Filter):
@@ -66,3 +84,183 @@ class CategoryFilter(logging.Filter):
 # Kategorie-Filter für den Logger hinzufügen, falls aktiviert
 if not ENABLE_ALL_DEBUG:
     logger.addFilter(CategoryFilter(ENABLED_CATEGORIES))
+
+# Datei-Handler: rotierende Log-Datei mit allen Kategorien, die den Logger passieren
+if LOG_FILE:
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT, encoding="utf-8"
+    )
+    file_handler.setLevel(LOG_FILE_LEVEL)
+    file_handler.setFormatter(formatter)
+    sinks.append(file_handler)
+
+
+class GameQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler mit begrenzter Queue.
+
+    Anders als der Standard-QueueHandler formatiert prepare() die Meldung nicht im
+    aufrufenden Thread: Nachricht und Argumente werden erst im Hintergrund-Thread von
+    den eigentlichen Handlern zusammengesetzt. Die Argumente sollten daher nach dem
+    Loggen nicht mehr verändert werden (im Spiel sind es Zahlen, Tupel und Räume).
+    """
+
+    def __init__(self, log_queue, policy="drop"):
+        super().__init__(log_queue)
+        if policy not in ("drop", "block"):
+            raise ValueError(f"Unknown log queue policy: {policy}")
+        self.policy = policy
+        self.listener = None
+        self.dropped = 0
+
+    @property
+    def sinks(self):
+        """Handler hinter der Queue (werden von CategoryLogger für seine Guards ausgewertet)."""
+        return self.listener.handlers if self.listener is not None else ()
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _start_listener():
+    """Startet einen neuen Hintergrund-Thread für die aktuelle Queue des QueueHandlers."""
+    global _listener_running
+    queue_handler.listener = logging.handlers.QueueListener(queue_handler.queue, *sinks, respect_handler_level=True)
+    queue_handler.listener.start()
+    _listener_running = True
+
+
+_listener_running = False  # True, solange der Hintergrund-Thread die Queue abarbeitet
+queue_handler = GameQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE), LOG_QUEUE_POLICY)
+logger.addHandler(queue_handler)
+_start_listener()
+
+
+def shutdown_logging():
+    """
+    Schreibt alle noch wartenden Meldungen und beendet den Hintergrund-Thread.
+    Danach hängen die eigentlichen Handler direkt am Logger: spätere Meldungen (andere
+    atexit-Hooks, Aufräumen nach main()) werden synchron geschrieben statt in der Queue zu verschwinden.
+    Wird beim Beenden von main() und zusätzlich per atexit aufgerufen; mehrfacher Aufruf ist unschädlich.
+    """
+    global _listener_running
+    if not _listener_running:
+        return
+    _listener_running = False
+    listener = queue_handler.listener
+    listener.stop()
+    logger.removeHandler(queue_handler)
+    for handler in listener.handlers:
+        handler.flush()
+        logger.addHandler(handler)
+    category_logger.refresh()
+    if queue_handler.dropped:
+        logging.getLogger(__name__).warning("%d log records were dropped (queue full).", queue_handler.dropped)
+
+
+def _restart_listener_in_child():
+    """
+    Nach fork() (z. B. Worker-Prozesse der Batch-Generierung) läuft der Hintergrund-Thread
+    im Kind nicht mehr. Queue und Listener werden neu angelegt (der geerbte Listener verweist
+    auf den Thread des Elternprozesses, das Lock der Queue kann beim Fork belegt gewesen sein).
+    Nach shutdown_logging() schreiben die Handler direkt, dann gibt es nichts neu zu starten.
+    """
+    if not _listener_running:
+        return
+    queue_handler.queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler.dropped = 0
+    _start_listener()
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+
+class CategoryLogger:
+    """
+    Kategorie-Fassade vor dem "DungeonGame"-Logger.
+
+    Ob eine Kategorie auf einem Level überhaupt ausgegeben würde (Logger-Level,
+    Kategorie-Filter, Level und Filter der Handler), wird einmal pro (Kategorie, Level)
+    ausgewertet und zwischengespeichert. Abgeschaltete Meldungen kosten danach nur noch
+    eine Level-Abfrage und einen Dictionary-Zugriff: weder LogRecord noch Formatierung der
+    Argumente entstehen.
+
+    Eine Änderung des Logger-Levels (setLevel(), z. B. in Worker-Prozessen) wird bei jeder
+    Abfrage erkannt und verwirft den Cache. Nach Änderungen an Kategorien oder Handlern muss
+    refresh() aufgerufen werden (set_enabled_categories() erledigt das selbst).
+    """
+
+    def __init__(self, logger):
+        self._logger = logger
+        self._cache = {}
+        self._level = logger.getEffectiveLevel()  # Level, für das der Cache gilt
+
+    def refresh(self):
+        """Verwirft die zwischengespeicherten Entscheidungen (z. B. nach Änderung der Handler)."""
+        self._cache.clear()
+
+    def enabled(self, category, level=logging.DEBUG):
+        """Günstiger Guard: True, wenn eine Meldung dieser Kategorie und Stufe ausgegeben würde."""
+        level_now = self._logger.getEffectiveLevel()
+        if level_now != self._level:
+            self._cache.clear()
+            self._level = level_now
+        try:
+            return self._cache[(category, level)]
+        except KeyError:
+            result = self._cache[(category, level)] = self._evaluate(category, level)
+            return result
+
+    def _evaluate(self, category, level):
+        if not self._logger.isEnabledFor(level):
+            return False
+
+        # Probe-Record einmalig durch die Filter von Logger und Handlern schicken
+        record = self._logger.makeRecord(self._logger.name, level, __file__, 0, "", (), None,
+                                         extra={"category": category})
+        if not self._logger.filter(record):
+            return False
+        return any(self._accepts(handler, record, level) for handler in self._handlers())
+
+    def _accepts(self, handler, record, level):
+        if level < handler.level or not handler.filter(record):
+            return False
+        # QueueHandler: entscheidend sind die Handler hinter der Queue
+        sinks = getattr(handler, "sinks", None)
+        if sinks is None:
+            return True
+        return any(self._accepts(sink, record, level) for sink in sinks)
+
+    def _handlers(self):
+        """Alle Handler, die eine Meldung des Loggers erreichen würde (inkl. Eltern-Logger)."""
+        handlers = []
+        current = self._logger
+        while current is not None:
+            handlers.extend(current.handlers)
+            current = current.parent if current.propagate else None
+        return handlers
+
+
+category_logger = CategoryLogger(logger)
+log_enabled = category_logger.enabled
+
+
+def set_enabled_categories(categories):
+    """
+    Ändert die aktiven Kategorien zur Laufzeit. Die Menge ENABLED_CATEGORIES wird an Ort
+    und Stelle ersetzt, damit der CategoryFilter sie weiter sieht, und die Fassade neu bewertet.
+    """
+    ENABLED_CATEGORIES.clear()
+    ENABLED_CATEGORIES.update(categories)
+    category_logger.refresh()
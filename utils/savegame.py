@@ -0,0 +1,188 @@
+"""
+Binäres Spielstand-Format.
+
+Aufbau einer Datei:
+    MAGIC (4 Bytes) | Version (u16) | Header-Länge (u32) | Header (JSON, UTF-8) | Tile-Blöcke
+
+Der Header enthält Spielerwerte, Ebenen-Index, Lauf-Seed und pro Ebene Räume, Verbindungsgraph, Treppen
+sowie Offset/Länge ihres Tile-Blocks und ihres Erkundungs-Bitfelds (Fog of War). Die Blöcke liegen als
+rohe Bytes (Tiles optional RLE) hintereinander und werden beim Laden per mmap gelesen, ohne einzelne
+Tiles zu parsen.
+Ebenen werden erst bei Bedarf (load_level) in Dungeon-Zustände umgewandelt.
+"""
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+from dungeon.fov import ExploredMap
+from dungeon.room import Room
+from dungeon.room_graph import RoomGraph
+from dungeon.tilemap import TileMap
+
+logger = logging.getLogger("DungeonGame")
+
+MAGIC = b"DCSV"
+VERSION = 1
+PREAMBLE = struct.Struct("<4sHI")
+
+ENCODING_RAW = "raw"
+ENCODING_RLE = "rle"
+
+
+# Findet Läufe gleicher Bytes (die Suche läuft in C statt in einer Python-Schleife pro Tile)
+_RUNS = re.compile(rb"(.)\1*", re.DOTALL)
+
+
+def rle_encode(data):
+    """Lauflängenkodierung als Folge von (Anzahl, Wert)-Bytepaaren, Läufe max. 255 lang."""
+    out = bytearray()
+    for match in _RUNS.finditer(data):
+        value = data[match.start()]
+        length = match.end() - match.start()
+        while length > 255:
+            out += bytes((255, value))
+            length -= 255
+        out += bytes((length, value))
+    return bytes(out)
+
+
+def rle_decode(data):
+    """Dekodiert eine Lauflängenkodierung aus rle_encode()."""
+    return bytearray(b"".join(bytes((data[i + 1],)) * data[i] for i in range(0, len(data), 2)))
+
+
+def _room_to_list(room):
+    return [room.x, room.y, room.width, room.height] if room is not None else None
+
+
+def _position(value):
+    return tuple(value) if value is not None else None
+
+
+def save_game(path, levels, current_level_index, player_state, run_seed, encoding=ENCODING_RAW):
+    """
+    Schreibt einen Spielstand.
+
+    levels: Folge von Dungeon-Zuständen (save_state()) in Ebenen-Reihenfolge.
+    player_state: Spielerwerte (Player.save_state()).
+    """
+    level_headers = []
+    blobs = []
+    offset = 0
+    for state in levels:
+        tilemap = state["dungeon"]
+        blob = bytes(tilemap.tiles) if encoding == ENCODING_RAW else rle_encode(tilemap.tiles)
+        explored = state["explored"].to_bytes() if state.get("explored") is not None else None
+        level_headers.append({
+            "width": tilemap.width,
+            "height": tilemap.height,
+            "rooms": [_room_to_list(room) for room in state["rooms"]],
+            "staircase_up": state["staircase_up"],
+            "staircase_down": state["staircase_down"],
+            "start_room": _room_to_list(state["start_room"]),
+            "room_graph": state["room_graph"].adjacency if state.get("room_graph") is not None else None,
+            "key": state.get("key"),
+            "tiles": {"offset": offset, "length": len(blob), "encoding": encoding},
+            "explored": {"offset": offset + len(blob), "length": len(explored)} if explored is not None else None,
+        })
+        blobs.append(blob)
+        offset += len(blob)
+        if explored is not None:
+            blobs.append(explored)
+            offset += len(explored)
+
+    header = json.dumps({
+        "run_seed": run_seed,
+        "current_level_index": current_level_index,
+        "player": player_state,
+        "levels": level_headers,
+    }, separators=(",", ":")).encode("utf-8")
+
+    # Erst in eine temporäre Datei schreiben und dann ersetzen: ein noch per mmap
+    # geöffneter alter Spielstand bleibt so gültig, und abgebrochene Schreibvorgänge
+    # hinterlassen keine halbe Datei.
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        fh.write(header)
+        for blob in blobs:
+            fh.write(blob)
+    os.replace(tmp_path, path)
+
+    logger.info("Game saved to %s (%d levels).", path, len(level_headers), extra={"category": "summary"})
+
+
+class SaveGame:
+    """
+    Geöffneter Spielstand. Die Datei bleibt per mmap eingeblendet; Ebenen werden
+    erst beim Aufruf von load_level() aus ihrem Tile-Block erzeugt.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, header_length = PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a save game file.")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported save game version {version}.")
+
+        header_end = PREAMBLE.size + header_length
+        header = json.loads(self._mmap[PREAMBLE.size:header_end])
+        self._data_start = header_end
+
+        self.run_seed = header["run_seed"]
+        self.current_level_index = header["current_level_index"]
+        self.player = header["player"]
+        self._levels = header["levels"]
+
+    @property
+    def level_count(self):
+        return len(self._levels)
+
+    def load_level(self, index):
+        """Erzeugt den Dungeon-Zustand (wie save_state()) der Ebene `index`."""
+        level = self._levels[index]
+        start = self._data_start + level["tiles"]["offset"]
+        blob = self._mmap[start:start + level["tiles"]["length"]]
+        tiles = bytearray(blob) if level["tiles"]["encoding"] == ENCODING_RAW else rle_decode(blob)
+
+        explored = None
+        if level.get("explored"):
+            start = self._data_start + level["explored"]["offset"]
+            bits = self._mmap[start:start + level["explored"]["length"]]
+            explored = ExploredMap(level["width"], level["height"], bits)
+
+        key = level["key"]
+        if key is not None:
+            key = dict(key, entry=_position(key["entry"]))
+
+        return {
+            "dungeon": TileMap(level["width"], level["height"], tiles=tiles),
+            "rooms": [Room(*room) for room in level["rooms"]],
+            "staircase_up": _position(level["staircase_up"]),
+            "staircase_down": _position(level["staircase_down"]),
+            "start_room": Room(*level["start_room"]) if level["start_room"] else None,
+            "room_graph": RoomGraph.from_adjacency(level["room_graph"]) if level.get("room_graph") else None,
+            "explored": explored,
+            "key": key,
+        }
+
+    def close(self):
+        """Gibt die eingeblendete Datei frei."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def load_game(path):
+    """Öffnet einen Spielstand (siehe SaveGame)."""
+    save = SaveGame(path)
+    logger.info("Game loaded from %s (%d levels).", path, save.level_count, extra={"category": "summary"})
+    return save